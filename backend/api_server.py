@@ -6,71 +6,241 @@
 from dotenv import load_dotenv
 import os
 import asyncio
+import hashlib
+import logging
+import queue
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 
 load_dotenv()
 from typing import Dict, List, Optional, Any
-from fastapi import FastAPI, HTTPException, UploadFile, File, BackgroundTasks
+from fastapi import FastAPI, HTTPException, UploadFile, File, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
-from pydantic import BaseModel, Field
-import pandas as pd
-import json
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+import csv
+import orjson
 from pathlib import Path
 import requests
+import httpx
+import msgspec
+import openai
+import redis.asyncio as redis
+import aiofiles
 
 # 로컬 모듈 import
 from book_analyzer import BookAnalyzer, BookInfo, EducationLevel, EducationArea
 from topic_generator import TopicGenerator
 from docx_generator import DOCXGenerator, DocumentSettings
 
-# FastAPI 앱 초기화
-app = FastAPI(
-    title="Pascal Debate Textbook System",
-    description="AI-powered system for generating debate topics and textbooks from English books",
-    version="1.0.0"
-)
-
-# CORS 설정
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # 프로덕션에서는 특정 도메인으로 제한
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 # 전역 변수
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 UPLOAD_FOLDER = Path("./uploads")
 OUTPUT_FOLDER = Path("./outputs")
 
-# 폴더 생성
-UPLOAD_FOLDER.mkdir(exist_ok=True)
-OUTPUT_FOLDER.mkdir(exist_ok=True)
+UPLOAD_CHUNK_SIZE = 1 << 16  # 64KB, 업로드 스트리밍 단위
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_FILE_SIZE", 50 * 1024 * 1024))
+DOWNLOAD_HEADERS = {"Cache-Control": "public, max-age=3600"}  # 작업별 결과 파일은 변경되지 않음
+# 설정 시 nginx 등 앞단 서버가 X-Accel-Redirect로 결과 파일을 직접 전송 (예: /internal/)
+X_ACCEL_LOCATION = os.getenv("X_ACCEL_LOCATION")
+# uvicorn 워커 수 (uvicorn CLI도 같은 환경 변수를 읽음)
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+# 워커마다 DOCX 프로세스 풀을 따로 만들므로 기본값은 CPU 코어를 워커 수로 나눈 값
+DOCX_WORKERS = int(os.getenv("PASCAL_DOCX_WORKERS", max(1, (os.cpu_count() or 1) // WEB_CONCURRENCY)))
 
-# 분석 작업 상태 저장
-analysis_tasks: Dict[str, Dict[str, Any]] = {}
-generation_tasks: Dict[str, Dict[str, Any]] = {}
+# 폴더 생성
+UPLOAD_FOLDER.mkdir(parents=True, exist_ok=True)
+OUTPUT_FOLDER.mkdir(parents=True, exist_ok=True)
+
+# 작업 상태 저장소 (Redis)
+# 작업별 해시 task:{kind}:{task_id}, 활성 작업 ID 집합 tasks:{kind}
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+TASK_TTL_SECONDS = 86400  # 24시간
+CLEANUP_SCAN_COUNT = 500  # 정리 시 SSCAN 한 번에 확인할 ID 수
+SSE_KEEPALIVE_SECONDS = 15  # 진행 이벤트가 없을 때 연결 유지용 주석 전송 간격
+ANALYSIS = "analysis"
+GENERATION = "generation"
 
 # 서비스 인스턴스
 book_analyzer = None
 topic_generator = None
-
-@app.on_event("startup")
-async def startup_event():
-    """서버 시작 시 초기화"""
-    global book_analyzer, topic_generator
+redis_client: Optional[redis.Redis] = None
+http_client: Optional[httpx.AsyncClient] = None  # OpenAI 호출용 공유 커넥션 풀
+process_pool: Optional[ProcessPoolExecutor] = None  # CPU 집약적인 DOCX 생성용
+
+def _start_log_listener() -> QueueListener:
+    """루트 로거 출력을 큐로 넘겨 실제 I/O는 백그라운드 스레드에서 처리"""
+    root_logger = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+    root_logger.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+def _stop_log_listener(listener: QueueListener):
+    """큐 리스너 종료 후 원래 핸들러 복원"""
+    listener.stop()
+    logging.getLogger().handlers = list(listener.handlers)
+
+def _init_pool_worker():
+    """프로세스 풀 워커 초기화: 부모의 로그 큐는 공유되지 않으므로 stderr로 직접 출력"""
+    logging.basicConfig(level=logging.INFO, force=True)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작 시 초기화, 종료 시 정리"""
+    global book_analyzer, topic_generator, redis_client, http_client, process_pool
     
     if not OPENAI_API_KEY:
         raise RuntimeError("OPENAI_API_KEY environment variable not set")
     
-    book_analyzer = BookAnalyzer(OPENAI_API_KEY)
-    topic_generator = TopicGenerator(OPENAI_API_KEY)
+    log_listener = _start_log_listener()
+    
+    # SDK 기본 타임아웃을 유지하면서 HTTP/2 커넥션 풀을 두 서비스가 공유
+    http_client = openai.DefaultAsyncHttpxClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=50, max_connections=100)
+    )
+    book_analyzer = BookAnalyzer(OPENAI_API_KEY, http_client=http_client)
+    topic_generator = TopicGenerator(OPENAI_API_KEY, http_client=http_client)
+    redis_client = redis.from_url(REDIS_URL, decode_responses=True)
+    process_pool = ProcessPoolExecutor(max_workers=DOCX_WORKERS, initializer=_init_pool_worker)
+    
+    yield
+    
+    process_pool.shutdown(wait=False, cancel_futures=True)
+    await http_client.aclose()
+    await redis_client.aclose()
+    _stop_log_listener(log_listener)
+
+# FastAPI 앱 초기화
+app = FastAPI(
+    title="Pascal Debate Textbook System",
+    description="AI-powered system for generating debate topics and textbooks from English books",
+    version="1.0.0",
+    lifespan=lifespan
+)
+
+# 요청 크기 제한 (CORS 미들웨어 안쪽에서 동작하도록 먼저 등록)
+@app.middleware("http")
+async def limit_request_size(request: Request, call_next):
+    """Content-Length가 업로드 한도를 넘으면 본문을 읽기 전에 거절"""
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_UPLOAD_BYTES:
+        return JSONResponse(status_code=413, content={"detail": "Request body too large"})
+    return await call_next(request)
+
+# CORS 설정 (허용 도메인은 CORS_ORIGINS 환경 변수에 쉼표로 구분)
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:5173").split(",")
+    if origin.strip()
+]
 
-# Pydantic 모델 정의
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=CORS_ORIGINS,
+    allow_credentials=True,
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Content-Type", "Authorization"],
+)
+
+# 작업 상태 모델 (Redis 해시의 타입 지정 뷰)
+class TaskState(msgspec.Struct, omit_defaults=True):
+    status: str  # "pending", "processing", "completed", "failed"
+    progress: float  # 0.0 to 1.0
+    message: str
+    created_at: float  # Unix timestamp
+    csv_path: Optional[str] = None
+    output_path: Optional[str] = None
+    output_ready: bool = False
+    result_path: Optional[str] = None  # 분석 결과 JSON 파일 (Redis에는 경로만 보관)
+    book_info: Optional[Dict[str, Any]] = None
+    settings: Optional[Dict[str, Any]] = None
+
+# 작업 상태 헬퍼
+
+def _task_key(kind: str, task_id: str) -> str:
+    return f"task:{kind}:{task_id}"
+
+def _encode_fields(fields: Dict[str, Any]) -> Dict[str, bytes]:
+    """해시 필드 값을 JSON으로 인코딩"""
+    return {key: orjson.dumps(value, default=str) for key, value in fields.items()}
+
+async def _create_task(kind: str, task_id: str, state: TaskState):
+    """작업 해시 생성 (24시간 TTL) 및 활성 작업 집합에 등록"""
+    key = _task_key(kind, task_id)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.hset(key, mapping=_encode_fields(msgspec.to_builtins(state)))
+        pipe.expire(key, TASK_TTL_SECONDS)
+        pipe.sadd(f"tasks:{kind}", task_id)
+        await pipe.execute()
+
+def _progress_channel(task_id: str) -> str:
+    return f"progress:{task_id}"
+
+async def _update_task(kind: str, task_id: str, fields: Dict[str, Any]):
+    """작업 상태 필드 갱신 (단일 HSET) 및 SSE 구독자에게 알림"""
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.hset(_task_key(kind, task_id), mapping=_encode_fields(fields))
+        pipe.publish(_progress_channel(task_id), fields.get("status", ""))
+        await pipe.execute()
+
+def _ready_file_stat(task: TaskState, path: Optional[str]) -> Optional[os.stat_result]:
+    """완료 시 기록된 output_ready 플래그로 결과 파일 확인, 없으면 None
+    
+    파일이 정리되었을 수 있으므로 stat은 매번 새로 하고, 그 결과를 FileResponse에 넘겨 재사용
+    """
+    if not task.output_ready or not path:
+        return None
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+def _book_cache_key(book_info: 'BookInfoRequest') -> str:
+    """도서 정보 요청의 정규화된 해시 (중복 분석 감지용)"""
+    canonical = orjson.dumps(book_info.model_dump(mode="json"), option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+def _download_response(path: str, stat_result: os.stat_result, media_type: str, filename: str) -> Response:
+    """결과 파일 다운로드 응답 생성"""
+    if X_ACCEL_LOCATION:
+        # 파일 본문 전송은 앞단 서버에 맡기고 헤더만 반환
+        return Response(
+            media_type=media_type,
+            headers={
+                "X-Accel-Redirect": f"{X_ACCEL_LOCATION.rstrip('/')}/{Path(path).name}",
+                "Content-Disposition": f'attachment; filename="{filename}"',
+                **DOWNLOAD_HEADERS
+            }
+        )
+    
+    return FileResponse(
+        path,
+        media_type=media_type,
+        filename=filename,
+        stat_result=stat_result,
+        headers=DOWNLOAD_HEADERS
+    )
+
+async def _get_task(kind: str, task_id: str) -> Optional[TaskState]:
+    """작업 상태 조회, 없거나 만료된 경우 None"""
+    raw = await redis_client.hgetall(_task_key(kind, task_id))
+    if not raw:
+        return None
+    return msgspec.convert({key: orjson.loads(value) for key, value in raw.items()}, TaskState)
+
+# Pydantic 모델 정의 (v2, 불변 모델로 assignment 검증 생략)
 class BookInfoRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     title: str = Field(..., description="Book title")
     author: str = Field(..., description="Book author")
     ar_level: float = Field(..., ge=1.0, le=10.0, description="AR reading level")
@@ -81,6 +251,8 @@ class BookInfoRequest(BaseModel):
     summary: Optional[str] = Field(None, description="Book summary")
 
 class DocumentSettingsRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     title: str = Field(..., description="Document title")
     subtitle: str = Field(..., description="Document subtitle")
     author: str = Field(..., description="Document author")
@@ -88,6 +260,8 @@ class DocumentSettingsRequest(BaseModel):
     level: str = Field(..., description="Education level (preparation/regular/mastery)")
 
 class AnalysisStatusResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     task_id: str
     status: str  # "pending", "processing", "completed", "failed"
     progress: float  # 0.0 to 1.0
@@ -95,6 +269,8 @@ class AnalysisStatusResponse(BaseModel):
     result: Optional[Dict[str, Any]] = None
 
 class GenerationStatusResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     task_id: str
     status: str
     progress: float
@@ -130,19 +306,30 @@ async def analyze_book(
     background_tasks: BackgroundTasks
 ):
     """원서 분석 시작"""
-    task_id = str(uuid.uuid4())
+    # 같은 도서 정보로 완료된 분석이 남아 있으면 재사용
+    book_key = _book_cache_key(book_info)
+    prior_task_id = await redis_client.get(f"book:{book_key}")
+    if prior_task_id and await redis_client.exists(_task_key(ANALYSIS, prior_task_id)):
+        return {
+            "task_id": prior_task_id,
+            "message": "Book analysis already completed",
+            "estimated_time": "0 minutes",
+            "cached": True
+        }
+    
+    task_id = uuid.uuid4().hex
     
     # 작업 상태 초기화
-    analysis_tasks[task_id] = {
-        "status": "pending",
-        "progress": 0.0,
-        "message": "Analysis task created",
-        "created_at": datetime.now(),
-        "book_info": book_info.dict()
-    }
+    await _create_task(ANALYSIS, task_id, TaskState(
+        status="pending",
+        progress=0.0,
+        message="Analysis task created",
+        created_at=datetime.now().timestamp(),
+        book_info=book_info.model_dump(mode="json")
+    ))
     
     # 백그라운드에서 분석 실행
-    background_tasks.add_task(run_book_analysis, task_id, book_info)
+    background_tasks.add_task(run_book_analysis, task_id, book_info, book_key)
     
     return {
         "task_id": task_id,
@@ -153,46 +340,57 @@ async def analyze_book(
 @app.get("/api/v1/books/analyze/{task_id}/status")
 async def get_analysis_status(task_id: str) -> AnalysisStatusResponse:
     """분석 상태 조회"""
-    if task_id not in analysis_tasks:
+    task = await _get_task(ANALYSIS, task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    task = analysis_tasks[task_id]
-    return AnalysisStatusResponse(
-        task_id=task_id,
-        status=task["status"],
-        progress=task["progress"],
-        message=task["message"],
-        result=task.get("result")
+    return await _analysis_status(task_id, task)
+
+@app.get("/api/v1/books/analyze/{task_id}/events")
+async def stream_analysis_events(task_id: str):
+    """분석 진행 상황 SSE 스트림 (폴링 대체)"""
+    if await _get_task(ANALYSIS, task_id) is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    
+    return StreamingResponse(
+        _task_events(ANALYSIS, task_id, _analysis_status),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
 
 @app.get("/api/v1/books/analyze/{task_id}/result")
 async def get_analysis_result(task_id: str):
     """분석 결과 조회"""
-    if task_id not in analysis_tasks:
+    task = await _get_task(ANALYSIS, task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    task = analysis_tasks[task_id]
-    if task["status"] != "completed":
+    if task.status != "completed":
         raise HTTPException(status_code=400, detail="Analysis not completed yet")
     
-    return task["result"]
+    stat_result = _ready_file_stat(task, task.result_path)
+    if stat_result is None:
+        raise HTTPException(status_code=404, detail="Analysis result not found")
+    
+    return FileResponse(task.result_path, media_type="application/json", stat_result=stat_result)
 
 @app.get("/api/v1/books/analyze/{task_id}/csv")
 async def download_analysis_csv(task_id: str):
     """분석 결과 CSV 다운로드"""
-    if task_id not in analysis_tasks:
+    task = await _get_task(ANALYSIS, task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    task = analysis_tasks[task_id]
-    if task["status"] != "completed":
+    if task.status != "completed":
         raise HTTPException(status_code=400, detail="Analysis not completed yet")
     
-    csv_path = task.get("csv_path")
-    if not csv_path or not os.path.exists(csv_path):
+    stat_result = _ready_file_stat(task, task.csv_path)
+    if stat_result is None:
         raise HTTPException(status_code=404, detail="CSV file not found")
     
-    return FileResponse(
-        csv_path,
+    return _download_response(
+        task.csv_path,
+        stat_result,
         media_type="text/csv",
         filename=f"analysis_{task_id}.csv"
     )
@@ -204,12 +402,12 @@ async def generate_document(
     settings: str = None  # JSON string
 ):
     """DOCX 문서 생성"""
-    task_id = str(uuid.uuid4())
+    task_id = uuid.uuid4().hex
     
     try:
         # 설정 파싱
         if settings:
-            settings_dict = json.loads(settings)
+            settings_dict = orjson.loads(settings)
             doc_settings = DocumentSettingsRequest(**settings_dict)
         else:
             # 기본 설정
@@ -221,24 +419,32 @@ async def generate_document(
                 level="regular"
             )
         
-        # CSV 파일 저장
+        # CSV 파일 저장 (청크 단위 스트리밍, Content-Length 없는 업로드도 한도 적용)
         csv_path = UPLOAD_FOLDER / f"input_{task_id}.csv"
-        with open(csv_path, "wb") as buffer:
-            content = await csv_file.read()
-            buffer.write(content)
+        written = 0
+        async with aiofiles.open(csv_path, "wb") as buffer:
+            while chunk := await csv_file.read(UPLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                if written > MAX_UPLOAD_BYTES:
+                    break
+                await buffer.write(chunk)
+        
+        if written > MAX_UPLOAD_BYTES:
+            csv_path.unlink(missing_ok=True)
+            raise HTTPException(status_code=413, detail="CSV file too large")
         
         # 작업 상태 초기화
-        generation_tasks[task_id] = {
-            "status": "pending",
-            "progress": 0.0,
-            "message": "Document generation task created",
-            "created_at": datetime.now(),
-            "csv_path": str(csv_path),
-            "settings": doc_settings.dict()
-        }
+        await _create_task(GENERATION, task_id, TaskState(
+            status="pending",
+            progress=0.0,
+            message="Document generation task created",
+            created_at=datetime.now().timestamp(),
+            csv_path=csv_path.as_posix(),
+            settings=doc_settings.model_dump(mode="json")
+        ))
         
         # 백그라운드에서 문서 생성 실행
-        background_tasks.add_task(run_document_generation, task_id, str(csv_path), doc_settings)
+        background_tasks.add_task(run_document_generation, task_id, csv_path, doc_settings)
         
         return {
             "task_id": task_id,
@@ -246,45 +452,49 @@ async def generate_document(
             "estimated_time": "1-2 minutes"
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to start document generation: {str(e)}")
 
 @app.get("/api/v1/documents/{task_id}/status")
 async def get_generation_status(task_id: str) -> GenerationStatusResponse:
     """문서 생성 상태 조회"""
-    if task_id not in generation_tasks:
+    task = await _get_task(GENERATION, task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    task = generation_tasks[task_id]
-    download_url = None
-    
-    if task["status"] == "completed" and "output_path" in task:
-        download_url = f"/api/v1/documents/{task_id}/download"
+    return await _generation_status(task_id, task)
+
+@app.get("/api/v1/documents/{task_id}/events")
+async def stream_generation_events(task_id: str):
+    """문서 생성 진행 상황 SSE 스트림 (폴링 대체)"""
+    if await _get_task(GENERATION, task_id) is None:
+        raise HTTPException(status_code=404, detail="Task not found")
     
-    return GenerationStatusResponse(
-        task_id=task_id,
-        status=task["status"],
-        progress=task["progress"],
-        message=task["message"],
-        download_url=download_url
+    return StreamingResponse(
+        _task_events(GENERATION, task_id, _generation_status),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
 
 @app.get("/api/v1/documents/{task_id}/download")
 async def download_document(task_id: str):
     """생성된 문서 다운로드"""
-    if task_id not in generation_tasks:
+    task = await _get_task(GENERATION, task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    task = generation_tasks[task_id]
-    if task["status"] != "completed":
+    if task.status != "completed":
         raise HTTPException(status_code=400, detail="Document generation not completed yet")
     
-    output_path = task.get("output_path")
-    if not output_path or not os.path.exists(output_path):
+    stat_result = _ready_file_stat(task, task.output_path)
+    if stat_result is None:
         raise HTTPException(status_code=404, detail="Document file not found")
     
-    return FileResponse(
-        output_path,
+    return _download_response(
+        task.output_path,
+        stat_result,
         media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
         filename=f"textbook_{task_id}.docx"
     )
@@ -292,46 +502,112 @@ async def download_document(task_id: str):
 @app.get("/api/v1/tasks")
 async def list_tasks():
     """모든 작업 목록 조회"""
+    analysis_count = await redis_client.scard(f"tasks:{ANALYSIS}")
+    generation_count = await redis_client.scard(f"tasks:{GENERATION}")
     return {
-        "analysis_tasks": len(analysis_tasks),
-        "generation_tasks": len(generation_tasks),
-        "total_tasks": len(analysis_tasks) + len(generation_tasks)
+        "analysis_tasks": analysis_count,
+        "generation_tasks": generation_count,
+        "total_tasks": analysis_count + generation_count
     }
 
 @app.delete("/api/v1/tasks/cleanup")
 async def cleanup_old_tasks():
-    """오래된 작업 정리"""
-    current_time = datetime.now()
+    """만료된 작업 ID 정리"""
+    # 작업 해시는 TTL(24시간)로 Redis가 자동 삭제하므로 집합에 남은 ID만 정리
     cleanup_count = 0
+    for kind in (ANALYSIS, GENERATION):
+        cleanup_count += await _prune_expired_task_ids(kind)
     
-    # 24시간 이상 된 작업 삭제
-    for task_id in list(analysis_tasks.keys()):
-        task = analysis_tasks[task_id]
-        if (current_time - task["created_at"]).total_seconds() > 86400:  # 24시간
-            del analysis_tasks[task_id]
-            cleanup_count += 1
-    
-    for task_id in list(generation_tasks.keys()):
-        task = generation_tasks[task_id]
-        if (current_time - task["created_at"]).total_seconds() > 86400:  # 24시간
-            del generation_tasks[task_id]
-            cleanup_count += 1
-    
+    remaining = (
+        await redis_client.scard(f"tasks:{ANALYSIS}")
+        + await redis_client.scard(f"tasks:{GENERATION}")
+    )
     return {
         "message": f"Cleaned up {cleanup_count} old tasks",
-        "remaining_tasks": len(analysis_tasks) + len(generation_tasks)
+        "remaining_tasks": remaining
     }
 
+async def _prune_expired_task_ids(kind: str) -> int:
+    """SSCAN으로 집합을 나누어 순회하며 해시가 만료된 작업 ID 제거"""
+    set_key = f"tasks:{kind}"
+    removed = 0
+    cursor = 0
+    
+    while True:
+        cursor, task_ids = await redis_client.sscan(set_key, cursor=cursor, count=CLEANUP_SCAN_COUNT)
+        if task_ids:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for task_id in task_ids:
+                    pipe.exists(_task_key(kind, task_id))
+                alive = await pipe.execute()
+            
+            expired = [task_id for task_id, exists in zip(task_ids, alive) if not exists]
+            if expired:
+                removed += await redis_client.srem(set_key, *expired)
+        
+        if cursor == 0:
+            return removed
+
+# 진행 상황 응답 헬퍼
+
+async def _load_result(task: TaskState) -> Optional[Dict[str, Any]]:
+    """완료된 분석의 결과 JSON 파일 읽기"""
+    if _ready_file_stat(task, task.result_path) is None:
+        return None
+    async with aiofiles.open(task.result_path, "rb") as f:
+        return orjson.loads(await f.read())
+
+async def _analysis_status(task_id: str, task: TaskState) -> AnalysisStatusResponse:
+    return AnalysisStatusResponse(
+        task_id=task_id,
+        status=task.status,
+        progress=task.progress,
+        message=task.message,
+        result=await _load_result(task)
+    )
+
+async def _generation_status(task_id: str, task: TaskState) -> GenerationStatusResponse:
+    download_url = None
+    
+    if task.status == "completed" and task.output_path:
+        download_url = f"/api/v1/documents/{task_id}/download"
+    
+    return GenerationStatusResponse(
+        task_id=task_id,
+        status=task.status,
+        progress=task.progress,
+        message=task.message,
+        download_url=download_url
+    )
+
+async def _task_events(kind: str, task_id: str, to_response):
+    """Redis Pub/Sub 알림마다 현재 상태를 SSE 이벤트로 전송, 완료/실패 시 종료"""
+    pubsub = redis_client.pubsub()
+    await pubsub.subscribe(_progress_channel(task_id))
+    try:
+        # 구독 후 현재 상태를 먼저 보내 구독 전 갱신 누락 방지
+        while True:
+            task = await _get_task(kind, task_id)
+            if task is None:
+                return
+            
+            response = await to_response(task_id, task)
+            yield f"data: {response.model_dump_json()}\n\n"
+            if task.status in ("completed", "failed"):
+                return
+            
+            # 다음 알림까지 대기, 일정 시간 알림이 없으면 연결 유지용 주석 전송
+            while await pubsub.get_message(ignore_subscribe_messages=True, timeout=SSE_KEEPALIVE_SECONDS) is None:
+                yield ": keepalive\n\n"
+    finally:
+        await pubsub.unsubscribe()
+        await pubsub.aclose()
+
 # 백그라운드 작업 함수
 
-async def run_book_analysis(task_id: str, book_info: BookInfoRequest):
+async def run_book_analysis(task_id: str, book_info: BookInfoRequest, book_key: str):
     """백그라운드에서 원서 분석 실행"""
     try:
-        # 상태 업데이트
-        analysis_tasks[task_id]["status"] = "processing"
-        analysis_tasks[task_id]["progress"] = 0.1
-        analysis_tasks[task_id]["message"] = "Starting book analysis..."
-        
         # BookInfo 객체 생성
         book = BookInfo(
             title=book_info.title,
@@ -345,24 +621,21 @@ async def run_book_analysis(task_id: str, book_info: BookInfoRequest):
         )
         
         # 분석 실행
-        analysis_tasks[task_id]["progress"] = 0.3
-        analysis_tasks[task_id]["message"] = "Analyzing book content..."
+        await _update_task(ANALYSIS, task_id, {
+            "status": "processing",
+            "progress": 0.3,
+            "message": "Analyzing book content..."
+        })
         
         result = await book_analyzer.analyze_book(book)
         
         # CSV 내보내기
-        analysis_tasks[task_id]["progress"] = 0.8
-        analysis_tasks[task_id]["message"] = "Exporting results to CSV..."
+        csv_path = (OUTPUT_FOLDER / f"analysis_{task_id}.csv").as_posix()
+        await asyncio.to_thread(book_analyzer.export_to_csv, result, csv_path)
         
-        csv_path = OUTPUT_FOLDER / f"analysis_{task_id}.csv"
-        book_analyzer.export_to_csv(result, str(csv_path))
-        
-        # 결과 저장
-        analysis_tasks[task_id]["status"] = "completed"
-        analysis_tasks[task_id]["progress"] = 1.0
-        analysis_tasks[task_id]["message"] = "Analysis completed successfully"
-        analysis_tasks[task_id]["csv_path"] = str(csv_path)
-        analysis_tasks[task_id]["result"] = {
+        # 결과 요약은 파일로 저장하고 작업 상태에는 경로만 기록
+        result_path = (OUTPUT_FOLDER / f"result_{task_id}.json").as_posix()
+        result_payload = {
             "analysis_id": result.analysis_id,
             "overall_score": result.overall_assessment["overall_score"],
             "topics_generated": result.overall_assessment["total_topics_generated"],
@@ -374,20 +647,34 @@ async def run_book_analysis(task_id: str, book_info: BookInfoRequest):
                 "education_level": result.book_info.get_education_level().value
             }
         }
+        async with aiofiles.open(result_path, "wb") as buffer:
+            await buffer.write(orjson.dumps(result_payload))
+        
+        # 결과 저장 및 도서 캐시 등록 (작업 해시와 같은 TTL)
+        completed_fields = {
+            "status": "completed",
+            "progress": 1.0,
+            "message": "Analysis completed successfully",
+            "csv_path": csv_path,
+            "result_path": result_path,
+            "output_ready": True
+        }
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.hset(_task_key(ANALYSIS, task_id), mapping=_encode_fields(completed_fields))
+            pipe.set(f"book:{book_key}", task_id, ex=TASK_TTL_SECONDS)
+            pipe.publish(_progress_channel(task_id), "completed")
+            await pipe.execute()
         
     except Exception as e:
-        analysis_tasks[task_id]["status"] = "failed"
-        analysis_tasks[task_id]["message"] = f"Analysis failed: {str(e)}"
-        print(f"Analysis error for task {task_id}: {e}")
+        await _update_task(ANALYSIS, task_id, {
+            "status": "failed",
+            "message": f"Analysis failed: {str(e)}"
+        })
+        logger.exception("Analysis failed for task %s", task_id)
 
-async def run_document_generation(task_id: str, csv_path: str, settings: DocumentSettingsRequest):
+async def run_document_generation(task_id: str, csv_path: Path, settings: DocumentSettingsRequest):
     """백그라운드에서 문서 생성 실행"""
     try:
-        # 상태 업데이트
-        generation_tasks[task_id]["status"] = "processing"
-        generation_tasks[task_id]["progress"] = 0.1
-        generation_tasks[task_id]["message"] = "Starting document generation..."
-        
         # DocumentSettings 객체 생성
         doc_settings = DocumentSettings(
             title=settings.title,
@@ -402,34 +689,46 @@ async def run_document_generation(task_id: str, csv_path: str, settings: Documen
         )
         
         # CSV에서 도서 정보 추출
-        generation_tasks[task_id]["progress"] = 0.2
-        generation_tasks[task_id]["message"] = "Reading CSV data..."
-        
-        df = pd.read_csv(csv_path)
-        if not df.empty:
-            doc_settings.book_title = df.iloc[0].get("Book_Title", "Unknown")
-            doc_settings.book_author = df.iloc[0].get("Book_Author", "Unknown")
-            doc_settings.ar_level = df.iloc[0].get("AR_Level", 0.0)
+        # 첫 행만 읽어 도서 정보 확인 (utf-8-sig: 엑셀 저장 CSV의 BOM 처리)
+        with open(csv_path, newline="", encoding="utf-8-sig") as f:
+            first_row = next(csv.DictReader(f), None)
+        if first_row:
+            doc_settings.book_title = first_row.get("Book_Title", "Unknown")
+            doc_settings.book_author = first_row.get("Book_Author", "Unknown")
+            doc_settings.ar_level = float(first_row.get("AR_Level") or 0.0)
         
         # 문서 생성
-        generation_tasks[task_id]["progress"] = 0.5
-        generation_tasks[task_id]["message"] = "Generating DOCX document..."
+        await _update_task(GENERATION, task_id, {
+            "status": "processing",
+            "progress": 0.5,
+            "message": "Generating DOCX document..."
+        })
         
-        generator = DOCXGenerator()
+        # 문서 단위로 이미 프로세스 풀에서 병렬 처리하므로 챕터는 순차 생성
+        generator = DOCXGenerator(chapter_workers=1)
         output_path = OUTPUT_FOLDER / f"textbook_{task_id}.docx"
         
-        result_path = generator.generate_textbook(csv_path, str(output_path), doc_settings)
+        # 이벤트 루프를 막지 않도록 별도 프로세스에서 생성
+        result_path = await asyncio.get_running_loop().run_in_executor(
+            process_pool, generator.generate_textbook,
+            csv_path.as_posix(), output_path.as_posix(), doc_settings
+        )
         
         # 완료
-        generation_tasks[task_id]["status"] = "completed"
-        generation_tasks[task_id]["progress"] = 1.0
-        generation_tasks[task_id]["message"] = "Document generated successfully"
-        generation_tasks[task_id]["output_path"] = result_path
+        await _update_task(GENERATION, task_id, {
+            "status": "completed",
+            "progress": 1.0,
+            "message": "Document generated successfully",
+            "output_path": result_path,
+            "output_ready": True
+        })
         
     except Exception as e:
-        generation_tasks[task_id]["status"] = "failed"
-        generation_tasks[task_id]["message"] = f"Document generation failed: {str(e)}"
-        print(f"Generation error for task {task_id}: {e}")
+        await _update_task(GENERATION, task_id, {
+            "status": "failed",
+            "message": f"Document generation failed: {str(e)}"
+        })
+        logger.exception("Document generation failed for task %s", task_id)
 
 # 개발용 엔드포인트
 @app.get("/api/v1/test/sample-analysis")
@@ -471,6 +770,9 @@ if __name__ == "__main__":
         "api_server:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        workers=WEB_CONCURRENCY,
+        reload=False,
+        loop="auto",  # uvloop이 설치되어 있으면 사용
+        http="httptools",
         log_level="info"
     )
@@ -4,23 +4,47 @@
 """
 
 import os
-import json
 import asyncio
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+import csv
+import hashlib
+import heapq
+import statistics
+from string import Template
+from types import MappingProxyType
+from itertools import chain
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, asdict, field, replace
 from enum import Enum
-import openai
-from openai import AsyncOpenAI
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+import diskcache
+import httpx
+import msgspec
+import orjson
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 from datetime import datetime
 import logging
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO)
+# 로깅 설정은 애플리케이션(api_server 등)에서 담당
 logger = logging.getLogger(__name__)
 
+# LLM 응답 디스크 캐시 위치 (같은 요청은 API를 다시 호출하지 않음)
+RESPONSE_CACHE_DIR = Path(os.getenv("PASCAL_CACHE_DIR", "~/.cache/pascal")).expanduser()
+# PASCAL_NO_CACHE를 설정하면 캐시를 읽지도 쓰지도 않고 항상 API 호출 (프롬프트 개발용)
+RESPONSE_CACHE_ENABLED = not os.getenv("PASCAL_NO_CACHE")
+
+# 동시 OpenAI 요청 수 기본값
+OPENAI_CONCURRENCY = int(os.getenv("PASCAL_OAI_CONCURRENCY", "16"))
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """일시적인 오류(429, 타임아웃, 연결 오류, 5xx)만 재시도"""
+    import openai
+    return isinstance(exc, (
+        openai.RateLimitError,
+        openai.APITimeoutError,
+        openai.APIConnectionError,
+        openai.InternalServerError,
+    ))
+
 class EducationLevel(str, Enum):
     """교육 레벨 정의"""
     PREPARATION = "preparation"  # AR 4.0-4.5
@@ -36,7 +60,141 @@ class EducationArea(str, Enum):
     MATHEMATICAL_THINKING = "Mathematical Thinking"
     ECONOMICS_GLOBAL_CITIZENSHIP = "Economics & Global Citizenship"
 
-@dataclass
+# topic_id 등 식별자에 쓰는 영역 슬러그 (예: "science_and_technology")
+AREA_SLUGS = MappingProxyType({
+    area: area.value.lower().replace('&', 'and').replace(' ', '_') for area in EducationArea
+})
+
+# 영역별 분석 관점 (단일 영역 호출과 일괄 호출에서 공통 사용)
+AREA_PROMPTS = MappingProxyType({
+    EducationArea.SCIENCE_TECHNOLOGY: """
+    Analyze this book from a Science & Technology perspective:
+    - Scientific thinking and methodology
+    - Technology's impact on society
+    - Innovation and discovery themes
+    - Ethical considerations in science/tech
+    """,
+    EducationArea.HUMAN_SOCIETY: """
+    Analyze this book from a Human & Society perspective:
+    - Social relationships and conflicts
+    - Community vs individual needs
+    - Cultural diversity and inclusion
+    - Social justice and equality themes
+    """,
+    EducationArea.FUTURE_CAREERS: """
+    Analyze this book from a Future & Careers perspective:
+    - Skills and competencies for the future
+    - Career exploration and development
+    - Entrepreneurship and innovation
+    - Global career opportunities
+    """,
+    EducationArea.LITERATURE_IDENTITY: """
+    Analyze this book from a Literature & Identity perspective:
+    - Character development and identity
+    - Cultural identity and belonging
+    - Personal growth and self-discovery
+    - Literary themes and symbolism
+    """,
+    EducationArea.MATHEMATICAL_THINKING: """
+    Analyze this book from a Mathematical Thinking perspective:
+    - Logical reasoning and problem-solving
+    - Pattern recognition and analysis
+    - Systematic thinking approaches
+    - Mathematical concepts in daily life
+    """,
+    EducationArea.ECONOMICS_GLOBAL_CITIZENSHIP: """
+    Analyze this book from an Economics & Global Citizenship perspective:
+    - Economic systems and decision-making
+    - Global interconnectedness
+    - Social responsibility and sustainability
+    - Cross-cultural understanding
+    """
+})
+
+# 레벨별 토론 주제 작성 지침
+LEVEL_GUIDELINES = MappingProxyType({
+    EducationLevel.PREPARATION: """
+    - Use simple, clear language
+    - Focus on basic character comparisons
+    - Provide structured debate formats
+    - Include vocabulary support
+    """,
+    EducationLevel.REGULAR: """
+    - Use intermediate complexity
+    - Include moral and ethical dimensions
+    - Encourage critical thinking
+    - Balance structure with creativity
+    """,
+    EducationLevel.MASTERY: """
+    - Use advanced analytical thinking
+    - Include multiple perspectives
+    - Encourage independent reasoning
+    - Focus on complex themes
+    """
+})
+
+_LEVEL_GUIDELINES_TEXT = "\n".join(
+    f"{level.value}:{guide.rstrip()}" for level, guide in LEVEL_GUIDELINES.items()
+)
+
+# 6개 영역 일괄 분석 요청에 들어가는 관점 목록
+_AREA_RUBRICS = "\n".join(
+    f"{i}. {area.value}:{AREA_PROMPTS[area]}" for i, area in enumerate(EducationArea, start=1)
+)
+
+# 모든 분석/토론 주제 호출의 앞부분에 동일하게 들어가는 시스템 프롬프트
+# (앞부분이 바이트 단위로 같아야 OpenAI 프롬프트 캐싱이 적용됨)
+PASCAL_SYSTEM_PROMPT = f"""
+You are an educational content designer for Pascal, an English debate program
+for Korean students who learn English by reading English books and debating them.
+Focus on educational value for Korean students learning English through debate,
+and always answer with valid JSON only, without markdown fences.
+
+Area analysis JSON format:
+{{
+    "relevance_score": <0-10 score>,
+    "key_themes": [<list of 3-5 key themes>],
+    "discussion_points": [<list of 4-6 discussion points>],
+    "vocabulary_focus": [<list of 10-15 key vocabulary words>],
+    "cultural_context": [<list of cultural elements>],
+    "korean_connection": [<list of connections to Korean context>]
+}}
+
+Debate topic JSON format:
+{{
+    "topics": [
+        {{
+            "title": "<debate topic title>",
+            "description": "<detailed description>",
+            "debate_format": "<character_comparison|moral_judgment|issue_analysis>",
+            "pro_arguments": [<3-4 pro arguments>],
+            "con_arguments": [<3-4 con arguments>],
+            "background_info": "<background information needed>",
+            "vocabulary_list": [<8-12 key vocabulary words>],
+            "time_estimate": <estimated time in minutes>
+        }}
+    ]
+}}
+
+Level guidelines for debate topics:
+{_LEVEL_GUIDELINES_TEXT}
+"""
+
+# 시스템 프롬프트 뒤에 도서 정보를 붙인 템플릿 (호출마다 도서 정보만 치환)
+_BOOK_SYSTEM_TEMPLATE = Template(PASCAL_SYSTEM_PROMPT.replace("$", "$$") + """
+Book: "$title" by $author
+AR Level: $ar_level
+Summary: $summary
+""")
+
+# export_to_csv 컬럼 순서 (docx_generator가 읽는 CSV 형식)
+CSV_FIELDS = (
+    "Topic_ID", "Title", "Description", "Level", "Area", "Format",
+    "Pro_Arguments", "Con_Arguments", "Background", "Vocabulary",
+    "Time_Minutes", "Book_Title", "Book_Author", "AR_Level",
+)
+
+@dataclass(slots=True)
 class BookInfo:
     """원서 기본 정보"""
     title: str
@@ -47,28 +205,31 @@ class BookInfo:
     publication_year: Optional[int] = None
     isbn: Optional[str] = None
     summary: Optional[str] = None
+    _cached_level: Optional[EducationLevel] = field(default=None, init=False, repr=False, compare=False)
     
     def get_education_level(self) -> EducationLevel:
-        """AR 지수를 기반으로 교육 레벨 결정"""
-        if self.ar_level <= 4.5:
-            return EducationLevel.PREPARATION
-        elif self.ar_level <= 5.2:
-            return EducationLevel.REGULAR
-        else:
-            return EducationLevel.MASTERY
-
-@dataclass
+        """AR 지수를 기반으로 교육 레벨 결정 (처음 계산한 값을 재사용)"""
+        if self._cached_level is None:
+            if self.ar_level <= 4.5:
+                self._cached_level = EducationLevel.PREPARATION
+            elif self.ar_level <= 5.2:
+                self._cached_level = EducationLevel.REGULAR
+            else:
+                self._cached_level = EducationLevel.MASTERY
+        return self._cached_level
+
+@dataclass(slots=True, frozen=True)
 class AreaAnalysis:
-    """영역별 분석 결과"""
+    """영역별 분석 결과 (불변이므로 목록 필드는 튜플)"""
     area: EducationArea
     relevance_score: float  # 0-10 점수
-    key_themes: List[str]
-    discussion_points: List[str]
-    vocabulary_focus: List[str]
-    cultural_context: List[str]
-    korean_connection: List[str]
+    key_themes: Tuple[str, ...]
+    discussion_points: Tuple[str, ...]
+    vocabulary_focus: Tuple[str, ...]
+    cultural_context: Tuple[str, ...]
+    korean_connection: Tuple[str, ...]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DebateTopicSet:
     """토론 주제 세트"""
     topic_id: str
@@ -83,7 +244,7 @@ class DebateTopicSet:
     vocabulary_list: List[str]
     time_estimate: int  # 분 단위
 
-@dataclass
+@dataclass(slots=True)
 class BookAnalysisResult:
     """전체 분석 결과"""
     book_info: BookInfo
@@ -93,16 +254,152 @@ class BookAnalysisResult:
     debate_topics: List[DebateTopicSet]
     overall_assessment: Dict[str, Any]
 
+class AreaPayload(msgspec.Struct, forbid_unknown_fields=True):
+    """영역 분석 응답 스키마 (JSON 배열을 바로 튜플로 디코딩)"""
+    relevance_score: float
+    key_themes: Tuple[str, ...]
+    discussion_points: Tuple[str, ...]
+    vocabulary_focus: Tuple[str, ...]
+    cultural_context: Tuple[str, ...]
+    korean_connection: Tuple[str, ...]
+
+# 6개 영역 일괄 분석 응답 스키마 (영역 이름을 키로, 모든 영역이 있어야 유효)
+AreasPayload = msgspec.defstruct(
+    "AreasPayload",
+    [(AREA_SLUGS[area], AreaPayload, msgspec.field(name=area.value)) for area in EducationArea],
+    forbid_unknown_fields=True
+)
+
+class TopicPayload(msgspec.Struct, forbid_unknown_fields=True):
+    """토론 주제 응답 스키마 (주제 1개)"""
+    title: str
+    description: str
+    debate_format: str
+    pro_arguments: List[str]
+    con_arguments: List[str]
+    background_info: str
+    vocabulary_list: List[str]
+    time_estimate: int
+
+class TopicsPayload(msgspec.Struct, forbid_unknown_fields=True):
+    """토론 주제 응답 스키마"""
+    topics: List[TopicPayload]
+
+def _strict_schema(payload_type: type) -> Dict[str, Any]:
+    """msgspec 스키마를 Structured Outputs strict 모드 형식(루트가 object)으로 변환"""
+    _, defs = msgspec.json.schema_components([payload_type])
+    for schema in defs.values():
+        # docstring에서 온 title/description은 모델에 보낼 필요 없음
+        schema.pop("title", None)
+        schema.pop("description", None)
+    root = defs.pop(payload_type.__name__)
+    return {**root, "$defs": defs} if defs else root
+
+def _json_schema_format(name: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    return {"type": "json_schema", "json_schema": {"name": name, "strict": True, "schema": schema}}
+
+# 응답 형식을 스키마로 강제 (모듈 로드 시 한 번만 생성)
+AREA_RESPONSE_FORMAT = _json_schema_format("area_analysis", _strict_schema(AreaPayload))
+AREAS_RESPONSE_FORMAT = _json_schema_format("area_analyses", {
+    "type": "object",
+    "properties": {area.value: {"$ref": "#/$defs/AreaPayload"} for area in EducationArea},
+    "required": [area.value for area in EducationArea],
+    "additionalProperties": False,
+    "$defs": {"AreaPayload": _strict_schema(AreaPayload)},
+})
+TOPICS_RESPONSE_FORMAT = _json_schema_format("debate_topics", _strict_schema(TopicsPayload))
+
 class BookAnalyzer:
     """원서 분석 및 토론 주제 생성 클래스"""
     
-    def __init__(self, openai_api_key: str):
-        self.client = AsyncOpenAI(api_key=openai_api_key)
-        self.analysis_cache = {}
+    def __init__(self, openai_api_key: str, http_client: Optional[httpx.AsyncClient] = None,
+                 max_concurrency: int = OPENAI_CONCURRENCY, batch_areas: bool = True,
+                 cache_dir: Optional[Path] = None, use_cache: bool = RESPONSE_CACHE_ENABLED):
+        # openai SDK는 import 비용이 커서(수백 ms) 클라이언트를 만들 때 처음 불러옴
+        # (BookInfo 등 데이터 클래스만 쓰는 쪽은 SDK를 로드하지 않음)
+        from openai import AsyncOpenAI
+        
+        # http_client를 넘기면 다른 서비스와 커넥션 풀을 공유
+        # 재시도는 _chat에서 지수 백오프로 처리하므로 SDK 자체 재시도는 끔
+        self.client = AsyncOpenAI(api_key=openai_api_key, http_client=http_client, max_retries=0)
+        # 동시 OpenAI 요청 수 제한 (여러 권을 함께 분석할 때 rate limit 보호)
+        self._max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # True면 6개 영역을 한 번의 호출로 분석 (False면 영역별 개별 호출)
+        self.batch_areas = batch_areas
+        self._disk_cache = diskcache.Cache(str(cache_dir or RESPONSE_CACHE_DIR)) if use_cache else None
+
+    @retry(
+        wait=wait_random_exponential(min=1, max=30),
+        stop=stop_after_attempt(6),
+        retry=retry_if_exception(is_retryable_error),
+        reraise=True
+    )
+    async def _chat(self, **kwargs):
+        """세마포어로 동시 요청 수를 제한한 chat completion 호출 (일시적 오류는 백오프 후 재시도)"""
+        async with self._semaphore:
+            return await self.client.chat.completions.create(**kwargs)
+
+    async def _cached_chat(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        """응답 본문을 (모델, 파라미터, 메시지) 해시로 디스크에 캐시하는 호출"""
+        if self._disk_cache is None:
+            response = await self._chat(messages=messages, **kwargs)
+            return response.choices[0].message.content
+        
+        key = self._response_cache_key(messages, **kwargs)
+        cached = self._disk_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        response = await self._chat(messages=messages, **kwargs)
+        choice = response.choices[0]
+        # 길이 제한으로 잘린 응답은 캐시하지 않음
+        if getattr(choice, "finish_reason", "stop") == "length":
+            return choice.message.content
+        
+        self._disk_cache.set(key, choice.message.content)
+        return choice.message.content
+
+    @staticmethod
+    def _response_cache_key(messages: List[Dict[str, str]], **kwargs) -> str:
+        return hashlib.blake2b(
+            orjson.dumps({"msg": messages, **kwargs}, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
+    
+    def _forget_response(self, request: Dict[str, Any]) -> None:
+        """스키마에 맞지 않는 응답을 캐시에서 지워 다음 실행에서 다시 요청하게 함"""
+        if self._disk_cache is not None:
+            self._disk_cache.delete(self._response_cache_key(**request))
+
+    async def _chat_validated(self, request: Dict[str, Any], payload_type: type):
+        """응답을 스키마로 디코딩하고, 맞지 않으면 오류를 알려주며 한 번 더 요청
+        
+        디코딩에 실패한 응답은 캐시에 남기지 않음
+        """
+        result_text = await self._cached_chat(**request)
+        try:
+            return msgspec.json.decode(result_text, type=payload_type)
+        except msgspec.DecodeError as e:
+            logger.warning("Response did not match schema, retrying once: %s", e)
+            self._forget_response(request)
+            messages = [
+                *request["messages"],
+                {"role": "assistant", "content": result_text},
+                {"role": "user", "content": f"Your previous JSON was malformed ({e}). "
+                                            "Re-emit it strictly matching the requested JSON format."}
+            ]
+        
+        retry_request = {**request, "messages": messages}
+        result_text = await self._cached_chat(**retry_request)
+        try:
+            return msgspec.json.decode(result_text, type=payload_type)
+        except msgspec.DecodeError:
+            self._forget_response(retry_request)
+            raise
         
     async def analyze_book(self, book_info: BookInfo) -> BookAnalysisResult:
         """원서 종합 분석 수행"""
-        logger.info(f"Starting analysis for book: {book_info.title}")
+        logger.info("Starting analysis for book: %s", book_info.title)
         
         # 1. 외부 데이터 수집
         enhanced_book_info = await self._enhance_book_info(book_info)
@@ -113,23 +410,154 @@ class BookAnalyzer:
         # 3. 토론 주제 생성
         debate_topics = await self._generate_debate_topics(enhanced_book_info, area_analyses)
         
-        # 4. 전체 평가
-        overall_assessment = await self._generate_overall_assessment(
-            enhanced_book_info, area_analyses, debate_topics
+        # 4. 전체 평가 및 결과 구성
+        analysis_result = self._build_result(enhanced_book_info, area_analyses, debate_topics)
+        
+        logger.info("Analysis completed for book: %s", book_info.title)
+        return analysis_result
+    
+    async def analyze_books(self, books: List[BookInfo], concurrency: int = 10,
+                            csv_path: Optional[str] = None) -> List[BookAnalysisResult]:
+        """여러 권을 동시에 분석 (csv_path를 주면 끝난 도서부터 CSV에 바로 기록)"""
+        # 동시에 진행하는 도서 수 제한 (OpenAI 요청 수는 _chat의 세마포어가 별도로 제한)
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def analyze(index: int, book: BookInfo):
+            async with semaphore:
+                return index, await self.analyze_book(book)
+        
+        results: List[Optional[BookAnalysisResult]] = [None] * len(books)
+        csv_file = open(csv_path, "w", newline="", encoding="utf-8") if csv_path else None
+        tasks = [asyncio.create_task(analyze(i, book)) for i, book in enumerate(books)]
+        completed = False
+        try:
+            writer = None
+            if csv_file:
+                writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDS)
+                writer.writeheader()
+            
+            for finished in asyncio.as_completed(tasks):
+                index, result = await finished
+                results[index] = result
+                if writer:
+                    writer.writerows(self._csv_rows(result))
+                    csv_file.flush()
+            completed = True
+        finally:
+            # 한 권이라도 실패하면 남은 분석을 취소해 OpenAI 요청이 계속 나가지 않게 함
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if csv_file:
+                csv_file.close()
+                # 일부만 기록된 CSV는 남기지 않음
+                if not completed:
+                    Path(csv_path).unlink(missing_ok=True)
+        
+        if csv_path:
+            logger.info("CSV exported to: %s", csv_path)
+        return results
+    
+    async def analyze_books_batch(self, books: List[BookInfo], poll_interval: float = 30.0) -> List[BookAnalysisResult]:
+        """OpenAI Batch API로 여러 권을 오프라인 분석 (실시간 호출 대비 절반 비용, 최대 24시간 소요)"""
+        logger.info("Starting batch analysis for %s books", len(books))
+        
+        # 1. 줄거리가 없는 도서는 먼저 줄거리 생성 (호출자의 BookInfo는 바꾸지 않고 복사본에 채움)
+        summary_requests = {
+            str(i): self._summary_request(book) for i, book in enumerate(books) if not book.summary
+        }
+        if summary_requests:
+            summaries = await self._run_batch(summary_requests, poll_interval)
+            books = [
+                replace(book, summary=summaries.get(str(i), "Summary not available").strip())
+                if str(i) in summary_requests else book
+                for i, book in enumerate(books)
+            ]
+        
+        # 2. 도서별 6개 영역 분석
+        area_outputs = await self._run_batch(
+            {str(i): self._areas_request(book) for i, book in enumerate(books)}, poll_interval
+        )
+        area_analyses = [self._parse_area_batch(area_outputs.get(str(i))) for i in range(len(books))]
+        
+        # 3. 관련성이 높은 영역의 토론 주제 생성
+        topic_requests = {
+            f"{i}:{AREA_SLUGS[analysis.area]}": self._topics_request(book, analysis, book.get_education_level())
+            for i, book in enumerate(books)
+            for analysis in area_analyses[i]
+            if analysis.relevance_score >= 6.0
+        }
+        topic_outputs = await self._run_batch(topic_requests, poll_interval) if topic_requests else {}
+        
+        # 4. 결과 구성
+        results = []
+        for i, book in enumerate(books):
+            level = book.get_education_level()
+            debate_topics = []
+            for analysis in area_analyses[i]:
+                result_text = topic_outputs.get(f"{i}:{AREA_SLUGS[analysis.area]}")
+                if result_text is None:
+                    continue
+                try:
+                    payload = msgspec.json.decode(result_text, type=TopicsPayload)
+                    debate_topics.extend(self._topics_from_payload(payload, analysis, level))
+                except Exception as e:
+                    logger.error("Failed to generate topics for area %s: %s", analysis.area, e)
+            
+            results.append(self._build_result(book, area_analyses[i], debate_topics))
+        
+        logger.info("Batch analysis completed for %s books", len(books))
+        return results
+    
+    async def _run_batch(self, requests: Dict[str, Dict[str, Any]], poll_interval: float = 30.0) -> Dict[str, str]:
+        """chat completion 요청들을 Batch API로 제출하고 custom_id별 응답 본문 반환"""
+        lines = [
+            orjson.dumps({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body})
+            for custom_id, body in requests.items()
+        ]
+        batch_file = await self.client.files.create(
+            file=("batch.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(poll_interval)
+            batch = await self.client.batches.retrieve(batch.id)
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+        
+        output = await self.client.files.content(batch.output_file_id)
+        outputs = {}
+        for line in output.text.splitlines():
+            item = orjson.loads(line)
+            response = item.get("response")
+            if item.get("error") or not response or response["status_code"] != 200:
+                logger.error("Batch request %s failed: %s", item['custom_id'], item.get('error'))
+                continue
+            outputs[item["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        
+        return outputs
+    
+    def _build_result(self, book_info: BookInfo, area_analyses: List[AreaAnalysis], debate_topics: List[DebateTopicSet]) -> BookAnalysisResult:
+        """전체 평가를 포함한 분석 결과 구성"""
+        overall_assessment = self._generate_overall_assessment(
+            book_info, area_analyses, debate_topics
         )
         
-        # 5. 결과 구성
-        analysis_result = BookAnalysisResult(
-            book_info=enhanced_book_info,
+        return BookAnalysisResult(
+            book_info=book_info,
             analysis_id=f"analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
             analysis_date=datetime.now(),
             area_analyses=area_analyses,
             debate_topics=debate_topics,
             overall_assessment=overall_assessment
         )
-        
-        logger.info(f"Analysis completed for book: {book_info.title}")
-        return analysis_result
     
     async def _enhance_book_info(self, book_info: BookInfo) -> BookInfo:
         """외부 API를 통한 도서 정보 보강"""
@@ -139,261 +567,227 @@ class BookAnalyzer:
             enhanced_info = book_info
             
             if not enhanced_info.summary:
-                enhanced_info.summary = await self._generate_summary_from_title(book_info)
+                enhanced_info = replace(book_info, summary=await self._generate_summary_from_title(book_info))
             
             return enhanced_info
         except Exception as e:
-            logger.warning(f"Failed to enhance book info: {e}")
+            logger.warning("Failed to enhance book info: %s", e)
             return book_info
     
     async def _generate_summary_from_title(self, book_info: BookInfo) -> str:
         """제목과 저자를 기반으로 줄거리 생성"""
+        try:
+            content = await self._cached_chat(**self._summary_request(book_info))
+            return content.strip()
+        except Exception as e:
+            logger.error("Failed to generate summary: %s", e)
+            return "Summary not available"
+    
+    @staticmethod
+    def _summary_request(book_info: BookInfo) -> Dict[str, Any]:
+        """줄거리 생성 요청 파라미터"""
         prompt = f"""
         Please provide a brief summary of the book "{book_info.title}" by {book_info.author}.
         Focus on the main plot, key characters, and central themes.
         Keep it concise (2-3 paragraphs).
         """
         
-        try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4.1-mini",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=500,
-                temperature=0.3
-            )
-            return response.choices[0].message.content.strip()
-        except Exception as e:
-            logger.error(f"Failed to generate summary: {e}")
-            return "Summary not available"
+        return dict(
+            model="gpt-4.1-mini",
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=500,
+            temperature=0.3
+        )
     
     async def _analyze_by_areas(self, book_info: BookInfo) -> List[AreaAnalysis]:
-        """6개 영역별 분석 수행"""
-        analyses = []
+        """6개 영역별 분석 수행 (영역별 호출은 서로 독립적이므로 동시에 실행)"""
+        if self.batch_areas:
+            return await self._analyze_all_areas_batched(book_info)
         
-        for area in EducationArea:
-            analysis = await self._analyze_single_area(book_info, area)
-            analyses.append(analysis)
-        
-        return analyses
+        return list(await asyncio.gather(
+            *(self._analyze_single_area(book_info, area) for area in EducationArea)
+        ))
     
     async def _analyze_single_area(self, book_info: BookInfo, area: EducationArea) -> AreaAnalysis:
         """단일 영역 분석"""
-        area_prompts = {
-            EducationArea.SCIENCE_TECHNOLOGY: """
-            Analyze this book from a Science & Technology perspective:
-            - Scientific thinking and methodology
-            - Technology's impact on society
-            - Innovation and discovery themes
-            - Ethical considerations in science/tech
-            """,
-            EducationArea.HUMAN_SOCIETY: """
-            Analyze this book from a Human & Society perspective:
-            - Social relationships and conflicts
-            - Community vs individual needs
-            - Cultural diversity and inclusion
-            - Social justice and equality themes
-            """,
-            EducationArea.FUTURE_CAREERS: """
-            Analyze this book from a Future & Careers perspective:
-            - Skills and competencies for the future
-            - Career exploration and development
-            - Entrepreneurship and innovation
-            - Global career opportunities
-            """,
-            EducationArea.LITERATURE_IDENTITY: """
-            Analyze this book from a Literature & Identity perspective:
-            - Character development and identity
-            - Cultural identity and belonging
-            - Personal growth and self-discovery
-            - Literary themes and symbolism
-            """,
-            EducationArea.MATHEMATICAL_THINKING: """
-            Analyze this book from a Mathematical Thinking perspective:
-            - Logical reasoning and problem-solving
-            - Pattern recognition and analysis
-            - Systematic thinking approaches
-            - Mathematical concepts in daily life
-            """,
-            EducationArea.ECONOMICS_GLOBAL_CITIZENSHIP: """
-            Analyze this book from an Economics & Global Citizenship perspective:
-            - Economic systems and decision-making
-            - Global interconnectedness
-            - Social responsibility and sustainability
-            - Cross-cultural understanding
-            """
-        }
-        
         prompt = f"""
-        Book: "{book_info.title}" by {book_info.author}
-        AR Level: {book_info.ar_level}
-        Summary: {book_info.summary or 'Not available'}
+        {AREA_PROMPTS[area]}
         
-        {area_prompts[area]}
+        Respond in the area analysis JSON format.
+        """
         
-        Please provide analysis in the following JSON format:
-        {{
-            "relevance_score": <0-10 score>,
-            "key_themes": [<list of 3-5 key themes>],
-            "discussion_points": [<list of 4-6 discussion points>],
-            "vocabulary_focus": [<list of 10-15 key vocabulary words>],
-            "cultural_context": [<list of cultural elements>],
-            "korean_connection": [<list of connections to Korean context>]
-        }}
+        request = dict(
+            model="gpt-4.1-mini",
+            messages=[self._book_system_message(book_info), {"role": "user", "content": prompt}],
+            max_tokens=1000,
+            temperature=0.3,
+            response_format=AREA_RESPONSE_FORMAT
+        )
+        
+        try:
+            payload = await self._chat_validated(request, AreaPayload)
+            return self._area_analysis_from_data(area, payload)
+            
+        except Exception as e:
+            logger.error("Failed to analyze area %s: %s", area, e)
+            return self._fallback_area_analysis(area)
+    
+    async def _analyze_all_areas_batched(self, book_info: BookInfo) -> List[AreaAnalysis]:
+        """6개 영역을 한 번의 호출로 분석 (도서 정보는 한 번만 전송)"""
+        try:
+            payload = await self._chat_validated(self._areas_request(book_info), AreasPayload)
+        except Exception as e:
+            logger.error("Failed to analyze areas in batch: %s", e)
+            return [self._fallback_area_analysis(area) for area in EducationArea]
         
-        Focus on educational value for Korean students learning English through debate.
+        return [
+            self._area_analysis_from_data(area, getattr(payload, AREA_SLUGS[area]))
+            for area in EducationArea
+        ]
+    
+    @classmethod
+    def _areas_request(cls, book_info: BookInfo) -> Dict[str, Any]:
+        """6개 영역 일괄 분석 요청 파라미터"""
+        prompt = f"""
+        Analyze this book separately for each of the following areas:
+        {_AREA_RUBRICS}
+        
+        Return JSON keyed by area name, one entry per area above,
+        each value in the area analysis JSON format.
         """
         
+        return dict(
+            model="gpt-4.1-mini",
+            messages=[cls._book_system_message(book_info), {"role": "user", "content": prompt}],
+            max_tokens=4000,
+            temperature=0.3,
+            response_format=AREAS_RESPONSE_FORMAT
+        )
+    
+    @classmethod
+    def _parse_area_batch(cls, result_text: Optional[str]) -> List[AreaAnalysis]:
+        """일괄 분석 응답을 영역별 결과로 변환 (누락/오류 영역은 기본값)"""
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4.1-mini",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=1000,
-                temperature=0.3
-            )
-            
-            result_text = response.choices[0].message.content.strip()
-            # JSON 파싱
-            if result_text.startswith("```json"):
-                result_text = result_text[7:-3]
-            elif result_text.startswith("```"):
-                result_text = result_text[3:-3]
-            
-            result_data = json.loads(result_text)
-            
-            return AreaAnalysis(
-                area=area,
-                relevance_score=result_data["relevance_score"],
-                key_themes=result_data["key_themes"],
-                discussion_points=result_data["discussion_points"],
-                vocabulary_focus=result_data["vocabulary_focus"],
-                cultural_context=result_data["cultural_context"],
-                korean_connection=result_data["korean_connection"]
-            )
-            
+            parsed = orjson.loads(result_text) if result_text else {}
         except Exception as e:
-            logger.error(f"Failed to analyze area {area}: {e}")
-            # 기본값 반환
-            return AreaAnalysis(
-                area=area,
-                relevance_score=5.0,
-                key_themes=["General themes"],
-                discussion_points=["General discussion points"],
-                vocabulary_focus=["vocabulary"],
-                cultural_context=["cultural elements"],
-                korean_connection=["Korean connections"]
+            logger.error("Failed to parse area analyses: %s", e)
+            parsed = {}
+        
+        analyses = []
+        for area in EducationArea:
+            try:
+                payload = msgspec.convert(parsed[area.value], AreaPayload)
+                analyses.append(cls._area_analysis_from_data(area, payload))
+            except Exception as e:
+                logger.error("Failed to analyze area %s: %s", area, e)
+                analyses.append(cls._fallback_area_analysis(area))
+        
+        return analyses
+    
+    @staticmethod
+    def _area_analysis_from_data(area: EducationArea, payload: AreaPayload) -> AreaAnalysis:
+        """검증된 응답에서 영역 분석 결과 생성"""
+        return AreaAnalysis(area=area, **msgspec.structs.asdict(payload))
+    
+    @staticmethod
+    def _fallback_area_analysis(area: EducationArea) -> AreaAnalysis:
+        """분석 실패 시 기본값 반환"""
+        return AreaAnalysis(
+            area=area,
+            relevance_score=5.0,
+            key_themes=("General themes",),
+            discussion_points=("General discussion points",),
+            vocabulary_focus=("vocabulary",),
+            cultural_context=("cultural elements",),
+            korean_connection=("Korean connections",)
+        )
+    
+    @staticmethod
+    def _book_system_message(book_info: BookInfo) -> Dict[str, str]:
+        """공통 시스템 프롬프트 + 도서 정보 (한 권에 대한 모든 호출에서 동일)"""
+        return {
+            "role": "system",
+            "content": _BOOK_SYSTEM_TEMPLATE.substitute(
+                title=book_info.title,
+                author=book_info.author,
+                ar_level=book_info.ar_level,
+                summary=book_info.summary or 'Not available'
             )
+        }
     
     async def _generate_debate_topics(self, book_info: BookInfo, area_analyses: List[AreaAnalysis]) -> List[DebateTopicSet]:
         """토론 주제 생성"""
-        debate_topics = []
         level = book_info.get_education_level()
         
-        # 각 영역별로 토론 주제 생성
-        for analysis in area_analyses:
-            if analysis.relevance_score >= 6.0:  # 관련성이 높은 영역만
-                topics = await self._generate_topics_for_area(book_info, analysis, level)
-                debate_topics.extend(topics)
+        # 관련성이 높은 영역만 동시에 토론 주제 생성
+        results = await asyncio.gather(*(
+            self._generate_topics_for_area(book_info, analysis, level)
+            for analysis in area_analyses
+            if analysis.relevance_score >= 6.0
+        ))
         
-        return debate_topics
+        return list(chain.from_iterable(results))
     
     async def _generate_topics_for_area(self, book_info: BookInfo, analysis: AreaAnalysis, level: EducationLevel) -> List[DebateTopicSet]:
         """특정 영역에 대한 토론 주제 생성"""
-        level_guidelines = {
-            EducationLevel.PREPARATION: """
-            - Use simple, clear language
-            - Focus on basic character comparisons
-            - Provide structured debate formats
-            - Include vocabulary support
-            """,
-            EducationLevel.REGULAR: """
-            - Use intermediate complexity
-            - Include moral and ethical dimensions
-            - Encourage critical thinking
-            - Balance structure with creativity
-            """,
-            EducationLevel.MASTERY: """
-            - Use advanced analytical thinking
-            - Include multiple perspectives
-            - Encourage independent reasoning
-            - Focus on complex themes
-            """
-        }
-        
+        try:
+            payload = await self._chat_validated(
+                self._topics_request(book_info, analysis, level), TopicsPayload
+            )
+            return self._topics_from_payload(payload, analysis, level)
+            
+        except Exception as e:
+            logger.error("Failed to generate topics for area %s: %s", analysis.area, e)
+            return []
+    
+    @classmethod
+    def _topics_request(cls, book_info: BookInfo, analysis: AreaAnalysis, level: EducationLevel) -> Dict[str, Any]:
+        """영역별 토론 주제 생성 요청 파라미터"""
         prompt = f"""
-        Generate 2-3 debate topics for the book "{book_info.title}" by {book_info.author}
+        Generate 2-3 debate topics for this book.
         
         Area: {analysis.area}
         Level: {level}
         Key Themes: {', '.join(analysis.key_themes)}
         Discussion Points: {', '.join(analysis.discussion_points)}
         
-        Level Guidelines:
-        {level_guidelines[level]}
-        
-        For each topic, provide in JSON format:
-        {{
-            "topics": [
-                {{
-                    "title": "<debate topic title>",
-                    "description": "<detailed description>",
-                    "debate_format": "<character_comparison|moral_judgment|issue_analysis>",
-                    "pro_arguments": [<3-4 pro arguments>],
-                    "con_arguments": [<3-4 con arguments>],
-                    "background_info": "<background information needed>",
-                    "vocabulary_list": [<8-12 key vocabulary words>],
-                    "time_estimate": <estimated time in minutes>
-                }}
-            ]
-        }}
-        
-        Make topics engaging for Korean students learning English.
+        Follow the level guidelines for "{level.value}" and respond in the
+        debate topic JSON format. Make topics engaging for Korean students learning English.
         """
         
-        try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4.1-mini",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=1500,
-                temperature=0.4
+        return dict(
+            model="gpt-4.1-mini",
+            messages=[cls._book_system_message(book_info), {"role": "user", "content": prompt}],
+            max_tokens=1500,
+            temperature=0.4,
+            response_format=TOPICS_RESPONSE_FORMAT
+        )
+    
+    @staticmethod
+    def _topics_from_payload(payload: TopicsPayload, analysis: AreaAnalysis, level: EducationLevel) -> List[DebateTopicSet]:
+        """검증된 응답을 DebateTopicSet 목록으로 변환"""
+        return [
+            DebateTopicSet(
+                topic_id=f"{AREA_SLUGS[analysis.area]}_{i+1}",
+                title=topic.title,
+                description=topic.description,
+                level=level,
+                area=analysis.area,
+                debate_format=topic.debate_format,
+                pro_arguments=topic.pro_arguments,
+                con_arguments=topic.con_arguments,
+                background_info=topic.background_info,
+                vocabulary_list=topic.vocabulary_list,
+                time_estimate=topic.time_estimate
             )
-            
-            result_text = response.choices[0].message.content.strip()
-            if result_text.startswith("```json"):
-                result_text = result_text[7:-3]
-            elif result_text.startswith("```"):
-                result_text = result_text[3:-3]
-            
-            result_data = json.loads(result_text)
-            
-            topics = []
-            for i, topic_data in enumerate(result_data["topics"]):
-                topic = DebateTopicSet(
-                    topic_id=f"{analysis.area.value.lower().replace(' ', '_')}_{i+1}",
-                    title=topic_data["title"],
-                    description=topic_data["description"],
-                    level=level,
-                    area=analysis.area,
-                    debate_format=topic_data["debate_format"],
-                    pro_arguments=topic_data["pro_arguments"],
-                    con_arguments=topic_data["con_arguments"],
-                    background_info=topic_data["background_info"],
-                    vocabulary_list=topic_data["vocabulary_list"],
-                    time_estimate=topic_data["time_estimate"]
-                )
-                topics.append(topic)
-            
-            return topics
-            
-        except Exception as e:
-            logger.error(f"Failed to generate topics for area {analysis.area}: {e}")
-            return []
+            for i, topic in enumerate(payload.topics)
+        ]
     
-    async def _generate_overall_assessment(self, book_info: BookInfo, area_analyses: List[AreaAnalysis], debate_topics: List[DebateTopicSet]) -> Dict[str, Any]:
+    def _generate_overall_assessment(self, book_info: BookInfo, area_analyses: List[AreaAnalysis], debate_topics: List[DebateTopicSet]) -> Dict[str, Any]:
         """전체 평가 생성"""
-        total_relevance = sum(analysis.relevance_score for analysis in area_analyses)
-        avg_relevance = total_relevance / len(area_analyses)
+        avg_relevance = statistics.fmean(analysis.relevance_score for analysis in area_analyses)
         
-        best_areas = sorted(area_analyses, key=lambda x: x.relevance_score, reverse=True)[:3]
+        best_areas = heapq.nlargest(3, area_analyses, key=lambda x: x.relevance_score)
         
         assessment = {
             "overall_score": round(avg_relevance, 2),
@@ -414,37 +808,39 @@ class BookAnalyzer:
     def export_to_csv(self, analysis_result: BookAnalysisResult, output_path: str) -> str:
         """분석 결과를 CSV로 내보내기"""
         try:
-            # 토론 주제 데이터를 CSV 형태로 변환
-            csv_data = []
-            
-            for topic in analysis_result.debate_topics:
-                row = {
-                    "Topic_ID": topic.topic_id,
-                    "Title": topic.title,
-                    "Description": topic.description,
-                    "Level": topic.level.value,
-                    "Area": topic.area.value,
-                    "Format": topic.debate_format,
-                    "Pro_Arguments": " | ".join(topic.pro_arguments),
-                    "Con_Arguments": " | ".join(topic.con_arguments),
-                    "Background": topic.background_info,
-                    "Vocabulary": " | ".join(topic.vocabulary_list),
-                    "Time_Minutes": topic.time_estimate,
-                    "Book_Title": analysis_result.book_info.title,
-                    "Book_Author": analysis_result.book_info.author,
-                    "AR_Level": analysis_result.book_info.ar_level
-                }
-                csv_data.append(row)
+            with open(output_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+                writer.writeheader()
+                writer.writerows(self._csv_rows(analysis_result))
             
-            df = pd.DataFrame(csv_data)
-            df.to_csv(output_path, index=False, encoding='utf-8')
-            
-            logger.info(f"CSV exported to: {output_path}")
+            logger.info("CSV exported to: %s", output_path)
             return output_path
             
         except Exception as e:
-            logger.error(f"Failed to export CSV: {e}")
+            logger.error("Failed to export CSV: %s", e)
             raise
+    
+    @staticmethod
+    def _csv_rows(analysis_result: BookAnalysisResult):
+        """토론 주제를 CSV 행으로 하나씩 생성"""
+        book_info = analysis_result.book_info
+        for topic in analysis_result.debate_topics:
+            yield {
+                "Topic_ID": topic.topic_id,
+                "Title": topic.title,
+                "Description": topic.description,
+                "Level": topic.level.value,
+                "Area": topic.area.value,
+                "Format": topic.debate_format,
+                "Pro_Arguments": " | ".join(topic.pro_arguments),
+                "Con_Arguments": " | ".join(topic.con_arguments),
+                "Background": topic.background_info,
+                "Vocabulary": " | ".join(topic.vocabulary_list),
+                "Time_Minutes": topic.time_estimate,
+                "Book_Title": book_info.title,
+                "Book_Author": book_info.author,
+                "AR_Level": book_info.ar_level
+            }
 
 # 사용 예시 및 테스트 함수
 async def test_book_analyzer():
@@ -488,4 +884,5 @@ async def test_book_analyzer():
         print(f"Error during analysis: {e}")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(test_book_analyzer())
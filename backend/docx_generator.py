@@ -3,20 +3,31 @@
 CSV 데이터를 입력받아 출판 수준의 완전한 DOCX 교재를 생성하는 모듈
 """
 
+import io
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
 from docx import Document
-from docx.shared import Inches, Pt, RGBColor
+from docx.shared import Emu, Inches, Length, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_BREAK
 from docx.enum.style import WD_STYLE_TYPE
-from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.oxml.shared import OxmlElement, qn
 from docx.oxml.ns import nsdecls
 from docx.oxml import parse_xml
+from docx.opc.pkgwriter import PackageWriter
 from datetime import datetime
 import json
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+import re
+from xml.sax.saxutils import escape
+from copy import deepcopy
+from zipfile import ZIP_DEFLATED, ZipFile
+from lxml import etree
+from typing import Callable, Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
 
@@ -24,13 +35,136 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 교재 생성에 필요한 CSV 컬럼
+REQUIRED_COLUMNS = (
+    'Topic_ID', 'Title', 'Description', 'Level', 'Area', 'Format',
+    'Pro_Arguments', 'Con_Arguments', 'Background', 'Vocabulary', 'Time_Minutes'
+)
+
+# 필수 컬럼은 타입 추론 없이 문자열로 읽음 (빈 값은 null)
+_CSV_CONVERT_OPTIONS = pa_csv.ConvertOptions(
+    column_types={col: pa.string() for col in REQUIRED_COLUMNS},
+    strings_can_be_null=True
+)
+_CSV_READ_OPTIONS = pa_csv.ReadOptions(use_threads=True, block_size=1 << 20)
+
+# 챕터 수가 이 값 이상일 때만 챕터를 프로세스 풀에서 렌더링 (작은 교재는 프로세스 기동 비용이 더 큼)
+PARALLEL_CHAPTER_THRESHOLD = int(os.getenv("PASCAL_PARALLEL_CHAPTERS", "32"))
+
+# DOCX(zip) 압축 수준 (기본 6 대비 deflate CPU 시간이 크게 줄고 크기 차이는 작음)
+DOCX_COMPRESSLEVEL = 1
+
+def _has_text(column: pd.Series) -> pd.Series:
+    """CSV 컬럼 값이 비어 있지 않은 문자열인지 행별로 확인 (빈 칸은 None으로 읽힘)"""
+    return column.fillna('').str.strip() != ''
+
+def _numbered(items) -> List[str]:
+    """항목 앞에 '1. ', '2. ' 형식의 번호를 붙인 문자열 목록"""
+    return [f'{i}. {item}' for i, item in enumerate(items, 1)]
+
+def _split_items(column: pd.Series) -> pd.Series:
+    """'|'로 구분된 컬럼을 행별 항목 리스트로 분리 (빈 칸은 빈 리스트)"""
+    items = column.where(_has_text(column)).str.split('|')
+    return items.map(lambda parts: [part.strip() for part in parts] if isinstance(parts, list) else [])
+
+class _ZipPkgWriter:
+    """압축 수준을 지정할 수 있는 OPC zip 작성기 (python-docx의 PhysPkgWriter와 같은 인터페이스)"""
+    
+    def __init__(self, pkg_file, compresslevel: int):
+        self._zipf = ZipFile(pkg_file, 'w', compression=ZIP_DEFLATED, compresslevel=compresslevel)
+    
+    def write(self, pack_uri, blob: bytes):
+        self._zipf.writestr(pack_uri.membername, blob)
+    
+    def close(self):
+        self._zipf.close()
+
+def _save_document(document, pkg_file, compresslevel: int = DOCX_COMPRESSLEVEL):
+    """Document.save와 같은 파트 구성으로 저장하되 zip 압축 수준만 낮춤"""
+    package = document.part.package
+    parts = list(package.iter_parts())
+    for part in parts:
+        part.before_marshal()
+    
+    writer = _ZipPkgWriter(pkg_file, compresslevel)
+    try:
+        PackageWriter._write_content_types_stream(writer, parts)
+        PackageWriter._write_pkg_rels(writer, package.rels)
+        PackageWriter._write_parts(writer, parts)
+    finally:
+        writer.close()
+
 class EducationLevel(str, Enum):
     """교육 레벨 정의"""
     PREPARATION = "preparation"
     REGULAR = "regular"
     MASTERY = "mastery"
 
-@dataclass
+# 자주 쓰는 길이 값 (Length는 불변이므로 모듈에서 한 번만 생성해 공유)
+_INCH = {value: Inches(value) for value in (0.25, 0.5, 1, 8.5, 11)}
+_PT = {value: Pt(value) for value in (6, 10, 11, 12, 14, 16, 18, 20, 24)}
+
+# 문서 스타일 정의
+# (이름, 글자 크기, 굵게, 테마 색상, 정렬, 앞 간격, 뒤 간격, 줄 간격)
+_STYLE_SPECS = (
+    ('Custom Title', 24, True, 'primary', WD_ALIGN_PARAGRAPH.CENTER, None, 12, None),      # 제목
+    ('Custom Subtitle', 18, True, 'secondary', WD_ALIGN_PARAGRAPH.CENTER, None, 10, None), # 부제목
+    ('Chapter Title', 20, True, 'primary', None, 24, 12, None),                            # 챕터 제목
+    ('Section Title', 16, True, 'accent', None, 12, 6, None),                              # 섹션 제목
+    ('Custom Body', 11, False, 'text', None, None, 6, 1.15),                               # 본문
+)
+
+# 스타일 이름 → styleId (python-docx는 공백을 제거해 styleId를 만듦)
+_STYLE_IDS = {spec[0]: spec[0].replace(' ', '') for spec in _STYLE_SPECS}
+
+# python-docx가 탭/줄바꿈을 <w:tab/>, <w:br/>로 바꾸는 문자 (빠른 경로에서 제외)
+_RUN_CONTROL_CHARS = re.compile(r'[\t\n\r]')
+
+_W_PPR = qn('w:pPr')
+_W_PSTYLE = qn('w:pStyle')
+_W_SPACING = qn('w:spacing')
+_W_IND = qn('w:ind')
+_W_R = qn('w:r')
+_W_RPR = qn('w:rPr')
+_W_B = qn('w:b')
+_W_COLOR = qn('w:color')
+_W_T = qn('w:t')
+_W_VAL = qn('w:val')
+_W_AFTER = qn('w:after')
+_W_LEFT = qn('w:left')
+_W_FIRST_LINE = qn('w:firstLine')
+_XML_SPACE = qn('xml:space')
+
+def _t_xml(text: str) -> str:
+    """run 안의 <w:t> XML (python-docx처럼 앞뒤 공백이 있으면 xml:space 지정, 빈 문자열은 생략)"""
+    if not text:
+        return ''
+    if len(text.strip()) < len(text):
+        return f'<w:t xml:space="preserve">{escape(text)}</w:t>'
+    return f'<w:t>{escape(text)}</w:t>'
+
+def _table_xml(cells: List[Tuple[str, bool]], cols: int, col_twips: int, centered: bool = False) -> str:
+    """(텍스트, 굵게) 셀 목록을 행 우선으로 채운 'Table Grid' 표 XML 생성
+    
+    add_table 후 셀마다 run을 넣은 것과 같은 구조 (남는 칸은 빈 단락)
+    """
+    tc_pr = f'<w:tcPr><w:tcW w:type="dxa" w:w="{col_twips}"/></w:tcPr>'
+    tcs = [
+        f'<w:tc>{tc_pr}<w:p><w:r>{"<w:rPr><w:b/></w:rPr>" if bold else ""}{_t_xml(text)}</w:r></w:p></w:tc>'
+        for text, bold in cells
+    ]
+    tcs.extend([f'<w:tc>{tc_pr}<w:p/></w:tc>'] * (-len(tcs) % cols))
+    rows = ''.join(f"<w:tr>{''.join(tcs[i:i + cols])}</w:tr>" for i in range(0, len(tcs), cols))
+    grid = f'<w:gridCol w:w="{col_twips}"/>' * cols
+    jc = '<w:jc w:val="center"/>' if centered else ''
+    return (
+        f'<w:tbl {nsdecls("w")}><w:tblPr><w:tblStyle w:val="TableGrid"/><w:tblW w:type="auto" w:w="0"/>{jc}'
+        '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+        'w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr>'
+        f'<w:tblGrid>{grid}</w:tblGrid>{rows}</w:tbl>'
+    )
+
+@dataclass(frozen=True)
 class ColorTheme:
     """색상 테마 정의"""
     primary: str
@@ -42,30 +176,32 @@ class ColorTheme:
     @classmethod
     def get_theme(cls, level: EducationLevel) -> 'ColorTheme':
         """레벨별 색상 테마 반환"""
-        themes = {
-            EducationLevel.PREPARATION: cls(
-                primary="#4A90E2",      # 밝은 파란색
-                secondary="#7ED321",    # 연두색
-                accent="#F5A623",       # 주황색
-                text="#333333",         # 진한 회색
-                background="#F8F9FA"    # 연한 회색
-            ),
-            EducationLevel.REGULAR: cls(
-                primary="#5856D6",      # 보라색
-                secondary="#34C759",    # 초록색
-                accent="#FF9500",       # 주황색
-                text="#1D1D1F",         # 검은색
-                background="#FFFFFF"    # 흰색
-            ),
-            EducationLevel.MASTERY: cls(
-                primary="#1D1D1F",      # 검은색
-                secondary="#8E8E93",    # 회색
-                accent="#FF3B30",       # 빨간색
-                text="#000000",         # 검은색
-                background="#F2F2F7"    # 연한 회색
-            )
-        }
-        return themes[level]
+        return _THEMES[level]
+
+# 레벨별 색상 테마 (불변 인스턴스를 문서 간에 공유)
+_THEMES = {
+    EducationLevel.PREPARATION: ColorTheme(
+        primary="#4A90E2",      # 밝은 파란색
+        secondary="#7ED321",    # 연두색
+        accent="#F5A623",       # 주황색
+        text="#333333",         # 진한 회색
+        background="#F8F9FA"    # 연한 회색
+    ),
+    EducationLevel.REGULAR: ColorTheme(
+        primary="#5856D6",      # 보라색
+        secondary="#34C759",    # 초록색
+        accent="#FF9500",       # 주황색
+        text="#1D1D1F",         # 검은색
+        background="#FFFFFF"    # 흰색
+    ),
+    EducationLevel.MASTERY: ColorTheme(
+        primary="#1D1D1F",      # 검은색
+        secondary="#8E8E93",    # 회색
+        accent="#FF3B30",       # 빨간색
+        text="#000000",         # 검은색
+        background="#F2F2F7"    # 연한 회색
+    )
+}
 
 @dataclass
 class DocumentSettings:
@@ -80,13 +216,146 @@ class DocumentSettings:
     ar_level: float
     creation_date: datetime
     
+# 레벨별 표지 표시
+_LEVEL_DESIGNS = {
+    EducationLevel.PREPARATION: "🌱 기초 단계",
+    EducationLevel.REGULAR: "🌿 발전 단계", 
+    EducationLevel.MASTERY: "🌳 숙달 단계"
+}
+
+# 레벨별 서문 내용
+_LEVEL_PREFACE_TEXT = {
+    EducationLevel.PREPARATION: """
+            이 교재는 영어 원서를 통한 토론 학습의 첫 걸음을 위해 제작되었습니다. 
+            기초 단계 학습자들이 영어로 자신의 생각을 표현하고 다른 사람의 의견을 듣는 
+            경험을 통해 영어 실력과 사고력을 동시에 기를 수 있도록 구성되었습니다.
+            
+            각 챕터는 명확한 구조와 충분한 지원을 제공하여 학습자가 안전하고 
+            자신감 있게 토론에 참여할 수 있도록 돕습니다.
+            """,
+    EducationLevel.REGULAR: """
+            이 교재는 영어 토론 실력을 한 단계 발전시키고자 하는 학습자들을 위해 
+            제작되었습니다. 기본적인 토론 기술을 바탕으로 더 깊이 있는 분석과 
+            비판적 사고를 기를 수 있도록 구성되었습니다.
+            
+            다양한 관점을 고려하고 논리적으로 자신의 주장을 펼치는 능력을 
+            기르는 것이 이 교재의 주요 목표입니다.
+            """,
+    EducationLevel.MASTERY: """
+            이 교재는 고급 수준의 영어 토론 능력을 완성하고자 하는 학습자들을 위해 
+            제작되었습니다. 복잡한 주제에 대한 독립적인 분석과 창의적인 사고를 
+            통해 세계적 수준의 토론 실력을 기를 수 있도록 구성되었습니다.
+            
+            학습자는 이 교재를 통해 글로벌 무대에서 당당히 소통할 수 있는 
+            역량을 갖추게 될 것입니다.
+            """
+}
+
+# 서문은 문단 단위로 미리 나눠 둠
+_LEVEL_PREFACES = {
+    level: tuple(paragraph.strip() for paragraph in text.strip().split('\n\n') if paragraph.strip())
+    for level, text in _LEVEL_PREFACE_TEXT.items()
+}
+
+# 교재 사용법 안내
+_USAGE_STEPS = (
+    "1. 각 챕터의 배경 정보를 먼저 읽어보세요.",
+    "2. 핵심 어휘를 학습하고 예문을 확인하세요.",
+    "3. 토론 주제에 대해 찬반 양쪽 입장을 고려해보세요.",
+    "4. 동료들과 함께 토론을 진행하세요.",
+    "5. 토론 후 성찰 활동을 통해 학습을 정리하세요."
+)
+
+# 레벨별 토론 가이드
+_LEVEL_GUIDES = {
+    EducationLevel.PREPARATION: (
+        "1. 팀을 나누어 찬성팀과 반대팀을 구성합니다.",
+        "2. 각 팀은 5분간 논거를 정리합니다.",
+        "3. 찬성팀이 먼저 2분간 주장을 발표합니다.",
+        "4. 반대팀이 2분간 주장을 발표합니다.",
+        "5. 각 팀이 1분씩 반박 기회를 가집니다.",
+        "6. 마지막으로 각 팀이 1분씩 최종 발언을 합니다."
+    ),
+    EducationLevel.REGULAR: (
+        "1. 팀을 구성하고 역할을 분담합니다.",
+        "2. 각 팀은 7분간 전략을 수립합니다.",
+        "3. 개회사와 주제 소개 (2분)",
+        "4. 찬성팀 주장 발표 (3분)",
+        "5. 반대팀 주장 발표 (3분)",
+        "6. 교차 질의 시간 (각 팀 2분씩)",
+        "7. 반박 및 재반박 (각 팀 2분씩)",
+        "8. 최종 발언 (각 팀 1분씩)"
+    ),
+    EducationLevel.MASTERY: (
+        "1. 독립적인 연구와 준비 시간 (10분)",
+        "2. 자유로운 토론 형식으로 진행",
+        "3. 사회자가 토론을 조율하며 진행",
+        "4. 논리적 근거와 반박에 중점",
+        "5. 창의적 해결방안 모색",
+        "6. 종합적 결론 도출"
+    )
+}
+
+# 레벨별 글쓰기 가이드
+_LEVEL_WRITING = {
+    EducationLevel.PREPARATION: {
+        "word_count": "150-200단어",
+        "time": "30분",
+        "structure": (
+            "도입: 주제 소개와 자신의 입장 (2-3문장)",
+            "본론: 두 가지 근거와 설명 (각 3-4문장)",
+            "결론: 입장 재확인과 마무리 (2-3문장)"
+        )
+    },
+    EducationLevel.REGULAR: {
+        "word_count": "250-300단어",
+        "time": "40분",
+        "structure": (
+            "도입: 주제의 중요성과 논제 제시",
+            "본론 1: 첫 번째 근거와 구체적 예시",
+            "본론 2: 두 번째 근거와 반대 의견 고려",
+            "결론: 논거 요약과 함의 제시"
+        )
+    },
+    EducationLevel.MASTERY: {
+        "word_count": "400-500단어",
+        "time": "50분",
+        "structure": (
+            "도입: 문제 제기와 논제의 복잡성 인식",
+            "본론: 다각적 분석과 비판적 평가",
+            "반박: 상대방 입장 고려와 재반박",
+            "결론: 종합적 판단과 미래 전망"
+        )
+    }
+}
+
+# 레벨별 스타일/페이지 설정을 마친 빈 문서 (zip 바이트)
+_PROTOTYPES: Dict[EducationLevel, bytes] = {}
+
+# 레벨별로 내용이 고정된 섹션의 XML 조각 (처음 한 번 생성한 뒤 복제해서 사용)
+_STATIC_SECTIONS: Dict[Tuple[str, EducationLevel], Tuple[Any, ...]] = {}
+
+# 챕터 성찰 질문 (번호 포함)
+_REFLECTION_QUESTIONS = tuple(_numbered((
+    "이번 토론에서 가장 인상 깊었던 논거는 무엇인가요?",
+    "상대방의 의견 중 고려해볼 만한 점이 있었나요?",
+    "자신의 주장을 더 효과적으로 전달하려면 어떻게 해야 할까요?",
+    "이 주제와 관련하여 더 알아보고 싶은 것이 있나요?",
+    "오늘 학습한 어휘 중 가장 유용하다고 생각하는 단어는 무엇인가요?"
+)))
+
 class DOCXGenerator:
     """DOCX 교재 생성 클래스"""
     
-    def __init__(self):
+    def __init__(self, chapter_workers: Optional[int] = None):
         self.document = None
         self.color_theme = None
         self.settings = None
+        self._rgb: Dict[str, RGBColor] = {}
+        # add_table과 같은 방식으로 표 열 너비를 나누기 위한 본문 폭
+        self._block_width = Emu(0)
+        # 챕터 렌더링 프로세스 수 (None이면 CPU 수, 1 이하면 순차 생성)
+        self.chapter_workers = chapter_workers
         
     def generate_textbook(
         self, 
@@ -122,8 +391,11 @@ class DOCXGenerator:
         # 8. 평가 기준 생성
         self._create_assessment_criteria()
         
-        # 9. 문서 저장
-        self.document.save(output_path)
+        # 9. 문서 저장 (메모리에서 zip을 완성한 뒤 한 번에 기록)
+        buffer = io.BytesIO()
+        _save_document(self.document, buffer)
+        with open(output_path, 'wb') as f:
+            f.write(buffer.getbuffer())
         
         logger.info(f"Textbook generated successfully: {output_path}")
         return output_path
@@ -131,18 +403,18 @@ class DOCXGenerator:
     def _load_and_validate_csv(self, csv_path: str) -> pd.DataFrame:
         """CSV 파일 로드 및 검증"""
         try:
-            df = pd.read_csv(csv_path, encoding='utf-8')
+            table = pa_csv.read_csv(
+                csv_path,
+                read_options=_CSV_READ_OPTIONS,
+                convert_options=_CSV_CONVERT_OPTIONS
+            )
             
             # 필수 컬럼 확인
-            required_columns = [
-                'Topic_ID', 'Title', 'Description', 'Level', 'Area', 'Format',
-                'Pro_Arguments', 'Con_Arguments', 'Background', 'Vocabulary', 'Time_Minutes'
-            ]
-            
-            missing_columns = [col for col in required_columns if col not in df.columns]
+            missing_columns = set(REQUIRED_COLUMNS) - set(table.schema.names)
             if missing_columns:
-                raise ValueError(f"Missing required columns: {missing_columns}")
+                raise ValueError(f"Missing required columns: {sorted(missing_columns)}")
             
+            df = table.to_pandas()
             logger.info(f"CSV loaded successfully with {len(df)} topics")
             return df
             
@@ -152,131 +424,170 @@ class DOCXGenerator:
     
     def _initialize_document(self, settings: DocumentSettings):
         """문서 초기화"""
-        self.document = Document()
         self.settings = settings
         self.color_theme = ColorTheme.get_theme(settings.level)
+        # 테마 색상은 문서마다 한 번만 RGBColor로 변환
+        self._rgb = {name: RGBColor.from_string(value.lstrip('#')) for name, value in asdict(self.color_theme).items()}
+        
+        # 스타일/페이지 설정이 끝난 레벨별 원본 문서에서 시작
+        prototype = _PROTOTYPES.get(settings.level)
+        if prototype is None:
+            prototype = _PROTOTYPES[settings.level] = self._build_prototype()
+        self.document = Document(io.BytesIO(prototype))
+        
+        section = self.document.sections[0]
+        self._block_width = Emu(section.page_width - section.left_margin - section.right_margin)
         
         # 문서 속성 설정
         self.document.core_properties.title = settings.title
         self.document.core_properties.author = settings.author
         self.document.core_properties.subject = f"Pascal Debate Textbook - {settings.level.value.title()}"
         self.document.core_properties.created = settings.creation_date
-        
-        # 기본 스타일 설정
+    
+    def _build_prototype(self) -> bytes:
+        """기본 스타일과 페이지 설정만 적용한 빈 문서를 zip 바이트로 생성 (압축 없음)"""
+        self.document = Document()
         self._setup_styles()
-        
-        # 페이지 설정
         self._setup_page_layout()
+        
+        buffer = io.BytesIO()
+        _save_document(self.document, buffer, compresslevel=0)
+        return buffer.getvalue()
     
     def _setup_styles(self):
         """문서 스타일 설정"""
         styles = self.document.styles
+        existing = {style.name for style in styles}
         
-        # 제목 스타일
-        if 'Custom Title' not in [style.name for style in styles]:
-            title_style = styles.add_style('Custom Title', WD_STYLE_TYPE.PARAGRAPH)
-            title_font = title_style.font
-            title_font.name = 'Arial'
-            title_font.size = Pt(24)
-            title_font.bold = True
-            title_font.color.rgb = RGBColor.from_string(self.color_theme.primary.replace('#', ''))
-            title_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            title_style.paragraph_format.space_after = Pt(12)
-        
-        # 부제목 스타일
-        if 'Custom Subtitle' not in [style.name for style in styles]:
-            subtitle_style = styles.add_style('Custom Subtitle', WD_STYLE_TYPE.PARAGRAPH)
-            subtitle_font = subtitle_style.font
-            subtitle_font.name = 'Arial'
-            subtitle_font.size = Pt(18)
-            subtitle_font.bold = True
-            subtitle_font.color.rgb = RGBColor.from_string(self.color_theme.secondary.replace('#', ''))
-            subtitle_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            subtitle_style.paragraph_format.space_after = Pt(10)
-        
-        # 챕터 제목 스타일
-        if 'Chapter Title' not in [style.name for style in styles]:
-            chapter_style = styles.add_style('Chapter Title', WD_STYLE_TYPE.PARAGRAPH)
-            chapter_font = chapter_style.font
-            chapter_font.name = 'Arial'
-            chapter_font.size = Pt(20)
-            chapter_font.bold = True
-            chapter_font.color.rgb = RGBColor.from_string(self.color_theme.primary.replace('#', ''))
-            chapter_style.paragraph_format.space_before = Pt(24)
-            chapter_style.paragraph_format.space_after = Pt(12)
-        
-        # 섹션 제목 스타일
-        if 'Section Title' not in [style.name for style in styles]:
-            section_style = styles.add_style('Section Title', WD_STYLE_TYPE.PARAGRAPH)
-            section_font = section_style.font
-            section_font.name = 'Arial'
-            section_font.size = Pt(16)
-            section_font.bold = True
-            section_font.color.rgb = RGBColor.from_string(self.color_theme.accent.replace('#', ''))
-            section_style.paragraph_format.space_before = Pt(12)
-            section_style.paragraph_format.space_after = Pt(6)
-        
-        # 본문 스타일
-        if 'Custom Body' not in [style.name for style in styles]:
-            body_style = styles.add_style('Custom Body', WD_STYLE_TYPE.PARAGRAPH)
-            body_font = body_style.font
-            body_font.name = 'Arial'
-            body_font.size = Pt(11)
-            body_font.color.rgb = RGBColor.from_string(self.color_theme.text.replace('#', ''))
-            body_style.paragraph_format.space_after = Pt(6)
-            body_style.paragraph_format.line_spacing = 1.15
+        for name, size, bold, color, alignment, space_before, space_after, line_spacing in _STYLE_SPECS:
+            if name in existing:
+                continue
+            style = styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+            existing.add(name)
+            
+            font = style.font
+            font.name = 'Arial'
+            font.size = _PT[size]
+            if bold:
+                font.bold = True
+            font.color.rgb = self._rgb[color]
+            
+            paragraph_format = style.paragraph_format
+            if alignment is not None:
+                paragraph_format.alignment = alignment
+            if space_before is not None:
+                paragraph_format.space_before = _PT[space_before]
+            paragraph_format.space_after = _PT[space_after]
+            if line_spacing is not None:
+                paragraph_format.line_spacing = line_spacing
+    
+    def _fast_para(self, body_el, text: str, style: str = 'Custom Body',
+                   left_indent: Optional[Length] = None, first_line_indent: Optional[Length] = None,
+                   space_after: Optional[Length] = None, bold: bool = False,
+                   color: Optional[RGBColor] = None):
+        """단락을 lxml로 body_el에 직접 추가 (add_paragraph + 서식 설정과 같은 XML을 한 번에 생성)"""
+        if _RUN_CONTROL_CHARS.search(text):
+            para = self.document.add_paragraph(text, style=style)
+            paragraph_format = para.paragraph_format
+            if space_after is not None:
+                paragraph_format.space_after = space_after
+            if left_indent is not None:
+                paragraph_format.left_indent = left_indent
+            if first_line_indent is not None:
+                paragraph_format.first_line_indent = first_line_indent
+            for run in para.runs:
+                if bold:
+                    run.font.bold = True
+                if color is not None:
+                    run.font.color.rgb = color
+            return
+        
+        p = body_el.add_p()
+        p_pr = etree.SubElement(p, _W_PPR)
+        etree.SubElement(p_pr, _W_PSTYLE).set(_W_VAL, _STYLE_IDS[style])
+        if space_after is not None:
+            etree.SubElement(p_pr, _W_SPACING).set(_W_AFTER, str(space_after.twips))
+        if left_indent is not None or first_line_indent is not None:
+            ind = etree.SubElement(p_pr, _W_IND)
+            if left_indent is not None:
+                ind.set(_W_LEFT, str(left_indent.twips))
+            if first_line_indent is not None:
+                ind.set(_W_FIRST_LINE, str(first_line_indent.twips))
+        
+        r = etree.SubElement(p, _W_R)
+        if bold or color is not None:
+            r_pr = etree.SubElement(r, _W_RPR)
+            if bold:
+                etree.SubElement(r_pr, _W_B)
+            if color is not None:
+                etree.SubElement(r_pr, _W_COLOR).set(_W_VAL, str(color))
+        t = etree.SubElement(r, _W_T)
+        t.text = text
+        if len(text.strip()) < len(text):
+            t.set(_XML_SPACE, 'preserve')
+    
+    def _add_static_section(self, body_el, name: str, build: Callable[[Any], None]):
+        """고정 섹션을 캐시된 XML 조각에서 복제해 추가 (없으면 build로 생성 후 캐시)"""
+        key = (name, self.settings.level)
+        fragment = _STATIC_SECTIONS.get(key)
+        if fragment is None:
+            start = len(body_el) - 1  # sectPr 바로 앞
+            build(body_el)
+            _STATIC_SECTIONS[key] = tuple(deepcopy(el) for el in body_el[start:-1])
+            return
+        
+        sect_pr = body_el.sectPr
+        for el in fragment:
+            sect_pr.addprevious(deepcopy(el))
+    
+    def _add_table(self, body_el, cells: List[Tuple[str, bool]], cols: int, centered: bool = False):
+        """(텍스트, 굵게) 셀 목록을 격자 표로 추가 (표 전체 XML을 한 번에 파싱)"""
+        col_twips = Emu(self._block_width // cols).twips
+        tbl = parse_xml(_table_xml(cells, cols, col_twips, centered))
+        if any(_RUN_CONTROL_CHARS.search(text) for text, _ in cells):
+            # 탭/줄바꿈은 python-docx의 run 텍스트 처리(<w:tab/>, <w:br/>)에 맡김
+            for run, (text, _) in zip(tbl.iter(_W_R), cells):
+                run.text = text
+        body_el.sectPr.addprevious(tbl)
     
     def _setup_page_layout(self):
         """페이지 레이아웃 설정"""
         section = self.document.sections[0]
-        section.page_width = Inches(8.5)
-        section.page_height = Inches(11)
-        section.left_margin = Inches(1)
-        section.right_margin = Inches(1)
-        section.top_margin = Inches(1)
-        section.bottom_margin = Inches(1)
+        section.page_width = _INCH[8.5]
+        section.page_height = _INCH[11]
+        section.left_margin = _INCH[1]
+        section.right_margin = _INCH[1]
+        section.top_margin = _INCH[1]
+        section.bottom_margin = _INCH[1]
     
     def _create_cover_page(self):
         """표지 생성"""
-        # 레벨별 표지 디자인
-        level_designs = {
-            EducationLevel.PREPARATION: "🌱 기초 단계",
-            EducationLevel.REGULAR: "🌿 발전 단계", 
-            EducationLevel.MASTERY: "🌳 숙달 단계"
-        }
-        
         # 메인 제목
-        title_para = self.document.add_paragraph()
-        title_para.style = 'Custom Title'
-        title_run = title_para.runs[0] if title_para.runs else title_para.add_run()
-        title_run.text = self.settings.title
+        self.document.add_paragraph(style='Custom Title').add_run(self.settings.title)
         
         # 부제목
-        subtitle_para = self.document.add_paragraph()
-        subtitle_para.style = 'Custom Subtitle'
-        subtitle_run = subtitle_para.runs[0] if subtitle_para.runs else subtitle_para.add_run()
-        subtitle_run.text = self.settings.subtitle
+        self.document.add_paragraph(style='Custom Subtitle').add_run(self.settings.subtitle)
         
         # 레벨 표시
         level_para = self.document.add_paragraph()
         level_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        level_run = level_para.add_run(level_designs[self.settings.level])
-        level_run.font.size = Pt(16)
+        level_run = level_para.add_run(_LEVEL_DESIGNS[self.settings.level])
+        level_run.font.size = _PT[16]
         level_run.font.bold = True
-        level_run.font.color.rgb = RGBColor.from_string(self.color_theme.accent.replace('#', ''))
+        level_run.font.color.rgb = self._rgb['accent']
         
         # 원서 정보
         self.document.add_paragraph()  # 공백
         book_para = self.document.add_paragraph()
         book_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         book_run = book_para.add_run(f'Based on "{self.settings.book_title}" by {self.settings.book_author}')
-        book_run.font.size = Pt(14)
+        book_run.font.size = _PT[14]
         book_run.font.italic = True
         
         ar_para = self.document.add_paragraph()
         ar_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         ar_run = ar_para.add_run(f'AR Level: {self.settings.ar_level}')
-        ar_run.font.size = Pt(12)
+        ar_run.font.size = _PT[12]
         
         # 기관 정보
         self.document.add_paragraph()  # 공백
@@ -285,154 +596,123 @@ class DOCXGenerator:
         institution_para = self.document.add_paragraph()
         institution_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         institution_run = institution_para.add_run(self.settings.institution)
-        institution_run.font.size = Pt(14)
+        institution_run.font.size = _PT[14]
         institution_run.font.bold = True
         
         author_para = self.document.add_paragraph()
         author_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         author_run = author_para.add_run(f'작성자: {self.settings.author}')
-        author_run.font.size = Pt(12)
+        author_run.font.size = _PT[12]
         
         date_para = self.document.add_paragraph()
         date_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         date_run = date_para.add_run(self.settings.creation_date.strftime('%Y년 %m월 %d일'))
-        date_run.font.size = Pt(12)
+        date_run.font.size = _PT[12]
         
         # 페이지 나누기
         self.document.add_page_break()
     
     def _create_table_of_contents(self, df: pd.DataFrame):
         """목차 생성"""
-        toc_title = self.document.add_paragraph()
-        toc_title.style = 'Chapter Title'
-        toc_title.add_run('목차')
+        body_el = self.document.element.body
+        self._fast_para(body_el, '목차', style='Chapter Title')
         
         # 서문
-        toc_item = self.document.add_paragraph('서문', style='Custom Body')
-        toc_item.paragraph_format.left_indent = Inches(0.25)
+        self._fast_para(body_el, '서문', left_indent=_INCH[0.25])
         
         # 각 챕터
-        for idx, row in df.iterrows():
-            chapter_num = idx + 1
-            toc_item = self.document.add_paragraph(
-                f'Chapter {chapter_num}: {row["Title"]}', 
-                style='Custom Body'
-            )
-            toc_item.paragraph_format.left_indent = Inches(0.25)
+        for chapter_num, title in enumerate(df['Title'].tolist(), 1):
+            self._fast_para(body_el, f'Chapter {chapter_num}: {title}', left_indent=_INCH[0.25])
         
         # 부록
-        toc_item = self.document.add_paragraph('부록 A: 전체 어휘 목록', style='Custom Body')
-        toc_item.paragraph_format.left_indent = Inches(0.25)
-        
-        toc_item = self.document.add_paragraph('부록 B: 평가 기준', style='Custom Body')
-        toc_item.paragraph_format.left_indent = Inches(0.25)
+        self._fast_para(body_el, '부록 A: 전체 어휘 목록', left_indent=_INCH[0.25])
+        self._fast_para(body_el, '부록 B: 평가 기준', left_indent=_INCH[0.25])
         
         self.document.add_page_break()
     
     def _create_preface(self):
         """서문 생성"""
-        preface_title = self.document.add_paragraph()
-        preface_title.style = 'Chapter Title'
-        preface_title.add_run('서문')
-        
-        # 레벨별 서문 내용
-        level_prefaces = {
-            EducationLevel.PREPARATION: """
-            이 교재는 영어 원서를 통한 토론 학습의 첫 걸음을 위해 제작되었습니다. 
-            기초 단계 학습자들이 영어로 자신의 생각을 표현하고 다른 사람의 의견을 듣는 
-            경험을 통해 영어 실력과 사고력을 동시에 기를 수 있도록 구성되었습니다.
-            
-            각 챕터는 명확한 구조와 충분한 지원을 제공하여 학습자가 안전하고 
-            자신감 있게 토론에 참여할 수 있도록 돕습니다.
-            """,
-            EducationLevel.REGULAR: """
-            이 교재는 영어 토론 실력을 한 단계 발전시키고자 하는 학습자들을 위해 
-            제작되었습니다. 기본적인 토론 기술을 바탕으로 더 깊이 있는 분석과 
-            비판적 사고를 기를 수 있도록 구성되었습니다.
-            
-            다양한 관점을 고려하고 논리적으로 자신의 주장을 펼치는 능력을 
-            기르는 것이 이 교재의 주요 목표입니다.
-            """,
-            EducationLevel.MASTERY: """
-            이 교재는 고급 수준의 영어 토론 능력을 완성하고자 하는 학습자들을 위해 
-            제작되었습니다. 복잡한 주제에 대한 독립적인 분석과 창의적인 사고를 
-            통해 세계적 수준의 토론 실력을 기를 수 있도록 구성되었습니다.
-            
-            학습자는 이 교재를 통해 글로벌 무대에서 당당히 소통할 수 있는 
-            역량을 갖추게 될 것입니다.
-            """
-        }
+        body_el = self.document.element.body
+        self._add_static_section(body_el, 'preface', self._build_preface)
+    
+    def _build_preface(self, body_el):
+        """서문 내용 생성"""
+        self._fast_para(body_el, '서문', style='Chapter Title')
         
-        preface_content = level_prefaces[self.settings.level]
-        for paragraph in preface_content.strip().split('\n\n'):
-            if paragraph.strip():
-                p = self.document.add_paragraph(paragraph.strip(), style='Custom Body')
-                p.paragraph_format.first_line_indent = Inches(0.25)
+        for paragraph in _LEVEL_PREFACES[self.settings.level]:
+            self._fast_para(body_el, paragraph, first_line_indent=_INCH[0.25])
         
         # 사용법 안내
-        usage_title = self.document.add_paragraph()
-        usage_title.style = 'Section Title'
-        usage_title.add_run('교재 사용법')
-        
-        usage_steps = [
-            "1. 각 챕터의 배경 정보를 먼저 읽어보세요.",
-            "2. 핵심 어휘를 학습하고 예문을 확인하세요.",
-            "3. 토론 주제에 대해 찬반 양쪽 입장을 고려해보세요.",
-            "4. 동료들과 함께 토론을 진행하세요.",
-            "5. 토론 후 성찰 활동을 통해 학습을 정리하세요."
-        ]
+        self._fast_para(body_el, '교재 사용법', style='Section Title')
         
-        for step in usage_steps:
-            step_para = self.document.add_paragraph(step, style='Custom Body')
-            step_para.paragraph_format.left_indent = Inches(0.25)
+        for step in _USAGE_STEPS:
+            self._fast_para(body_el, step, left_indent=_INCH[0.25])
         
         self.document.add_page_break()
     
     def _create_chapters(self, df: pd.DataFrame):
         """각 토론 주제별 챕터 생성"""
-        for idx, row in df.iterrows():
-            chapter_num = idx + 1
-            self._create_single_chapter(chapter_num, row)
+        # 챕터별 항목 분리/빈 값 확인은 컬럼 단위로 한 번에 처리한 뒤 dict 레코드로 순회
+        rows = df.assign(
+            has_background=_has_text(df['Background']),
+            vocab_list=_split_items(df['Vocabulary']),
+            pro_list=_split_items(df['Pro_Arguments']),
+            con_list=_split_items(df['Con_Arguments'])
+        ).to_dict('records')
+        body_el = self.document.element.body
+        
+        workers = self.chapter_workers if self.chapter_workers is not None else os.cpu_count() or 1
+        if workers > 1 and len(rows) >= PARALLEL_CHAPTER_THRESHOLD:
+            # 챕터는 서로 독립적이므로 작업 프로세스에서 XML 조각으로 렌더링한 뒤 순서대로 붙임
+            sect_pr = body_el.sectPr
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                fragments = executor.map(
+                    render_chapter_xml, range(1, len(rows) + 1), rows, repeat(self.settings),
+                    chunksize=max(1, len(rows) // (workers * 4))
+                )
+                for chapter_num, fragment in enumerate(fragments, 1):
+                    for child in list(parse_xml(fragment)):
+                        sect_pr.addprevious(child)
+                    if chapter_num < len(rows):
+                        self.document.add_page_break()
+            return
+        
+        for chapter_num, row in enumerate(rows, 1):
+            self._create_single_chapter(body_el, chapter_num, row)
             
             # 마지막 챕터가 아니면 페이지 나누기
-            if idx < len(df) - 1:
+            if chapter_num < len(rows):
                 self.document.add_page_break()
     
-    def _create_single_chapter(self, chapter_num: int, row: pd.Series):
-        """단일 챕터 생성"""
+    def _create_single_chapter(self, body_el, chapter_num: int, row: Dict[str, Any]):
+        """단일 챕터 생성 (모든 섹션이 같은 body 요소에 이어서 추가됨)"""
         # 챕터 제목
-        chapter_title = self.document.add_paragraph()
-        chapter_title.style = 'Chapter Title'
-        chapter_title.add_run(f'Chapter {chapter_num}: {row["Title"]}')
+        self._fast_para(body_el, f'Chapter {chapter_num}: {row["Title"]}', style='Chapter Title')
         
         # 기본 정보 테이블
-        self._add_chapter_info_table(row)
+        self._add_chapter_info_table(body_el, row)
         
         # 배경 정보
-        self._add_background_section(row)
+        self._add_background_section(body_el, row)
         
         # 핵심 어휘
-        self._add_vocabulary_section(row)
+        self._add_vocabulary_section(body_el, row)
         
         # 토론 준비
-        self._add_debate_preparation_section(row)
+        self._add_debate_preparation_section(body_el, row)
         
         # 토론 진행
-        self._add_debate_process_section(row)
+        self._add_debate_process_section(body_el, row)
         
         # 글쓰기 활동
-        self._add_writing_activity_section(row)
+        self._add_writing_activity_section(body_el, row)
         
         # 성찰 활동
-        self._add_reflection_section(row)
+        self._add_reflection_section(body_el, row)
     
-    def _add_chapter_info_table(self, row: pd.Series):
+    def _add_chapter_info_table(self, body_el, row: Dict[str, Any]):
         """챕터 정보 테이블 추가"""
-        table = self.document.add_table(rows=5, cols=2)
-        table.style = 'Table Grid'
-        table.alignment = WD_TABLE_ALIGNMENT.CENTER
-        
-        # 테이블 내용
+        # 테이블 내용 (헤더 셀은 굵게)
         info_data = [
             ('영역', row['Area']),
             ('형식', row['Format'].replace('_', ' ').title()),
@@ -440,244 +720,126 @@ class DOCXGenerator:
             ('예상 시간', f"{row['Time_Minutes']}분"),
             ('주제 ID', row['Topic_ID'])
         ]
+        cells = []
+        for label, value in info_data:
+            cells.append((label, True))
+            cells.append((str(value), False))
         
-        for i, (label, value) in enumerate(info_data):
-            table.cell(i, 0).text = label
-            table.cell(i, 1).text = str(value)
-            
-            # 헤더 셀 스타일링
-            header_cell = table.cell(i, 0)
-            header_para = header_cell.paragraphs[0]
-            header_run = header_para.runs[0] if header_para.runs else header_para.add_run(label)
-            header_run.font.bold = True
+        self._add_table(body_el, cells, cols=2, centered=True)
         
-        self.document.add_paragraph()  # 공백
+        body_el.add_p()  # 공백
     
-    def _add_background_section(self, row: pd.Series):
+    def _add_background_section(self, body_el, row: Dict[str, Any]):
         """배경 정보 섹션 추가"""
-        bg_title = self.document.add_paragraph()
-        bg_title.style = 'Section Title'
-        bg_title.add_run('📚 배경 정보')
+        self._fast_para(body_el, '📚 배경 정보', style='Section Title')
         
         # 토론 주제 설명
-        desc_para = self.document.add_paragraph(row['Description'], style='Custom Body')
-        desc_para.paragraph_format.first_line_indent = Inches(0.25)
+        self._fast_para(body_el, row['Description'], first_line_indent=_INCH[0.25])
         
         # 배경 정보
-        if pd.notna(row['Background']) and row['Background'].strip():
-            bg_para = self.document.add_paragraph(row['Background'], style='Custom Body')
-            bg_para.paragraph_format.first_line_indent = Inches(0.25)
+        if row['has_background']:
+            self._fast_para(body_el, row['Background'], first_line_indent=_INCH[0.25])
     
-    def _add_vocabulary_section(self, row: pd.Series):
+    def _add_vocabulary_section(self, body_el, row: Dict[str, Any]):
         """핵심 어휘 섹션 추가"""
-        vocab_title = self.document.add_paragraph()
-        vocab_title.style = 'Section Title'
-        vocab_title.add_run('📝 핵심 어휘')
+        self._fast_para(body_el, '📝 핵심 어휘', style='Section Title')
         
-        if pd.notna(row['Vocabulary']) and row['Vocabulary'].strip():
-            vocab_list = [word.strip() for word in row['Vocabulary'].split('|')]
-            
-            # 어휘를 2열 테이블로 구성
-            vocab_table = self.document.add_table(rows=(len(vocab_list) + 1) // 2, cols=2)
-            vocab_table.style = 'Table Grid'
-            
-            for i, word in enumerate(vocab_list):
-                row_idx = i // 2
-                col_idx = i % 2
-                cell = vocab_table.cell(row_idx, col_idx)
-                cell.text = word
-                
-                # 어휘 스타일링
-                cell_para = cell.paragraphs[0]
-                cell_run = cell_para.runs[0] if cell_para.runs else cell_para.add_run(word)
-                cell_run.font.bold = True
+        vocab_list = row['vocab_list']
+        if vocab_list:
+            # 어휘를 굵은 글씨의 2열 테이블로 구성
+            self._add_table(body_el, [(word, True) for word in vocab_list], cols=2)
         
-        self.document.add_paragraph()  # 공백
+        body_el.add_p()  # 공백
     
-    def _add_debate_preparation_section(self, row: pd.Series):
+    def _add_debate_preparation_section(self, body_el, row: Dict[str, Any]):
         """토론 준비 섹션 추가"""
-        prep_title = self.document.add_paragraph()
-        prep_title.style = 'Section Title'
-        prep_title.add_run('🤔 토론 준비')
+        self._fast_para(body_el, '🤔 토론 준비', style='Section Title')
         
         # 찬성 논거
-        if pd.notna(row['Pro_Arguments']) and row['Pro_Arguments'].strip():
-            pro_subtitle = self.document.add_paragraph('찬성 논거:', style='Custom Body')
-            pro_subtitle.runs[0].font.bold = True
-            pro_subtitle.runs[0].font.color.rgb = RGBColor.from_string(self.color_theme.secondary.replace('#', ''))
+        if row['pro_list']:
+            self._fast_para(body_el, '찬성 논거:', bold=True, color=self._rgb['secondary'])
             
-            pro_args = [arg.strip() for arg in row['Pro_Arguments'].split('|')]
-            for i, arg in enumerate(pro_args, 1):
-                arg_para = self.document.add_paragraph(f'{i}. {arg}', style='Custom Body')
-                arg_para.paragraph_format.left_indent = Inches(0.5)
+            for line in _numbered(row['pro_list']):
+                self._fast_para(body_el, line, left_indent=_INCH[0.5])
         
         # 반대 논거
-        if pd.notna(row['Con_Arguments']) and row['Con_Arguments'].strip():
-            con_subtitle = self.document.add_paragraph('반대 논거:', style='Custom Body')
-            con_subtitle.runs[0].font.bold = True
-            con_subtitle.runs[0].font.color.rgb = RGBColor.from_string(self.color_theme.accent.replace('#', ''))
+        if row['con_list']:
+            self._fast_para(body_el, '반대 논거:', bold=True, color=self._rgb['accent'])
             
-            con_args = [arg.strip() for arg in row['Con_Arguments'].split('|')]
-            for i, arg in enumerate(con_args, 1):
-                arg_para = self.document.add_paragraph(f'{i}. {arg}', style='Custom Body')
-                arg_para.paragraph_format.left_indent = Inches(0.5)
-    
-    def _add_debate_process_section(self, row: pd.Series):
-        """토론 진행 섹션 추가"""
-        process_title = self.document.add_paragraph()
-        process_title.style = 'Section Title'
-        process_title.add_run('💬 토론 진행')
-        
-        # 레벨별 토론 가이드
-        level_guides = {
-            EducationLevel.PREPARATION: [
-                "1. 팀을 나누어 찬성팀과 반대팀을 구성합니다.",
-                "2. 각 팀은 5분간 논거를 정리합니다.",
-                "3. 찬성팀이 먼저 2분간 주장을 발표합니다.",
-                "4. 반대팀이 2분간 주장을 발표합니다.",
-                "5. 각 팀이 1분씩 반박 기회를 가집니다.",
-                "6. 마지막으로 각 팀이 1분씩 최종 발언을 합니다."
-            ],
-            EducationLevel.REGULAR: [
-                "1. 팀을 구성하고 역할을 분담합니다.",
-                "2. 각 팀은 7분간 전략을 수립합니다.",
-                "3. 개회사와 주제 소개 (2분)",
-                "4. 찬성팀 주장 발표 (3분)",
-                "5. 반대팀 주장 발표 (3분)",
-                "6. 교차 질의 시간 (각 팀 2분씩)",
-                "7. 반박 및 재반박 (각 팀 2분씩)",
-                "8. 최종 발언 (각 팀 1분씩)"
-            ],
-            EducationLevel.MASTERY: [
-                "1. 독립적인 연구와 준비 시간 (10분)",
-                "2. 자유로운 토론 형식으로 진행",
-                "3. 사회자가 토론을 조율하며 진행",
-                "4. 논리적 근거와 반박에 중점",
-                "5. 창의적 해결방안 모색",
-                "6. 종합적 결론 도출"
-            ]
-        }
-        
-        guide_steps = level_guides[self.settings.level]
-        for step in guide_steps:
-            step_para = self.document.add_paragraph(step, style='Custom Body')
-            step_para.paragraph_format.left_indent = Inches(0.25)
-    
-    def _add_writing_activity_section(self, row: pd.Series):
-        """글쓰기 활동 섹션 추가"""
-        writing_title = self.document.add_paragraph()
-        writing_title.style = 'Section Title'
-        writing_title.add_run('✍️ 글쓰기 활동')
-        
-        # 레벨별 글쓰기 가이드
-        level_writing = {
-            EducationLevel.PREPARATION: {
-                "word_count": "150-200단어",
-                "time": "30분",
-                "structure": [
-                    "도입: 주제 소개와 자신의 입장 (2-3문장)",
-                    "본론: 두 가지 근거와 설명 (각 3-4문장)",
-                    "결론: 입장 재확인과 마무리 (2-3문장)"
-                ]
-            },
-            EducationLevel.REGULAR: {
-                "word_count": "250-300단어",
-                "time": "40분",
-                "structure": [
-                    "도입: 주제의 중요성과 논제 제시",
-                    "본론 1: 첫 번째 근거와 구체적 예시",
-                    "본론 2: 두 번째 근거와 반대 의견 고려",
-                    "결론: 논거 요약과 함의 제시"
-                ]
-            },
-            EducationLevel.MASTERY: {
-                "word_count": "400-500단어",
-                "time": "50분",
-                "structure": [
-                    "도입: 문제 제기와 논제의 복잡성 인식",
-                    "본론: 다각적 분석과 비판적 평가",
-                    "반박: 상대방 입장 고려와 재반박",
-                    "결론: 종합적 판단과 미래 전망"
-                ]
-            }
-        }
+            for line in _numbered(row['con_list']):
+                self._fast_para(body_el, line, left_indent=_INCH[0.5])
+    
+    def _add_debate_process_section(self, body_el, row: Dict[str, Any]):
+        """토론 진행 섹션 추가 (레벨별로 고정된 내용)"""
+        self._add_static_section(body_el, 'debate_process', self._build_debate_process_section)
+    
+    def _build_debate_process_section(self, body_el):
+        """토론 진행 섹션 내용 생성"""
+        self._fast_para(body_el, '💬 토론 진행', style='Section Title')
+        
+        for step in _LEVEL_GUIDES[self.settings.level]:
+            self._fast_para(body_el, step, left_indent=_INCH[0.25])
+    
+    def _add_writing_activity_section(self, body_el, row: Dict[str, Any]):
+        """글쓰기 활동 섹션 추가 (레벨별로 고정된 내용)"""
+        self._add_static_section(body_el, 'writing_activity', self._build_writing_activity_section)
+    
+    def _build_writing_activity_section(self, body_el):
+        """글쓰기 활동 섹션 내용 생성"""
+        self._fast_para(body_el, '✍️ 글쓰기 활동', style='Section Title')
         
-        writing_info = level_writing[self.settings.level]
+        writing_info = _LEVEL_WRITING[self.settings.level]
         
         # 글쓰기 요구사항
-        req_para = self.document.add_paragraph(
-            f"분량: {writing_info['word_count']} | 시간: {writing_info['time']}", 
-            style='Custom Body'
-        )
-        req_para.runs[0].font.bold = True
+        self._fast_para(body_el, f"분량: {writing_info['word_count']} | 시간: {writing_info['time']}", bold=True)
         
         # 구조 가이드
-        structure_para = self.document.add_paragraph('글 구조:', style='Custom Body')
-        structure_para.runs[0].font.bold = True
+        self._fast_para(body_el, '글 구조:', bold=True)
         
         for item in writing_info['structure']:
-            item_para = self.document.add_paragraph(f'• {item}', style='Custom Body')
-            item_para.paragraph_format.left_indent = Inches(0.5)
-    
-    def _add_reflection_section(self, row: pd.Series):
-        """성찰 활동 섹션 추가"""
-        reflection_title = self.document.add_paragraph()
-        reflection_title.style = 'Section Title'
-        reflection_title.add_run('🤗 성찰 활동')
-        
-        reflection_questions = [
-            "이번 토론에서 가장 인상 깊었던 논거는 무엇인가요?",
-            "상대방의 의견 중 고려해볼 만한 점이 있었나요?",
-            "자신의 주장을 더 효과적으로 전달하려면 어떻게 해야 할까요?",
-            "이 주제와 관련하여 더 알아보고 싶은 것이 있나요?",
-            "오늘 학습한 어휘 중 가장 유용하다고 생각하는 단어는 무엇인가요?"
-        ]
+            self._fast_para(body_el, f'• {item}', left_indent=_INCH[0.5])
+    
+    def _add_reflection_section(self, body_el, row: Dict[str, Any]):
+        """성찰 활동 섹션 추가 (모든 챕터에서 같은 내용)"""
+        self._add_static_section(body_el, 'reflection', self._build_reflection_section)
+    
+    def _build_reflection_section(self, body_el):
+        """성찰 활동 섹션 내용 생성"""
+        self._fast_para(body_el, '🤗 성찰 활동', style='Section Title')
         
-        for i, question in enumerate(reflection_questions, 1):
-            q_para = self.document.add_paragraph(f'{i}. {question}', style='Custom Body')
-            q_para.paragraph_format.left_indent = Inches(0.25)
+        for question in _REFLECTION_QUESTIONS:
+            self._fast_para(body_el, question, left_indent=_INCH[0.25])
             
             # 답변 공간
-            answer_para = self.document.add_paragraph('답변: ___________________________', style='Custom Body')
-            answer_para.paragraph_format.left_indent = Inches(0.5)
-            answer_para.paragraph_format.space_after = Pt(12)
+            self._fast_para(body_el, '답변: ___________________________', left_indent=_INCH[0.5], space_after=_PT[12])
     
     def _create_appendix(self, df: pd.DataFrame):
         """부록 생성"""
         self.document.add_page_break()
         
         # 부록 A: 전체 어휘 목록
-        appendix_title = self.document.add_paragraph()
-        appendix_title.style = 'Chapter Title'
-        appendix_title.add_run('부록 A: 전체 어휘 목록')
+        self.document.add_paragraph(style='Chapter Title').add_run('부록 A: 전체 어휘 목록')
         
-        # 모든 어휘 수집
-        all_vocab = set()
-        for _, row in df.iterrows():
-            if pd.notna(row['Vocabulary']) and row['Vocabulary'].strip():
-                vocab_list = [word.strip() for word in row['Vocabulary'].split('|')]
-                all_vocab.update(vocab_list)
+        # 모든 어휘 수집 (pandas 문자열 연산으로 한 번에 분리/정리)
+        vocab = df['Vocabulary'].dropna().str.split('|').explode().str.strip()
+        vocab = vocab[vocab != '']
         
         # 알파벳 순으로 정렬
-        sorted_vocab = sorted(list(all_vocab))
+        sorted_vocab = np.sort(vocab.unique()).tolist()
         
         # 3열 테이블로 어휘 목록 생성
-        vocab_table = self.document.add_table(rows=(len(sorted_vocab) + 2) // 3, cols=3)
-        vocab_table.style = 'Table Grid'
-        
-        for i, word in enumerate(sorted_vocab):
-            row_idx = i // 3
-            col_idx = i % 3
-            cell = vocab_table.cell(row_idx, col_idx)
-            cell.text = word
+        self._add_table(self.document.element.body, [(word, False) for word in sorted_vocab], cols=3)
     
     def _create_assessment_criteria(self):
         """평가 기준 생성"""
+        body_el = self.document.element.body
+        self._add_static_section(body_el, 'assessment', self._build_assessment_criteria)
+    
+    def _build_assessment_criteria(self, body_el):
+        """평가 기준 내용 생성"""
         self.document.add_page_break()
         
-        assessment_title = self.document.add_paragraph()
-        assessment_title.style = 'Chapter Title'
-        assessment_title.add_run('부록 B: 평가 기준')
+        self.document.add_paragraph(style='Chapter Title').add_run('부록 B: 평가 기준')
         
         # 평가 영역
         criteria_areas = [
@@ -717,21 +879,14 @@ class DOCXGenerator:
         
         for criteria in criteria_areas:
             # 영역 제목
-            area_title = self.document.add_paragraph()
-            area_title.style = 'Section Title'
-            area_title.add_run(criteria["name"])
+            self.document.add_paragraph(style='Section Title').add_run(criteria["name"])
             
             # 설명
-            desc_para = self.document.add_paragraph(criteria["description"], style='Custom Body')
-            desc_para.runs[0].font.italic = True
+            self.document.add_paragraph(style='Custom Body').add_run(criteria["description"]).font.italic = True
             
             # 평가 기준 테이블
-            criteria_table = self.document.add_table(rows=5, cols=2)
-            criteria_table.style = 'Table Grid'
-            
             # 헤더
-            criteria_table.cell(0, 0).text = "수준"
-            criteria_table.cell(0, 1).text = "기준"
+            cells = [("수준", False), ("기준", False)]
             
             # 평가 수준
             levels = [
@@ -741,19 +896,35 @@ class DOCXGenerator:
                 ("개선 필요", criteria["needs_improvement"])
             ]
             
-            for i, (level, description) in enumerate(levels, 1):
-                criteria_table.cell(i, 0).text = level
-                criteria_table.cell(i, 1).text = description
-                
-                # 헤더 스타일링
-                header_cell = criteria_table.cell(i, 0)
-                header_para = header_cell.paragraphs[0]
-                header_run = header_para.runs[0] if header_para.runs else header_para.add_run(level)
-                header_run.font.bold = True
+            for level, description in levels:
+                # 헤더 셀은 굵게
+                cells.append((level, True))
+                cells.append((description, False))
+            
+            self._add_table(body_el, cells, cols=2)
             
             self.document.add_paragraph()  # 공백
 
 # 사용 예시 및 테스트 함수
+# 작업 프로세스별 챕터 렌더링용 생성기 (레벨마다 스타일/페이지 설정이 끝난 문서를 재사용)
+_chapter_generators: Dict[EducationLevel, DOCXGenerator] = {}
+
+def render_chapter_xml(chapter_num: int, row: Dict[str, Any], settings: DocumentSettings) -> bytes:
+    """단일 챕터의 body 자식 요소들을 <w:body> 조각으로 직렬화 (프로세스 풀 작업용)"""
+    generator = _chapter_generators.get(settings.level)
+    if generator is None:
+        generator = DOCXGenerator(chapter_workers=1)
+        generator._initialize_document(settings)
+        _chapter_generators[settings.level] = generator
+    
+    body_el = generator.document.element.body
+    generator._create_single_chapter(body_el, chapter_num, row)
+    
+    # sectPr를 제외한 새 요소를 조각으로 옮겨 문서 본문을 다음 챕터를 위해 비움
+    fragment = etree.Element(qn('w:body'), nsmap={'w': body_el.nsmap['w']})
+    fragment.extend(child for child in list(body_el) if child.tag != qn('w:sectPr'))
+    return etree.tostring(fragment)
+
 def test_docx_generator():
     """DOCX 생성기 테스트"""
     
@@ -4,20 +4,32 @@
 """
 
 import os
+import sys
+import csv
 import json
 import asyncio
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple, AsyncIterator, Union, Mapping
+from contextlib import aclosing
+from dataclasses import dataclass
 from enum import Enum
-import openai
-from openai import AsyncOpenAI
-import pandas as pd
-from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+import diskcache
+import httpx
+import msgspec
+import orjson
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 import logging
-from book_analyzer import BookInfo, EducationLevel, EducationArea, AreaAnalysis
+from book_analyzer import (
+    AREA_SLUGS, OPENAI_CONCURRENCY, RESPONSE_CACHE_DIR, RESPONSE_CACHE_ENABLED, is_retryable_error,
+    _json_schema_format, _strict_schema,
+    BookInfo, EducationLevel, EducationArea, AreaAnalysis
+)
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO)
+# 로깅 설정은 애플리케이션(api_server 등)에서 담당
 logger = logging.getLogger(__name__)
 
 class DebateFormat(str, Enum):
@@ -29,109 +41,43 @@ class DebateFormat(str, Enum):
     CAUSE_EFFECT = "cause_effect"
     FUTURE_PREDICTION = "future_prediction"
 
-@dataclass
-class ReadingQuestion:
-    """독해 문제"""
-    question_id: str
-    question_type: str  # "factual", "inferential", "analytical", "evaluative", "creative"
-    question_text: str
-    sample_answer: str
-    points: int
-    bloom_level: str  # "remember", "understand", "apply", "analyze", "evaluate", "create"
-
-@dataclass
-class WritingTemplate:
-    """글쓰기 템플릿"""
-    template_id: str
-    level: EducationLevel
-    structure: Dict[str, str]  # paragraph_name: template
-    word_count_target: int
-    time_limit: int  # 분 단위
-    evaluation_criteria: List[str]
-
-@dataclass
-class EducationalMaterial:
-    """교육 자료 패키지"""
-    material_id: str
-    topic_id: str
-    reading_questions: List[ReadingQuestion]
-    writing_template: WritingTemplate
-    vocabulary_exercises: List[Dict[str, Any]]
-    discussion_guide: Dict[str, Any]
-    assessment_rubric: Dict[str, Any]
-
-@dataclass
-class EnhancedDebateTopic:
-    """향상된 토론 주제 (교육 자료 포함)"""
-    topic_id: str
-    title: str
-    description: str
-    level: EducationLevel
-    area: EducationArea
-    debate_format: DebateFormat
-    
-    # 토론 구성 요소
-    opening_statement: str
-    key_arguments: Dict[str, List[str]]  # "pro", "con"
-    evidence_sources: List[str]
-    counter_arguments: Dict[str, List[str]]
-    
-    # 교육 자료
-    educational_materials: EducationalMaterial
-    
-    # 메타데이터
-    difficulty_score: float
-    time_estimate: int
-    prerequisite_knowledge: List[str]
-    learning_objectives: List[str]
+# 토론 형식별 주제 템플릿
+TOPIC_TEMPLATES = MappingProxyType({
+    DebateFormat.CHARACTER_COMPARISON: {
+        "structure": "Character A vs Character B: Who demonstrates better [value]?",
+        "focus": "Character analysis, moral values, decision-making",
+        "typical_duration": 45
+    },
+    DebateFormat.MORAL_JUDGMENT: {
+        "structure": "Is [character's action] morally justified?",
+        "focus": "Ethics, consequences, intentions, context",
+        "typical_duration": 50
+    },
+    DebateFormat.ISSUE_ANALYSIS: {
+        "structure": "How should [issue] be addressed?",
+        "focus": "Problem identification, solution evaluation, implementation",
+        "typical_duration": 60
+    },
+    DebateFormat.PROBLEM_SOLUTION: {
+        "structure": "What is the best solution to [problem]?",
+        "focus": "Critical thinking, creativity, feasibility analysis",
+        "typical_duration": 55
+    },
+    DebateFormat.CAUSE_EFFECT: {
+        "structure": "What are the main causes/effects of [phenomenon]?",
+        "focus": "Causal reasoning, evidence analysis, logical connections",
+        "typical_duration": 50
+    },
+    DebateFormat.FUTURE_PREDICTION: {
+        "structure": "What will happen if [scenario] occurs?",
+        "focus": "Prediction, scenario analysis, trend identification",
+        "typical_duration": 45
+    }
+})
 
-class TopicGenerator:
-    """토론 주제 생성 전용 클래스"""
-    
-    def __init__(self, openai_api_key: str):
-        self.client = AsyncOpenAI(api_key=openai_api_key)
-        self.topic_templates = self._load_topic_templates()
-        self.metaprompts = self._load_metaprompts()
-    
-    def _load_topic_templates(self) -> Dict[str, Any]:
-        """토론 주제 템플릿 로드"""
-        return {
-            DebateFormat.CHARACTER_COMPARISON: {
-                "structure": "Character A vs Character B: Who demonstrates better [value]?",
-                "focus": "Character analysis, moral values, decision-making",
-                "typical_duration": 45
-            },
-            DebateFormat.MORAL_JUDGMENT: {
-                "structure": "Is [character's action] morally justified?",
-                "focus": "Ethics, consequences, intentions, context",
-                "typical_duration": 50
-            },
-            DebateFormat.ISSUE_ANALYSIS: {
-                "structure": "How should [issue] be addressed?",
-                "focus": "Problem identification, solution evaluation, implementation",
-                "typical_duration": 60
-            },
-            DebateFormat.PROBLEM_SOLUTION: {
-                "structure": "What is the best solution to [problem]?",
-                "focus": "Critical thinking, creativity, feasibility analysis",
-                "typical_duration": 55
-            },
-            DebateFormat.CAUSE_EFFECT: {
-                "structure": "What are the main causes/effects of [phenomenon]?",
-                "focus": "Causal reasoning, evidence analysis, logical connections",
-                "typical_duration": 50
-            },
-            DebateFormat.FUTURE_PREDICTION: {
-                "structure": "What will happen if [scenario] occurs?",
-                "focus": "Prediction, scenario analysis, trend identification",
-                "typical_duration": 45
-            }
-        }
-    
-    def _load_metaprompts(self) -> Dict[str, str]:
-        """메타프롬프트 로드"""
-        return {
-            "topic_generation": """
+# 프롬프트 앞부분에 들어가는 작업별 지침
+METAPROMPTS = MappingProxyType({
+    "topic_generation": """
             You are an expert in creating debate topics for Korean students learning English through literature.
             
             CONTEXT:
@@ -155,7 +101,7 @@ class TopicGenerator:
             - Build collaborative learning skills
             """,
             
-            "reading_questions": """
+    "reading_questions": """
             Create reading comprehension questions following Bloom's Taxonomy:
             
             LEVEL 1 (Remember): Factual recall from the text
@@ -172,7 +118,7 @@ class TopicGenerator:
             - Be appropriate for the student's English level
             """,
             
-            "writing_template": """
+    "writing_template": """
             Create writing templates that scaffold student learning:
             
             PREPARATION LEVEL:
@@ -193,37 +139,737 @@ class TopicGenerator:
             - Sophisticated language expectations
             - Independent critical thinking
             """
-        }
+})
+
+# 레벨별 토론 주제 난이도 기준
+LEVEL_SPECIFICATIONS = MappingProxyType({
+    EducationLevel.PREPARATION: {
+        "complexity": "Simple and straightforward",
+        "language": "Basic vocabulary and sentence structures",
+        "support": "High scaffolding with templates and examples",
+        "focus": "Character actions and basic moral concepts"
+    },
+    EducationLevel.REGULAR: {
+        "complexity": "Moderate complexity with multiple perspectives",
+        "language": "Intermediate vocabulary and varied sentence structures",
+        "support": "Balanced guidance with room for creativity",
+        "focus": "Deeper character analysis and ethical reasoning"
+    },
+    EducationLevel.MASTERY: {
+        "complexity": "High complexity with nuanced analysis",
+        "language": "Advanced vocabulary and sophisticated structures",
+        "support": "Minimal scaffolding, maximum independence",
+        "focus": "Complex themes and philosophical questions"
+    }
+})
+
+# 레벨별 글쓰기 분량/시간 기준
+WRITING_LEVEL_SPECS = MappingProxyType({
+    EducationLevel.PREPARATION: {
+        "word_count": 150,
+        "time_limit": 30,
+        "structure_detail": "Very detailed with sentence starters"
+    },
+    EducationLevel.REGULAR: {
+        "word_count": 250,
+        "time_limit": 40,
+        "structure_detail": "Moderate structure with examples"
+    },
+    EducationLevel.MASTERY: {
+        "word_count": 400,
+        "time_limit": 50,
+        "structure_detail": "Minimal structure, maximum creativity"
+    }
+})
+
+# 프롬프트 접두부가 호출마다 바이트 단위로 같도록 미리 직렬화한 레벨 기준
+_LEVEL_SPEC_TEXT = MappingProxyType({
+    level: orjson.dumps(spec, option=orjson.OPT_INDENT_2).decode() for level, spec in LEVEL_SPECIFICATIONS.items()
+})
+_WRITING_SPEC_TEXT = MappingProxyType({
+    level: orjson.dumps(spec, option=orjson.OPT_INDENT_2).decode() for level, spec in WRITING_LEVEL_SPECS.items()
+})
+
+# 기본 토론 주제 프롬프트 앞부분
+_BASIC_TOPICS_PROMPT = """
+        {metaprompts[topic_generation]}
+        
+        LEVEL SPECIFICATIONS ({level}):
+        {level_spec}
+        
+        TASK: Generate {num_topics} debate topics in JSON format:
+        
+        {{
+            "topics": [
+                {{
+                    "title": "<engaging debate topic title>",
+                    "description": "<detailed description of the debate>",
+                    "debate_format": "<one of: character_comparison, moral_judgment, issue_analysis, problem_solution, cause_effect, future_prediction>",
+                    "opening_statement": "<clear opening statement to frame the debate>",
+                    "key_arguments": {{
+                        "pro": [<3-4 strong pro arguments>],
+                        "con": [<3-4 strong con arguments>]
+                    }},
+                    "evidence_sources": [<specific scenes, quotes, or examples from the book>],
+                    "counter_arguments": {{
+                        "pro": [<potential counter-arguments to con side>],
+                        "con": [<potential counter-arguments to pro side>]
+                    }},
+                    "difficulty_score": <1-10 difficulty rating>,
+                    "time_estimate": <estimated time in minutes>,
+                    "prerequisite_knowledge": [<background knowledge needed>],
+                    "learning_objectives": [<specific learning goals>]
+                }}
+            ]
+        }}
+        
+        Ensure topics are:
+        - Culturally sensitive and inclusive
+        - Engaging for Korean students
+        - Connected to real-world applications
+        - Appropriate for the specified level
+        - Designed to promote critical thinking
+        """
+
+# 독해 문제 (여러 주제 묶음) 프롬프트 앞부분
+_READING_QUESTIONS_BATCH_PROMPT = """
+        {metaprompts[reading_questions]}
+        
+        LEVEL: {level}
+        
+        For EACH topic, generate 5 reading comprehension questions following Bloom's Taxonomy.
+        Return one JSON object keyed by topic number:
+        
+        {{
+            "1": {{
+                "questions": [
+                    {{
+                        "question_type": "<factual|inferential|analytical|evaluative|creative>",
+                        "question_text": "<clear, specific question>",
+                        "sample_answer": "<detailed sample answer>",
+                        "points": <point value 1-5>,
+                        "bloom_level": "<remember|understand|apply|analyze|evaluate|create>"
+                    }}
+                ]
+            }}
+        }}
+        
+        Questions should progress from basic comprehension to higher-order thinking.
+        """
+
+# 독해 문제 프롬프트 앞부분
+_READING_QUESTIONS_PROMPT = """
+        {metaprompts[reading_questions]}
+        
+        LEVEL: {level}
+        
+        Generate 5 reading comprehension questions following Bloom's Taxonomy:
+        
+        {{
+            "questions": [
+                {{
+                    "question_type": "<factual|inferential|analytical|evaluative|creative>",
+                    "question_text": "<clear, specific question>",
+                    "sample_answer": "<detailed sample answer>",
+                    "points": <point value 1-5>,
+                    "bloom_level": "<remember|understand|apply|analyze|evaluate|create>"
+                }}
+            ]
+        }}
+        
+        Questions should progress from basic comprehension to higher-order thinking.
+        """
+
+# 글쓰기 템플릿 프롬프트 앞부분
+_WRITING_TEMPLATE_PROMPT = """
+        {metaprompts[writing_template]}
+        
+        LEVEL: {level}
+        SPECIFICATIONS: {writing_spec}
+        
+        Create a writing template in JSON format:
+        
+        {{
+            "structure": {{
+                "introduction": "<template for introduction paragraph>",
+                "body_paragraph_1": "<template for first body paragraph>",
+                "body_paragraph_2": "<template for second body paragraph>",
+                "conclusion": "<template for conclusion paragraph>"
+            }},
+            "evaluation_criteria": [<list of evaluation criteria>]
+        }}
+        
+        Templates should include:
+        - Sentence starters appropriate for the level
+        - Transition words and phrases
+        - Argument structure guidance
+        - Evidence integration tips
+        """
+
+# 글쓰기 템플릿 (여러 주제 묶음) 프롬프트 앞부분
+_WRITING_TEMPLATE_BATCH_PROMPT = """
+        {metaprompts[writing_template]}
+        
+        LEVEL: {level}
+        SPECIFICATIONS: {writing_spec}
+        
+        For EACH topic, create a writing template.
+        Return one JSON object keyed by topic number:
+        
+        {{
+            "1": {{
+                "structure": {{
+                    "introduction": "<template for introduction paragraph>",
+                    "body_paragraph_1": "<template for first body paragraph>",
+                    "body_paragraph_2": "<template for second body paragraph>",
+                    "conclusion": "<template for conclusion paragraph>"
+                }},
+                "evaluation_criteria": [<list of evaluation criteria>]
+            }}
+        }}
+        
+        Templates should include:
+        - Sentence starters appropriate for the level
+        - Transition words and phrases
+        - Argument structure guidance
+        - Evidence integration tips
+        """
+
+# 어휘 연습 (여러 주제 묶음) 프롬프트 앞부분
+_VOCABULARY_BATCH_PROMPT = """
+        Create vocabulary exercises for each of the debate topics listed below.
+        Level: {level}
+        
+        For EACH topic, generate 3 different types of vocabulary exercises.
+        Return one JSON object keyed by topic number:
+        
+        {{
+            "1": {{
+                "exercises": [
+                    {{
+                        "type": "definition_matching",
+                        "instructions": "<clear instructions>",
+                        "items": [
+                            {{
+                                "word": "<vocabulary word>",
+                                "definition": "<definition>",
+                                "example_sentence": "<example from context>"
+                            }}
+                        ]
+                    }},
+                    {{
+                        "type": "context_clues",
+                        "instructions": "<clear instructions>",
+                        "items": [
+                            {{
+                                "sentence": "<sentence with vocabulary word>",
+                                "target_word": "<word to define>",
+                                "answer": "<meaning from context>"
+                            }}
+                        ]
+                    }},
+                    {{
+                        "type": "usage_practice",
+                        "instructions": "<clear instructions>",
+                        "items": [
+                            {{
+                                "prompt": "<situation requiring vocabulary use>",
+                                "target_words": [<words to use>],
+                                "sample_response": "<example response>"
+                            }}
+                        ]
+                    }}
+                ]
+            }}
+        }}
+        
+        Focus on vocabulary that will be useful for each debate topic.
+        """
+
+# 어휘 연습 프롬프트 앞부분
+_VOCABULARY_PROMPT = """
+        Create vocabulary exercises for the debate topic given below.
+        Level: {level}
+        
+        Generate 3 different types of vocabulary exercises in JSON format:
+        
+        {{
+            "exercises": [
+                {{
+                    "type": "definition_matching",
+                    "instructions": "<clear instructions>",
+                    "items": [
+                        {{
+                            "word": "<vocabulary word>",
+                            "definition": "<definition>",
+                            "example_sentence": "<example from context>"
+                        }}
+                    ]
+                }},
+                {{
+                    "type": "context_clues",
+                    "instructions": "<clear instructions>",
+                    "items": [
+                        {{
+                            "sentence": "<sentence with vocabulary word>",
+                            "target_word": "<word to define>",
+                            "answer": "<meaning from context>"
+                        }}
+                    ]
+                }},
+                {{
+                    "type": "usage_practice",
+                    "instructions": "<clear instructions>",
+                    "items": [
+                        {{
+                            "prompt": "<situation requiring vocabulary use>",
+                            "target_words": [<words to use>],
+                            "sample_response": "<example response>"
+                        }}
+                    ]
+                }}
+            ]
+        }}
+        
+        Focus on vocabulary that will be useful for the debate topic.
+        """
+
+# 레벨(과 주제 수)마다 한 번만 렌더링해 두는 프롬프트 앞부분
+# (호출 시에는 도서/주제 정보만 뒤에 붙이므로 접두부가 항상 같은 바이트열)
+@lru_cache(maxsize=None)
+def _prompt_prefix(template: str, level: EducationLevel, num_topics: int = 0) -> str:
+    return template.format(
+        metaprompts=METAPROMPTS,
+        level=level,
+        level_spec=_LEVEL_SPEC_TEXT[level],
+        writing_spec=_WRITING_SPEC_TEXT[level],
+        num_topics=num_topics
+    )
+
+# 응답이 JSON이 아니거나 기대한 구조가 아닐 때만 기본값으로 대체
+# (API 오류는 _chat에서 재시도한 뒤 영역 단위로 전파)
+_PARSE_ERRORS = (ValueError, KeyError, TypeError)
+
+class ArgumentsPayload(msgspec.Struct, forbid_unknown_fields=True):
+    """찬반 논거 응답 스키마"""
+    pro: List[str]
+    con: List[str]
+
+class BasicTopicPayload(msgspec.Struct, forbid_unknown_fields=True):
+    """기본 토론 주제 응답 스키마 (주제 1개)"""
+    title: str
+    description: str
+    debate_format: DebateFormat
+    opening_statement: str
+    key_arguments: ArgumentsPayload
+    evidence_sources: List[str]
+    counter_arguments: ArgumentsPayload
+    difficulty_score: int
+    time_estimate: int
+    prerequisite_knowledge: List[str]
+    learning_objectives: List[str]
+
+class BasicTopicsPayload(msgspec.Struct, forbid_unknown_fields=True):
+    """기본 토론 주제 응답 스키마"""
+    topics: List[BasicTopicPayload]
+
+class ReadingQuestionPayload(msgspec.Struct, forbid_unknown_fields=True):
+    """독해 문제 응답 스키마 (문제 1개)"""
+    question_type: str
+    question_text: str
+    sample_answer: str
+    points: int
+    bloom_level: str
+
+class ReadingQuestionsPayload(msgspec.Struct, forbid_unknown_fields=True):
+    """독해 문제 응답 스키마"""
+    questions: List[ReadingQuestionPayload]
+
+class WritingStructurePayload(msgspec.Struct, forbid_unknown_fields=True):
+    """글쓰기 템플릿 문단 구성 응답 스키마"""
+    introduction: str
+    body_paragraph_1: str
+    body_paragraph_2: str
+    conclusion: str
+
+class WritingTemplatePayload(msgspec.Struct, forbid_unknown_fields=True):
+    """글쓰기 템플릿 응답 스키마"""
+    structure: WritingStructurePayload
+    evaluation_criteria: List[str]
+
+# 응답 형식을 스키마로 강제 (모듈 로드 시 한 번만 생성)
+# 어휘 연습은 유형마다 항목 구조가 다르고, 묶음 요청은 주제 번호가 키이므로 JSON 모드만 사용
+BASIC_TOPICS_RESPONSE_FORMAT = _json_schema_format("basic_debate_topics", _strict_schema(BasicTopicsPayload))
+READING_QUESTIONS_RESPONSE_FORMAT = _json_schema_format("reading_questions", _strict_schema(ReadingQuestionsPayload))
+WRITING_TEMPLATE_RESPONSE_FORMAT = _json_schema_format("writing_template", _strict_schema(WritingTemplatePayload))
+JSON_OBJECT_FORMAT = {"type": "json_object"}
+
+# 토론 가이드/평가 루브릭 템플릿 (모든 주제가 같은 객체를 공유하므로 중첩까지 읽기 전용)
+DISCUSSION_GUIDE = MappingProxyType({
+    "preparation_phase": MappingProxyType({
+        "time_allocation": "15 minutes",
+        "activities": (
+            "Review key vocabulary",
+            "Read background information",
+            "Organize arguments and evidence",
+            "Practice key phrases"
+        )
+    }),
+    "opening_phase": MappingProxyType({
+        "time_allocation": "10 minutes",
+        "structure": (
+            "Opening statement (2 minutes per side)",
+            "Position clarification",
+            "Ground rules reminder"
+        )
+    }),
+    "main_debate": MappingProxyType({
+        "time_allocation": "20 minutes",
+        "structure": (
+            "First arguments (3 minutes per side)",
+            "Cross-examination (2 minutes per side)",
+            "Rebuttal (2 minutes per side)",
+            "Final statements (1 minute per side)"
+        )
+    }),
+    "reflection_phase": MappingProxyType({
+        "time_allocation": "10 minutes",
+        "activities": (
+            "Self-assessment",
+            "Peer feedback",
+            "Key learning points",
+            "Language reflection"
+        )
+    }),
+    "teacher_notes": (
+        "Monitor language use and provide support",
+        "Encourage respectful disagreement",
+        "Focus on evidence-based arguments",
+        "Celebrate effort and improvement"
+    )
+})
+
+ASSESSMENT_RUBRIC = MappingProxyType({
+    "content_knowledge": MappingProxyType({
+        "excellent": "Demonstrates deep understanding of the topic with accurate, relevant details",
+        "good": "Shows solid understanding with mostly accurate information",
+        "satisfactory": "Basic understanding with some accurate details",
+        "needs_improvement": "Limited understanding with few accurate details"
+    }),
+    "argumentation": MappingProxyType({
+        "excellent": "Presents clear, logical arguments with strong evidence",
+        "good": "Presents mostly clear arguments with adequate evidence",
+        "satisfactory": "Presents basic arguments with some evidence",
+        "needs_improvement": "Arguments are unclear or lack evidence"
+    }),
+    "language_use": MappingProxyType({
+        "excellent": "Uses varied vocabulary and complex structures accurately",
+        "good": "Uses appropriate vocabulary with mostly correct structures",
+        "satisfactory": "Uses basic vocabulary with simple structures",
+        "needs_improvement": "Limited vocabulary with frequent errors"
+    }),
+    "participation": MappingProxyType({
+        "excellent": "Actively engages, listens respectfully, builds on others' ideas",
+        "good": "Participates regularly with respectful interaction",
+        "satisfactory": "Participates occasionally with basic interaction",
+        "needs_improvement": "Limited participation or disrespectful behavior"
+    })
+})
+
+# 주제마다 요청하는 독해 문제 수 (스트리밍 CSV 헤더의 독해 문제 열 수)
+READING_QUESTIONS_PER_TOPIC = 5
+
+# 토론 주제 CSV의 고정 열 (독해 문제 열은 이 두 묶음 사이에 들어감)
+_CSV_BASE_FIELDS = (
+    "Topic_ID", "Title", "Description", "Level", "Area", "Format", "Opening_Statement",
+    "Pro_Arguments", "Con_Arguments", "Evidence_Sources", "Difficulty_Score", "Time_Estimate",
+    "Learning_Objectives"
+)
+_CSV_WRITING_FIELDS = ("Writing_Template", "Word_Count_Target", "Writing_Time_Limit")
+
+@dataclass(slots=True)
+class ReadingQuestion:
+    """독해 문제"""
+    question_id: str
+    question_type: str  # "factual", "inferential", "analytical", "evaluative", "creative"
+    question_text: str
+    sample_answer: str
+    points: int
+    bloom_level: str  # "remember", "understand", "apply", "analyze", "evaluate", "create"
+
+@dataclass(slots=True)
+class WritingTemplate:
+    """글쓰기 템플릿"""
+    template_id: str
+    level: EducationLevel
+    structure: Dict[str, str]  # paragraph_name: template
+    word_count_target: int
+    time_limit: int  # 분 단위
+    evaluation_criteria: List[str]
+
+@dataclass(slots=True)
+class EducationalMaterial:
+    """교육 자료 패키지"""
+    material_id: str
+    topic_id: str
+    reading_questions: List[ReadingQuestion]
+    writing_template: WritingTemplate
+    vocabulary_exercises: List[Dict[str, Any]]
+    discussion_guide: Mapping[str, Any]
+    assessment_rubric: Mapping[str, Any]
+
+@dataclass(slots=True)
+class EnhancedDebateTopic:
+    """향상된 토론 주제 (교육 자료 포함)"""
+    topic_id: str
+    title: str
+    description: str
+    level: EducationLevel
+    area: EducationArea
+    debate_format: DebateFormat
+    
+    # 토론 구성 요소
+    opening_statement: str
+    key_arguments: Dict[str, List[str]]  # "pro", "con"
+    evidence_sources: List[str]
+    counter_arguments: Dict[str, List[str]]
+    
+    # 교육 자료
+    educational_materials: EducationalMaterial
+    
+    # 메타데이터
+    difficulty_score: float
+    time_estimate: int
+    prerequisite_knowledge: List[str]
+    learning_objectives: List[str]
+
+class TopicGenerator:
+    """토론 주제 생성 전용 클래스"""
+    
+    def __init__(self, openai_api_key: str, http_client: Optional[httpx.AsyncClient] = None,
+                 max_concurrency: int = OPENAI_CONCURRENCY, cache_dir: Optional[Path] = None,
+                 use_cache: bool = RESPONSE_CACHE_ENABLED):
+        # openai SDK는 import 비용이 커서 생성기를 실제로 만들 때 로드
+        import openai
+        
+        # http_client를 넘기면 다른 서비스와 커넥션 풀을 공유
+        # 넘기지 않으면 동시 호출을 한 연결로 다중화하는 HTTP/2 풀을 직접 만들고 aclose()에서 닫음
+        self._owns_http_client = http_client is None
+        if http_client is None:
+            http_client = openai.DefaultAsyncHttpxClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+            )
+        # 재시도는 _chat에서 지수 백오프로 처리하므로 SDK 자체 재시도는 끔
+        self.client = openai.AsyncOpenAI(api_key=openai_api_key, http_client=http_client, max_retries=0)
+        self.topic_templates = TOPIC_TEMPLATES
+        self.metaprompts = METAPROMPTS
+        # 영역별/주제별 호출이 한꺼번에 몰려도 rate limit을 넘지 않도록 동시 요청 수 제한
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # 같은 도서/영역으로 다시 실행하면 모든 호출이 디스크 캐시에서 바로 응답됨
+        self._disk_cache = diskcache.Cache(str(cache_dir or RESPONSE_CACHE_DIR)) if use_cache else None
+    
+    async def aclose(self):
+        """직접 만든 HTTP 커넥션 풀 정리 (공유받은 http_client는 소유자가 닫음)"""
+        if self._owns_http_client:
+            await self.client.close()
+    
+    async def warmup(self) -> None:
+        """첫 생성 요청 전에 커넥션(TLS 핸드셰이크)과 API 키 확인을 미리 처리
+        
+        가벼운 인증 GET(모델 목록) 한 번이며, 실패해도 실제 요청에서 다시 연결하므로 경고만 남김
+        """
+        try:
+            await self.client.models.list()
+        except Exception as e:
+            logger.warning(f"OpenAI warmup request failed: {e}")
+    
+    async def __aenter__(self) -> "TopicGenerator":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    @retry(
+        wait=wait_random_exponential(min=1, max=30),
+        stop=stop_after_attempt(6),
+        retry=retry_if_exception(is_retryable_error),
+        reraise=True
+    )
+    async def _chat(self, **kwargs):
+        """세마포어로 동시 요청 수를 제한한 chat completion 호출 (일시적 오류는 백오프 후 재시도)"""
+        async with self._semaphore:
+            return await self.client.chat.completions.create(**kwargs)
+    
+    async def _cached_chat(
+        self, messages: List[Dict[str, str]], cache_key: Optional[Tuple[str, ...]] = None, **kwargs
+    ) -> str:
+        """응답 본문을 (모델, 파라미터, 메시지) 해시로 디스크에 캐시하는 호출
+        
+        cache_key를 주면 프롬프트 대신 (모델, cache_key)로 캐시해서, 같은 도서/주제/레벨 요청은
+        프롬프트 구성이 조금 달라도 이전 응답을 재사용
+        """
+        if self._disk_cache is None:
+            response = await self._chat(messages=messages, **kwargs)
+            return response.choices[0].message.content
+        
+        key = self._response_cache_key(messages, cache_key, **kwargs)
+        cached = self._disk_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        response = await self._chat(messages=messages, **kwargs)
+        choice = response.choices[0]
+        # 길이 제한으로 잘린 응답은 캐시하지 않음
+        if getattr(choice, "finish_reason", "stop") == "length":
+            return choice.message.content
+        
+        self._disk_cache.set(key, choice.message.content)
+        return choice.message.content
+    
+    @staticmethod
+    def _response_cache_key(
+        messages: List[Dict[str, str]], cache_key: Optional[Tuple[str, ...]] = None, **kwargs
+    ) -> str:
+        identity = {"key": cache_key, "model": kwargs.get("model")} if cache_key else {"msg": messages, **kwargs}
+        return hashlib.blake2b(orjson.dumps(identity, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    
+    def _forget_response(self, request: Dict[str, Any]) -> None:
+        """스키마에 맞지 않는 응답을 캐시에서 지워 다음 실행에서 다시 요청하게 함"""
+        if self._disk_cache is not None:
+            self._disk_cache.delete(self._response_cache_key(**request))
+    
+    async def _chat_validated(self, request: Dict[str, Any], payload_type: type):
+        """응답을 스키마로 디코딩하고, 맞지 않으면 오류를 알려주며 한 번 더 요청
+        
+        디코딩에 실패한 응답은 캐시에 남기지 않음
+        """
+        result_text = await self._cached_chat(**request)
+        try:
+            return msgspec.json.decode(result_text, type=payload_type)
+        except msgspec.DecodeError as e:
+            logger.warning(f"Response did not match schema, retrying once: {e}")
+            self._forget_response(request)
+            messages = [
+                *request["messages"],
+                {"role": "assistant", "content": result_text},
+                {"role": "user", "content": f"Your previous JSON was malformed ({e}). "
+                                            "Re-emit it strictly matching the requested JSON format."}
+            ]
+        
+        # 재요청은 대화 내용이 다르므로 프롬프트 기준으로 캐시
+        retry_request = {**request, "messages": messages, "cache_key": None}
+        result_text = await self._cached_chat(**retry_request)
+        try:
+            return msgspec.json.decode(result_text, type=payload_type)
+        except msgspec.DecodeError:
+            self._forget_response(retry_request)
+            raise
     
     async def generate_comprehensive_topics(
         self, 
         book_info: BookInfo, 
         area_analyses: List[AreaAnalysis],
-        num_topics_per_area: int = 2
+        num_topics_per_area: int = 2,
+        min_relevance: float = 6.0,
+        max_topics: Optional[int] = None,
+        area_timeout: Optional[float] = None
     ) -> List[EnhancedDebateTopic]:
-        """종합적인 토론 주제 생성"""
+        """종합적인 토론 주제 생성
+        
+        관련성이 min_relevance 미만이거나 핵심 주제가 없는 영역은 API를 호출하지 않음.
+        max_topics를 주면 관련성이 높은 영역부터 주제 수를 배분해 전체 주제(와 교육 자료 호출) 수를 제한.
+        area_timeout(초)을 주면 그 시간 안에 끝나지 않은 영역은 버리고 나머지 결과만 반환
+        """
         
         logger.info(f"Generating comprehensive topics for {book_info.title}")
         
         all_topics = []
         level = book_info.get_education_level()
+        plan = self._plan_areas(area_analyses, num_topics_per_area, min_relevance, max_topics)
         
-        # 관련성이 높은 영역 선별 (점수 6.0 이상)
-        relevant_areas = [analysis for analysis in area_analyses if analysis.relevance_score >= 6.0]
+        # 영역별 토론 주제는 서로 독립적이므로 동시에 생성 (한 영역이 실패해도 나머지는 유지)
+        results = await asyncio.gather(
+            *(asyncio.wait_for(self._generate_topics_for_area(book_info, area_analysis, level, num_topics), area_timeout)
+              for area_analysis, num_topics in plan),
+            return_exceptions=True
+        )
         
-        for area_analysis in relevant_areas:
-            logger.info(f"Generating topics for area: {area_analysis.area}")
-            
-            # 영역별 토론 주제 생성
-            area_topics = await self._generate_topics_for_area(
-                book_info, area_analysis, level, num_topics_per_area
-            )
-            
+        for (area_analysis, _), area_topics in zip(plan, results):
+            if isinstance(area_topics, Exception):
+                logger.error(f"Failed to generate topics for area {area_analysis.area}: {area_topics!r}")
+                continue
             all_topics.extend(area_topics)
         
         logger.info(f"Generated {len(all_topics)} comprehensive topics")
         return all_topics
     
+    async def generate_comprehensive_topics_iter(
+        self, 
+        book_info: BookInfo, 
+        area_analyses: List[AreaAnalysis],
+        num_topics_per_area: int = 2,
+        min_relevance: float = 6.0,
+        max_topics: Optional[int] = None,
+        area_timeout: Optional[float] = None
+    ) -> AsyncIterator[EnhancedDebateTopic]:
+        """generate_comprehensive_topics와 같지만 영역이 끝나는 대로 주제를 하나씩 반환 (완료 순서)"""
+        
+        logger.info(f"Streaming comprehensive topics for {book_info.title}")
+        
+        level = book_info.get_education_level()
+        plan = self._plan_areas(area_analyses, num_topics_per_area, min_relevance, max_topics)
+        pending = {
+            asyncio.ensure_future(asyncio.wait_for(
+                self._generate_topics_for_area(book_info, area_analysis, level, num_topics), area_timeout
+            )): area_analysis
+            for area_analysis, num_topics in plan
+        }
+        
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    area_analysis = pending.pop(task)
+                    try:
+                        area_topics = task.result()
+                    except Exception as e:
+                        logger.error(f"Failed to generate topics for area {area_analysis.area}: {e!r}")
+                        continue
+                    for topic in area_topics:
+                        yield topic
+        finally:
+            # 소비자가 중간에 멈추면 남은 영역 작업은 취소
+            for task in pending:
+                task.cancel()
+    
+    @staticmethod
+    def _plan_areas(
+        area_analyses: List[AreaAnalysis],
+        num_topics_per_area: int,
+        min_relevance: float,
+        max_topics: Optional[int]
+    ) -> List[Tuple[AreaAnalysis, int]]:
+        """주제를 생성할 영역과 영역별 주제 수 결정 (영역 순서는 입력 순서 유지)"""
+        # 관련성이 높은 영역 선별 (기본 점수 6.0 이상)
+        relevant_areas = [
+            analysis for analysis in area_analyses
+            if analysis.relevance_score >= min_relevance and analysis.key_themes
+        ]
+        
+        # 영역별 주제 수 배분
+        topic_counts = {analysis.area: num_topics_per_area for analysis in relevant_areas}
+        if max_topics is not None:
+            remaining = max_topics
+            for analysis in sorted(relevant_areas, key=lambda a: a.relevance_score, reverse=True):
+                topic_counts[analysis.area] = min(num_topics_per_area, remaining)
+                remaining -= topic_counts[analysis.area]
+        
+        return [
+            (analysis, topic_counts[analysis.area]) for analysis in relevant_areas
+            if topic_counts[analysis.area] > 0
+        ]
+    
     async def _generate_topics_for_area(
         self, 
         book_info: BookInfo, 
@@ -232,23 +878,21 @@ class TopicGenerator:
         num_topics: int
     ) -> List[EnhancedDebateTopic]:
         """특정 영역에 대한 토론 주제 생성"""
+        logger.info(f"Generating topics for area: {area_analysis.area}")
         
         # 1. 기본 토론 주제 생성
-        basic_topics = await self._generate_basic_topics(book_info, area_analysis, level, num_topics)
+        # 모델이 요청보다 많은 주제를 돌려줘도 교육 자료 호출은 요청한 수만큼만
+        basic_topics = (await self._generate_basic_topics(book_info, area_analysis, level, num_topics))[:num_topics]
         
         # 2. 각 주제에 대한 교육 자료 생성
+        logger.info(f"Enhancing {len(basic_topics)} topics for area: {area_analysis.area}")
+        materials_list = await self._generate_educational_materials(book_info, basic_topics, level)
+        
         enhanced_topics = []
-        for i, basic_topic in enumerate(basic_topics):
-            logger.info(f"Enhancing topic {i+1}/{len(basic_topics)}")
-            
-            # 교육 자료 생성
-            educational_materials = await self._generate_educational_materials(
-                book_info, basic_topic, level
-            )
-            
+        for i, (basic_topic, educational_materials) in enumerate(zip(basic_topics, materials_list)):
             # 향상된 토론 주제 구성
             enhanced_topic = EnhancedDebateTopic(
-                topic_id=f"{area_analysis.area.value.lower().replace(' ', '_')}_{i+1}",
+                topic_id=f"{AREA_SLUGS[area_analysis.area]}_{i+1}",
                 title=basic_topic["title"],
                 description=basic_topic["description"],
                 level=level,
@@ -278,30 +922,7 @@ class TopicGenerator:
     ) -> List[Dict[str, Any]]:
         """기본 토론 주제 생성"""
         
-        level_specifications = {
-            EducationLevel.PREPARATION: {
-                "complexity": "Simple and straightforward",
-                "language": "Basic vocabulary and sentence structures",
-                "support": "High scaffolding with templates and examples",
-                "focus": "Character actions and basic moral concepts"
-            },
-            EducationLevel.REGULAR: {
-                "complexity": "Moderate complexity with multiple perspectives",
-                "language": "Intermediate vocabulary and varied sentence structures",
-                "support": "Balanced guidance with room for creativity",
-                "focus": "Deeper character analysis and ethical reasoning"
-            },
-            EducationLevel.MASTERY: {
-                "complexity": "High complexity with nuanced analysis",
-                "language": "Advanced vocabulary and sophisticated structures",
-                "support": "Minimal scaffolding, maximum independence",
-                "focus": "Complex themes and philosophical questions"
-            }
-        }
-        
-        prompt = f"""
-        {self.metaprompts['topic_generation']}
-        
+        prompt = _prompt_prefix(_BASIC_TOPICS_PROMPT, level, num_topics) + f"""
         BOOK INFORMATION:
         Title: {book_info.title}
         Author: {book_info.author}
@@ -312,97 +933,96 @@ class TopicGenerator:
         Key Themes: {', '.join(area_analysis.key_themes)}
         Discussion Points: {', '.join(area_analysis.discussion_points)}
         Korean Connections: {', '.join(area_analysis.korean_connection)}
-        
-        LEVEL SPECIFICATIONS ({level}):
-        {json.dumps(level_specifications[level], indent=2)}
-        
-        TASK: Generate {num_topics} debate topics in JSON format:
-        
-        {{
-            "topics": [
-                {{
-                    "title": "<engaging debate topic title>",
-                    "description": "<detailed description of the debate>",
-                    "debate_format": "<one of: character_comparison, moral_judgment, issue_analysis, problem_solution, cause_effect, future_prediction>",
-                    "opening_statement": "<clear opening statement to frame the debate>",
-                    "key_arguments": {{
-                        "pro": [<3-4 strong pro arguments>],
-                        "con": [<3-4 strong con arguments>]
-                    }},
-                    "evidence_sources": [<specific scenes, quotes, or examples from the book>],
-                    "counter_arguments": {{
-                        "pro": [<potential counter-arguments to con side>],
-                        "con": [<potential counter-arguments to pro side>]
-                    }},
-                    "difficulty_score": <1-10 difficulty rating>,
-                    "time_estimate": <estimated time in minutes>,
-                    "prerequisite_knowledge": [<background knowledge needed>],
-                    "learning_objectives": [<specific learning goals>]
-                }}
-            ]
-        }}
-        
-        Ensure topics are:
-        - Culturally sensitive and inclusive
-        - Engaging for Korean students
-        - Connected to real-world applications
-        - Appropriate for the specified level
-        - Designed to promote critical thinking
         """
         
         try:
-            response = await self.client.chat.completions.create(
+            payload = await self._chat_validated(dict(
                 model="gpt-4.1-mini",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=2000,
-                temperature=0.4
-            )
-            
-            result_text = response.choices[0].message.content.strip()
-            if result_text.startswith("```json"):
-                result_text = result_text[7:-3]
-            elif result_text.startswith("```"):
-                result_text = result_text[3:-3]
+                temperature=0.4,
+                response_format=BASIC_TOPICS_RESPONSE_FORMAT
+            ), BasicTopicsPayload)
+            # 이후 단계는 주제를 dict로 다루므로 검증된 구조체를 기본 타입으로 되돌림 (debate_format은 값 문자열)
+            return msgspec.to_builtins(payload.topics)
             
-            result_data = json.loads(result_text)
-            return result_data["topics"]
-            
-        except Exception as e:
+        except _PARSE_ERRORS as e:
             logger.error(f"Failed to generate basic topics: {e}")
             return []
     
     async def _generate_educational_materials(
         self, 
         book_info: BookInfo, 
-        topic_data: Dict[str, Any], 
+        topics: List[Dict[str, Any]], 
         level: EducationLevel
-    ) -> EducationalMaterial:
-        """교육 자료 생성"""
-        
-        # 1. 독해 문제 생성
-        reading_questions = await self._generate_reading_questions(book_info, topic_data, level)
+    ) -> List[EducationalMaterial]:
+        """교육 자료 생성 (독해 문제, 어휘 연습, 글쓰기 템플릿은 같은 영역의 주제들을 묶어 한 번에 요청)"""
         
-        # 2. 글쓰기 템플릿 생성
-        writing_template = await self._generate_writing_template(topic_data, level)
+        # 1-3. 독해 문제, 어휘 연습 문제, 글쓰기 템플릿은 서로 독립적인 API 호출이므로 동시에 생성
+        reading_sets, vocabulary_sets, writing_templates = await asyncio.gather(
+            self._generate_reading_questions_batch(book_info, topics, level),
+            self._generate_vocabulary_exercises_batch(book_info, topics, level),
+            self._generate_writing_templates_batch(topics, level)
+        )
         
-        # 3. 어휘 연습 문제 생성
-        vocabulary_exercises = await self._generate_vocabulary_exercises(book_info, topic_data, level)
+        materials = []
+        for topic_data, reading_questions, vocabulary_exercises, writing_template in zip(
+            topics, reading_sets, vocabulary_sets, writing_templates
+        ):
+            materials.append(EducationalMaterial(
+                material_id=f"materials_{topic_data.get('title', 'unknown').lower().replace(' ', '_')}",
+                topic_id=topic_data.get('title', 'unknown'),
+                reading_questions=reading_questions,
+                writing_template=writing_template,
+                vocabulary_exercises=vocabulary_exercises,
+                # 토론 가이드/평가 루브릭은 고정 템플릿이므로 API 호출 없이 공유
+                discussion_guide=DISCUSSION_GUIDE,
+                assessment_rubric=ASSESSMENT_RUBRIC
+            ))
         
-        # 4. 토론 가이드 생성
-        discussion_guide = await self._generate_discussion_guide(topic_data, level)
+        return materials
+    
+    async def _generate_reading_questions_batch(
+        self, 
+        book_info: BookInfo, 
+        topics: List[Dict[str, Any]], 
+        level: EducationLevel
+    ) -> List[List[ReadingQuestion]]:
+        """여러 주제의 독해 문제를 한 번의 호출로 생성 (응답에 빠진 주제는 개별 호출)"""
+        if len(topics) <= 1:
+            return [await self._generate_reading_questions(book_info, topic_data, level) for topic_data in topics]
         
-        # 5. 평가 루브릭 생성
-        assessment_rubric = await self._generate_assessment_rubric(level)
+        topic_list = "\n".join(f"{i}. {topic_data['title']}" for i, topic_data in enumerate(topics, 1))
+        prompt = _prompt_prefix(_READING_QUESTIONS_BATCH_PROMPT, level) + f"""
+        BOOK: {book_info.title} by {book_info.author}
+        TOPICS:
+        {topic_list}
+        """
         
-        return EducationalMaterial(
-            material_id=f"materials_{topic_data.get('title', 'unknown').lower().replace(' ', '_')}",
-            topic_id=topic_data.get('title', 'unknown'),
-            reading_questions=reading_questions,
-            writing_template=writing_template,
-            vocabulary_exercises=vocabulary_exercises,
-            discussion_guide=discussion_guide,
-            assessment_rubric=assessment_rubric
+        request = dict(
+            model="gpt-4.1-mini",
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=1500 * len(topics),
+            temperature=0.3,
+            response_format=JSON_OBJECT_FORMAT
         )
+        result_data = {}
+        try:
+            result_data = orjson.loads(await self._cached_chat(**request))
+            
+        except _PARSE_ERRORS as e:
+            logger.error(f"Failed to generate reading questions in batch: {e}")
+        
+        question_sets = []
+        for i, topic_data in enumerate(topics, 1):
+            try:
+                payload = msgspec.convert(result_data[str(i)], ReadingQuestionsPayload)
+                question_sets.append(self._reading_questions_from_data(payload.questions))
+            except (KeyError, TypeError, msgspec.ValidationError) as e:
+                logger.warning(f"Batch reading questions missing topic {i}, requesting individually: {e}")
+                self._forget_response(request)
+                question_sets.append(await self._generate_reading_questions(book_info, topic_data, level))
+        return question_sets
     
     async def _generate_reading_questions(
         self, 
@@ -412,137 +1032,113 @@ class TopicGenerator:
     ) -> List[ReadingQuestion]:
         """독해 문제 생성"""
         
-        prompt = f"""
-        {self.metaprompts['reading_questions']}
-        
+        prompt = _prompt_prefix(_READING_QUESTIONS_PROMPT, level) + f"""
         BOOK: {book_info.title} by {book_info.author}
         TOPIC: {topic_data['title']}
-        LEVEL: {level}
-        
-        Generate 5 reading comprehension questions following Bloom's Taxonomy:
-        
-        {{
-            "questions": [
-                {{
-                    "question_type": "<factual|inferential|analytical|evaluative|creative>",
-                    "question_text": "<clear, specific question>",
-                    "sample_answer": "<detailed sample answer>",
-                    "points": <point value 1-5>,
-                    "bloom_level": "<remember|understand|apply|analyze|evaluate|create>"
-                }}
-            ]
-        }}
-        
-        Questions should progress from basic comprehension to higher-order thinking.
         """
         
         try:
-            response = await self.client.chat.completions.create(
+            payload = await self._chat_validated(dict(
+                cache_key=("reading_questions", book_info.title, book_info.author, topic_data['title'], level.value),
                 model="gpt-4.1-mini",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=1500,
-                temperature=0.3
-            )
-            
-            result_text = response.choices[0].message.content.strip()
-            if result_text.startswith("```json"):
-                result_text = result_text[7:-3]
-            elif result_text.startswith("```"):
-                result_text = result_text[3:-3]
+                temperature=0.3,
+                response_format=READING_QUESTIONS_RESPONSE_FORMAT
+            ), ReadingQuestionsPayload)
+            return self._reading_questions_from_data(payload.questions)
             
-            result_data = json.loads(result_text)
-            
-            questions = []
-            for i, q_data in enumerate(result_data["questions"]):
-                question = ReadingQuestion(
-                    question_id=f"q_{i+1}",
-                    question_type=q_data["question_type"],
-                    question_text=q_data["question_text"],
-                    sample_answer=q_data["sample_answer"],
-                    points=q_data["points"],
-                    bloom_level=q_data["bloom_level"]
-                )
-                questions.append(question)
-            
-            return questions
-            
-        except Exception as e:
+        except _PARSE_ERRORS as e:
             logger.error(f"Failed to generate reading questions: {e}")
             return []
     
-    async def _generate_writing_template(self, topic_data: Dict[str, Any], level: EducationLevel) -> WritingTemplate:
-        """글쓰기 템플릿 생성"""
-        
-        level_specs = {
-            EducationLevel.PREPARATION: {
-                "word_count": 150,
-                "time_limit": 30,
-                "structure_detail": "Very detailed with sentence starters"
-            },
-            EducationLevel.REGULAR: {
-                "word_count": 250,
-                "time_limit": 40,
-                "structure_detail": "Moderate structure with examples"
-            },
-            EducationLevel.MASTERY: {
-                "word_count": 400,
-                "time_limit": 50,
-                "structure_detail": "Minimal structure, maximum creativity"
-            }
-        }
+    @staticmethod
+    def _reading_questions_from_data(questions_data: List[ReadingQuestionPayload]) -> List[ReadingQuestion]:
+        """검증된 질문 목록을 ReadingQuestion으로 변환"""
+        questions = []
+        for i, q_data in enumerate(questions_data):
+            question = ReadingQuestion(
+                question_id=f"q_{i+1}",
+                question_type=q_data.question_type,
+                question_text=q_data.question_text,
+                sample_answer=q_data.sample_answer,
+                points=q_data.points,
+                bloom_level=q_data.bloom_level
+            )
+            questions.append(question)
         
-        prompt = f"""
-        {self.metaprompts['writing_template']}
+        return questions
+    
+    async def _generate_writing_templates_batch(
+        self, 
+        topics: List[Dict[str, Any]], 
+        level: EducationLevel
+    ) -> List[WritingTemplate]:
+        """여러 주제의 글쓰기 템플릿을 한 번의 호출로 생성 (응답에 빠진 주제는 개별 호출)"""
+        if len(topics) <= 1:
+            return [await self._generate_writing_template(topic_data, level) for topic_data in topics]
         
-        TOPIC: {topic_data['title']}
-        LEVEL: {level}
-        SPECIFICATIONS: {json.dumps(level_specs[level], indent=2)}
+        topic_list = "\n".join(f"{i}. {topic_data['title']}" for i, topic_data in enumerate(topics, 1))
+        prompt = _prompt_prefix(_WRITING_TEMPLATE_BATCH_PROMPT, level) + f"""
+        TOPICS:
+        {topic_list}
+        """
         
-        Create a writing template in JSON format:
+        request = dict(
+            model="gpt-4.1-mini",
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=1000 * len(topics),
+            temperature=0.3,
+            response_format=JSON_OBJECT_FORMAT
+        )
+        result_data = {}
+        try:
+            result_data = orjson.loads(await self._cached_chat(**request))
+            
+        except _PARSE_ERRORS as e:
+            logger.error(f"Failed to generate writing templates in batch: {e}")
         
-        {{
-            "structure": {{
-                "introduction": "<template for introduction paragraph>",
-                "body_paragraph_1": "<template for first body paragraph>",
-                "body_paragraph_2": "<template for second body paragraph>",
-                "conclusion": "<template for conclusion paragraph>"
-            }},
-            "evaluation_criteria": [<list of evaluation criteria>]
-        }}
+        templates = []
+        for i, topic_data in enumerate(topics, 1):
+            try:
+                payload = msgspec.convert(result_data[str(i)], WritingTemplatePayload)
+                templates.append(self._writing_template_from_data(payload, level))
+            except (KeyError, TypeError, msgspec.ValidationError) as e:
+                logger.warning(f"Batch writing templates missing topic {i}, requesting individually: {e}")
+                self._forget_response(request)
+                templates.append(await self._generate_writing_template(topic_data, level))
+        return templates
+    
+    @staticmethod
+    def _writing_template_from_data(template_data: WritingTemplatePayload, level: EducationLevel) -> WritingTemplate:
+        """검증된 템플릿 구성을 WritingTemplate으로 변환"""
+        return WritingTemplate(
+            template_id=f"template_{level.value}",
+            level=level,
+            structure=msgspec.structs.asdict(template_data.structure),
+            word_count_target=WRITING_LEVEL_SPECS[level]["word_count"],
+            time_limit=WRITING_LEVEL_SPECS[level]["time_limit"],
+            evaluation_criteria=template_data.evaluation_criteria
+        )
+    
+    async def _generate_writing_template(self, topic_data: Dict[str, Any], level: EducationLevel) -> WritingTemplate:
+        """글쓰기 템플릿 생성"""
         
-        Templates should include:
-        - Sentence starters appropriate for the level
-        - Transition words and phrases
-        - Argument structure guidance
-        - Evidence integration tips
+        prompt = _prompt_prefix(_WRITING_TEMPLATE_PROMPT, level) + f"""
+        TOPIC: {topic_data['title']}
         """
         
         try:
-            response = await self.client.chat.completions.create(
+            payload = await self._chat_validated(dict(
                 model="gpt-4.1-mini",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=1000,
-                temperature=0.3
-            )
+                temperature=0.3,
+                response_format=WRITING_TEMPLATE_RESPONSE_FORMAT
+            ), WritingTemplatePayload)
+            return self._writing_template_from_data(payload, level)
             
-            result_text = response.choices[0].message.content.strip()
-            if result_text.startswith("```json"):
-                result_text = result_text[7:-3]
-            elif result_text.startswith("```"):
-                result_text = result_text[3:-3]
-            
-            result_data = json.loads(result_text)
-            
-            return WritingTemplate(
-                template_id=f"template_{level.value}",
-                level=level,
-                structure=result_data["structure"],
-                word_count_target=level_specs[level]["word_count"],
-                time_limit=level_specs[level]["time_limit"],
-                evaluation_criteria=result_data["evaluation_criteria"]
-            )
-            
-        except Exception as e:
+        except _PARSE_ERRORS as e:
             logger.error(f"Failed to generate writing template: {e}")
             return WritingTemplate(
                 template_id=f"template_{level.value}",
@@ -553,6 +1149,47 @@ class TopicGenerator:
                 evaluation_criteria=["Content", "Organization", "Language"]
             )
     
+    async def _generate_vocabulary_exercises_batch(
+        self, 
+        book_info: BookInfo, 
+        topics: List[Dict[str, Any]], 
+        level: EducationLevel
+    ) -> List[List[Dict[str, Any]]]:
+        """여러 주제의 어휘 연습 문제를 한 번의 호출로 생성 (응답에 빠진 주제는 개별 호출)"""
+        if len(topics) <= 1:
+            return [await self._generate_vocabulary_exercises(book_info, topic_data, level) for topic_data in topics]
+        
+        topic_list = "\n".join(f"{i}. {topic_data['title']}" for i, topic_data in enumerate(topics, 1))
+        prompt = _prompt_prefix(_VOCABULARY_BATCH_PROMPT, level) + f"""
+        Book: {book_info.title}
+        TOPICS:
+        {topic_list}
+        """
+        
+        request = dict(
+            model="gpt-4.1-mini",
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=1200 * len(topics),
+            temperature=0.3,
+            response_format=JSON_OBJECT_FORMAT
+        )
+        result_data = {}
+        try:
+            result_data = orjson.loads(await self._cached_chat(**request))
+            
+        except _PARSE_ERRORS as e:
+            logger.error(f"Failed to generate vocabulary exercises in batch: {e}")
+        
+        exercise_sets = []
+        for i, topic_data in enumerate(topics, 1):
+            try:
+                exercise_sets.append(result_data[str(i)]["exercises"])
+            except (KeyError, TypeError) as e:
+                logger.warning(f"Batch vocabulary exercises missing topic {i}, requesting individually: {e}")
+                self._forget_response(request)
+                exercise_sets.append(await self._generate_vocabulary_exercises(book_info, topic_data, level))
+        return exercise_sets
+    
     async def _generate_vocabulary_exercises(
         self, 
         book_info: BookInfo, 
@@ -561,202 +1198,122 @@ class TopicGenerator:
     ) -> List[Dict[str, Any]]:
         """어휘 연습 문제 생성"""
         
-        prompt = f"""
-        Create vocabulary exercises for the debate topic: {topic_data['title']}
+        prompt = _prompt_prefix(_VOCABULARY_PROMPT, level) + f"""
         Book: {book_info.title}
-        Level: {level}
-        
-        Generate 3 different types of vocabulary exercises in JSON format:
-        
-        {{
-            "exercises": [
-                {{
-                    "type": "definition_matching",
-                    "instructions": "<clear instructions>",
-                    "items": [
-                        {{
-                            "word": "<vocabulary word>",
-                            "definition": "<definition>",
-                            "example_sentence": "<example from context>"
-                        }}
-                    ]
-                }},
-                {{
-                    "type": "context_clues",
-                    "instructions": "<clear instructions>",
-                    "items": [
-                        {{
-                            "sentence": "<sentence with vocabulary word>",
-                            "target_word": "<word to define>",
-                            "answer": "<meaning from context>"
-                        }}
-                    ]
-                }},
-                {{
-                    "type": "usage_practice",
-                    "instructions": "<clear instructions>",
-                    "items": [
-                        {{
-                            "prompt": "<situation requiring vocabulary use>",
-                            "target_words": [<words to use>],
-                            "sample_response": "<example response>"
-                        }}
-                    ]
-                }}
-            ]
-        }}
-        
-        Focus on vocabulary that will be useful for the debate topic.
+        TOPIC: {topic_data['title']}
         """
         
+        request = dict(
+            cache_key=("vocabulary_exercises", book_info.title, book_info.author, topic_data['title'], level.value),
+            model="gpt-4.1-mini",
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=1200,
+            temperature=0.3,
+            response_format=JSON_OBJECT_FORMAT
+        )
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4.1-mini",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=1200,
-                temperature=0.3
-            )
-            
-            result_text = response.choices[0].message.content.strip()
-            if result_text.startswith("```json"):
-                result_text = result_text[7:-3]
-            elif result_text.startswith("```"):
-                result_text = result_text[3:-3]
-            
-            result_data = json.loads(result_text)
+            result_data = orjson.loads(await self._cached_chat(**request))
             return result_data["exercises"]
             
-        except Exception as e:
+        except _PARSE_ERRORS as e:
             logger.error(f"Failed to generate vocabulary exercises: {e}")
+            self._forget_response(request)
             return []
     
-    async def _generate_discussion_guide(self, topic_data: Dict[str, Any], level: EducationLevel) -> Dict[str, Any]:
-        """토론 가이드 생성"""
-        
-        guide = {
-            "preparation_phase": {
-                "time_allocation": "15 minutes",
-                "activities": [
-                    "Review key vocabulary",
-                    "Read background information",
-                    "Organize arguments and evidence",
-                    "Practice key phrases"
-                ]
-            },
-            "opening_phase": {
-                "time_allocation": "10 minutes",
-                "structure": [
-                    "Opening statement (2 minutes per side)",
-                    "Position clarification",
-                    "Ground rules reminder"
-                ]
-            },
-            "main_debate": {
-                "time_allocation": "20 minutes",
-                "structure": [
-                    "First arguments (3 minutes per side)",
-                    "Cross-examination (2 minutes per side)",
-                    "Rebuttal (2 minutes per side)",
-                    "Final statements (1 minute per side)"
-                ]
-            },
-            "reflection_phase": {
-                "time_allocation": "10 minutes",
-                "activities": [
-                    "Self-assessment",
-                    "Peer feedback",
-                    "Key learning points",
-                    "Language reflection"
-                ]
-            },
-            "teacher_notes": [
-                "Monitor language use and provide support",
-                "Encourage respectful disagreement",
-                "Focus on evidence-based arguments",
-                "Celebrate effort and improvement"
-            ]
-        }
+    @staticmethod
+    def _build_row(topic: EnhancedDebateTopic, max_questions: int) -> List[Any]:
+        """토론 주제 하나를 헤더 순서에 맞춘 CSV 행으로 변환"""
+        # 기본 토론 주제 정보
+        row = [
+            topic.topic_id,
+            topic.title,
+            topic.description,
+            topic.level.value,
+            topic.area.value,
+            topic.debate_format.value,
+            topic.opening_statement,
+            " | ".join(topic.key_arguments.get("pro", [])),
+            " | ".join(topic.key_arguments.get("con", [])),
+            " | ".join(topic.evidence_sources),
+            topic.difficulty_score,
+            topic.time_estimate,
+            " | ".join(topic.learning_objectives)
+        ]
         
-        return guide
-    
-    async def _generate_assessment_rubric(self, level: EducationLevel) -> Dict[str, Any]:
-        """평가 루브릭 생성"""
-        
-        rubric = {
-            "content_knowledge": {
-                "excellent": "Demonstrates deep understanding of the topic with accurate, relevant details",
-                "good": "Shows solid understanding with mostly accurate information",
-                "satisfactory": "Basic understanding with some accurate details",
-                "needs_improvement": "Limited understanding with few accurate details"
-            },
-            "argumentation": {
-                "excellent": "Presents clear, logical arguments with strong evidence",
-                "good": "Presents mostly clear arguments with adequate evidence",
-                "satisfactory": "Presents basic arguments with some evidence",
-                "needs_improvement": "Arguments are unclear or lack evidence"
-            },
-            "language_use": {
-                "excellent": "Uses varied vocabulary and complex structures accurately",
-                "good": "Uses appropriate vocabulary with mostly correct structures",
-                "satisfactory": "Uses basic vocabulary with simple structures",
-                "needs_improvement": "Limited vocabulary with frequent errors"
-            },
-            "participation": {
-                "excellent": "Actively engages, listens respectfully, builds on others' ideas",
-                "good": "Participates regularly with respectful interaction",
-                "satisfactory": "Participates occasionally with basic interaction",
-                "needs_improvement": "Limited participation or disrespectful behavior"
-            }
-        }
+        # 독해 문제 추가 (문제가 적은 주제는 빈 칸으로 채우고, 헤더보다 많으면 잘라냄)
+        questions = topic.educational_materials.reading_questions[:max_questions]
+        for question in questions:
+            row.append(question.question_text)
+            row.append(question.sample_answer)
+        row.extend([""] * (2 * (max_questions - len(questions))))
         
-        return rubric
+        # 글쓰기 템플릿 추가
+        template = topic.educational_materials.writing_template
+        row.append(json.dumps(template.structure))
+        row.append(template.word_count_target)
+        row.append(template.time_limit)
+        
+        return row
+    
+    @staticmethod
+    def _csv_header(max_questions: int) -> List[str]:
+        """독해 문제 max_questions개 기준의 CSV 헤더"""
+        return [
+            *_CSV_BASE_FIELDS,
+            *(f"Reading_{kind}{i}" for i in range(1, max_questions + 1) for kind in ("Q", "A")),
+            *_CSV_WRITING_FIELDS
+        ]
     
-    def export_topics_to_csv(self, topics: List[EnhancedDebateTopic], output_path: str) -> str:
-        """토론 주제를 CSV로 내보내기"""
+    def export_topics_to_csv(self, topics: List[EnhancedDebateTopic], output_path: Union[str, os.PathLike]) -> str:
+        """토론 주제를 CSV로 내보내기 (주제마다 한 행씩 바로 기록)"""
         try:
-            csv_data = []
-            
-            for topic in topics:
-                # 기본 토론 주제 정보
-                base_row = {
-                    "Topic_ID": topic.topic_id,
-                    "Title": topic.title,
-                    "Description": topic.description,
-                    "Level": topic.level.value,
-                    "Area": topic.area.value,
-                    "Format": topic.debate_format.value,
-                    "Opening_Statement": topic.opening_statement,
-                    "Pro_Arguments": " | ".join(topic.key_arguments.get("pro", [])),
-                    "Con_Arguments": " | ".join(topic.key_arguments.get("con", [])),
-                    "Evidence_Sources": " | ".join(topic.evidence_sources),
-                    "Difficulty_Score": topic.difficulty_score,
-                    "Time_Estimate": topic.time_estimate,
-                    "Learning_Objectives": " | ".join(topic.learning_objectives)
-                }
-                
-                # 독해 문제 추가
-                for i, question in enumerate(topic.educational_materials.reading_questions):
-                    base_row[f"Reading_Q{i+1}"] = question.question_text
-                    base_row[f"Reading_A{i+1}"] = question.sample_answer
-                
-                # 글쓰기 템플릿 추가
-                template = topic.educational_materials.writing_template
-                base_row["Writing_Template"] = json.dumps(template.structure)
-                base_row["Word_Count_Target"] = template.word_count_target
-                base_row["Writing_Time_Limit"] = template.time_limit
-                
-                csv_data.append(base_row)
+            # 독해 문제 수는 주제마다 다를 수 있으므로 가장 많은 주제 기준으로 헤더를 고정
+            max_questions = max(
+                (len(topic.educational_materials.reading_questions) for topic in topics), default=0
+            )
             
-            df = pd.DataFrame(csv_data)
-            df.to_csv(output_path, index=False, encoding='utf-8')
+            # 행은 헤더 순서의 리스트로 바로 만들어 DictWriter의 행마다 키 조회/검사를 생략
+            with open(output_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(self._csv_header(max_questions))
+                writer.writerows(self._build_row(topic, max_questions) for topic in topics)
             
             logger.info(f"Enhanced topics CSV exported to: {output_path}")
-            return output_path
+            return os.fspath(output_path)
             
         except Exception as e:
             logger.error(f"Failed to export enhanced topics CSV: {e}")
             raise
 
+    async def export_topics_stream(
+        self,
+        topics: AsyncIterator[EnhancedDebateTopic],
+        output_path: Union[str, os.PathLike],
+        max_questions: int = READING_QUESTIONS_PER_TOPIC
+    ) -> int:
+        """생성되는 토론 주제를 받는 대로 CSV에 기록하고 기록한 주제 수를 반환
+        
+        주제를 모아 두지 않으므로 헤더의 독해 문제 열 수는 max_questions로 고정
+        """
+        count = 0
+        try:
+            with open(output_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(self._csv_header(max_questions))
+                async for topic in topics:
+                    writer.writerow(self._build_row(topic, max_questions))
+                    count += 1
+            
+            logger.info(f"Streamed {count} enhanced topics to CSV: {output_path}")
+            return count
+            
+        except Exception as e:
+            logger.error(f"Failed to stream enhanced topics CSV: {e}")
+            raise
+
+# 데모 실행 전체 제한 시간 (초)
+DEMO_TIMEOUT = 60
+
 # 테스트 함수
 async def test_topic_generator():
     """토론 주제 생성기 테스트"""
@@ -765,48 +1322,70 @@ async def test_topic_generator():
         print("OPENAI_API_KEY environment variable not set")
         return
     
-    generator = TopicGenerator(api_key)
-    
-    # 테스트용 데이터
-    test_book = BookInfo(
-        title="Charlotte's Web",
-        author="E.B. White",
-        ar_level=4.4,
-        summary="A story about friendship between a pig named Wilbur and a spider named Charlotte."
-    )
-    
-    test_area = AreaAnalysis(
-        area=EducationArea.HUMAN_SOCIETY,
-        relevance_score=8.5,
-        key_themes=["friendship", "sacrifice", "loyalty", "growing up"],
-        discussion_points=["What makes a true friend?", "When is sacrifice worthwhile?"],
-        vocabulary_focus=["friendship", "loyalty", "sacrifice", "courage"],
-        cultural_context=["rural American life", "farm animals"],
-        korean_connection=["Korean concepts of friendship", "loyalty in Korean culture"]
-    )
-    
-    print("Generating comprehensive topics...")
+    async def report(topics):
+        # 생성되는 대로 출력하면서 CSV 기록 쪽으로 넘김
+        # 주제마다 한 번에 써서 동시에 찍히는 로그와 줄이 섞이지 않게 함
+        async for topic in topics:
+            materials = topic.educational_materials
+            sys.stdout.write(
+                f"- {topic.title}\n"
+                f"  Format: {topic.debate_format.value}\n"
+                f"  Difficulty: {topic.difficulty_score}/10\n"
+                f"  Reading Questions: {len(materials.reading_questions)}\n\n"
+            )
+            yield topic
     
-    try:
-        topics = await generator.generate_comprehensive_topics(
-            test_book, [test_area], num_topics_per_area=2
+    # 모든 호출이 하나의 커넥션 풀을 재사용하고, 끝나면 풀을 닫음
+    async with TopicGenerator(api_key) as generator:
+        # 테스트 데이터를 만드는 동안 TLS 연결과 API 키 확인을 미리 끝내 둠
+        warmup_task = asyncio.create_task(generator.warmup())
+        
+        # 테스트용 데이터
+        test_book = BookInfo(
+            title="Charlotte's Web",
+            author="E.B. White",
+            ar_level=4.4,
+            summary="A story about friendship between a pig named Wilbur and a spider named Charlotte."
         )
         
-        print(f"\nGenerated {len(topics)} enhanced topics:")
-        for topic in topics:
-            print(f"- {topic.title}")
-            print(f"  Format: {topic.debate_format.value}")
-            print(f"  Difficulty: {topic.difficulty_score}/10")
-            print(f"  Reading Questions: {len(topic.educational_materials.reading_questions)}")
-            print()
+        test_area = AreaAnalysis(
+            area=EducationArea.HUMAN_SOCIETY,
+            relevance_score=8.5,
+            key_themes=("friendship", "sacrifice", "loyalty", "growing up"),
+            discussion_points=("What makes a true friend?", "When is sacrifice worthwhile?"),
+            vocabulary_focus=("friendship", "loyalty", "sacrifice", "courage"),
+            cultural_context=("rural American life", "farm animals"),
+            korean_connection=("Korean concepts of friendship", "loyalty in Korean culture")
+        )
         
-        # CSV 내보내기
-        csv_path = "/home/ubuntu/pascal_system/enhanced_topics.csv"
-        generator.export_topics_to_csv(topics, csv_path)
-        print(f"CSV exported to: {csv_path}")
+        print("Generating comprehensive topics...")
         
-    except Exception as e:
-        print(f"Error: {e}")
+        try:
+            # 응답이 멈춰도 데모가 무한정 기다리지 않도록 전체 시간 제한
+            # (시간 초과 시 진행 중인 영역 작업은 생성기 종료와 함께 취소됨)
+            async with asyncio.timeout(DEMO_TIMEOUT):
+                await warmup_task
+                # CSV 내보내기 (주제 목록을 모아 두지 않고 생성되는 대로 기록)
+                # 출력 위치는 PASCAL_CSV_OUT으로 지정 (예: /dev/shm/enhanced_topics.csv)
+                csv_path = Path(os.getenv("PASCAL_CSV_OUT", Path(tempfile.gettempdir()) / "enhanced_topics.csv"))
+                topics = generator.generate_comprehensive_topics_iter(test_book, [test_area], num_topics_per_area=2)
+                # 시간 초과로 빠져나와도 생성기를 바로 닫아 진행 중인 영역 작업(OpenAI 호출)을 취소
+                async with aclosing(topics):
+                    count = await generator.export_topics_stream(report(topics), csv_path)
+            print(f"\nGenerated {count} enhanced topics")
+            print(f"CSV exported to: {csv_path}")
+            
+        except TimeoutError:
+            print(f"Error: topic generation did not finish within {DEMO_TIMEOUT}s")
+        except Exception as e:
+            print(f"Error: {e}")
 
 if __name__ == "__main__":
-    asyncio.run(test_topic_generator())
+    logging.basicConfig(level=logging.INFO)
+    # uvloop은 uvicorn[standard]와 함께 설치됨 (Windows 등 없는 환경에서는 기본 이벤트 루프)
+    try:
+        import uvloop
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+    run(test_topic_generator())
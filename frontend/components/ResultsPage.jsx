@@ -30,13 +30,18 @@ const ResultsPage = () => {
   const [isLoading, setIsLoading] = useState(true)
   const [error, setError] = useState(null)
 
-  // 작업 상태 폴링
+  // 작업 상태 구독 (SSE 우선, 미지원 또는 연결 실패 시 폴링)
   useEffect(() => {
     if (!taskId) return
 
+    const apiUrl = import.meta.env.VITE_API_URL ? `https://${import.meta.env.VITE_API_URL}` : '';
+    const isFinished = (data) => data?.status === 'completed' || data?.status === 'failed'
+    let interval = null
+    let eventSource = null
+    let cancelled = false
+
     const checkTaskStatus = async () => {
       try {
-        const apiUrl = import.meta.env.VITE_API_URL ? `https://${import.meta.env.VITE_API_URL}` : '';
         // 먼저 분석 작업인지 확인
         let response = await fetch(`${apiUrl}/api/v1/books/analyze/${taskId}/status`)
         
@@ -45,7 +50,7 @@ const ResultsPage = () => {
           const data = await response.json()
           setTaskData(data)
           setIsLoading(false)
-          return
+          return { type: 'analysis', data }
         }
 
         // 분석 작업이 아니면 문서 생성 작업인지 확인
@@ -56,7 +61,7 @@ const ResultsPage = () => {
           const data = await response.json()
           setTaskData(data)
           setIsLoading(false)
-          return
+          return { type: 'generation', data }
         }
 
         throw new Error('작업을 찾을 수 없습니다.')
@@ -65,23 +70,60 @@ const ResultsPage = () => {
         console.error('Status check error:', err)
         setError(err.message)
         setIsLoading(false)
+        return null
+      }
+    }
+
+    // 주기적으로 상태 확인
+    const startPolling = () => {
+      interval = setInterval(async () => {
+        const status = await checkTaskStatus()
+        if (!status || isFinished(status.data)) {
+          clearInterval(interval)
+        }
+      }, 2000)
+    }
+
+    // 서버가 진행 상황을 보낼 때마다 갱신
+    const startEventStream = (type) => {
+      const path = type === 'analysis'
+        ? `/api/v1/books/analyze/${taskId}/events`
+        : `/api/v1/documents/${taskId}/events`
+      eventSource = new EventSource(`${apiUrl}${path}`)
+
+      eventSource.onmessage = (event) => {
+        const data = JSON.parse(event.data)
+        setTaskData(data)
+        if (isFinished(data)) {
+          eventSource.close()
+        }
+      }
+
+      eventSource.onerror = () => {
+        eventSource.close()
+        if (!cancelled) {
+          startPolling()
+        }
       }
     }
 
-    // 초기 상태 확인
-    checkTaskStatus()
+    // 초기 상태 확인 후 작업이 진행 중이면 구독 시작
+    checkTaskStatus().then((status) => {
+      if (cancelled || !status || isFinished(status.data)) return
 
-    // 작업이 완료되지 않은 경우 주기적으로 상태 확인
-    const interval = setInterval(() => {
-      if (taskData?.status === 'completed' || taskData?.status === 'failed') {
-        clearInterval(interval)
-        return
+      if (typeof window.EventSource === 'function') {
+        startEventStream(status.type)
+      } else {
+        startPolling()
       }
-      checkTaskStatus()
-    }, 2000)
+    })
 
-    return () => clearInterval(interval)
-  }, [taskId, taskData?.status])
+    return () => {
+      cancelled = true
+      clearInterval(interval)
+      eventSource?.close()
+    }
+  }, [taskId])
 
   const handleDownload = async (type) => {
     try {